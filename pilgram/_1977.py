@@ -14,26 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def _1977(im: Image.Image) -> Image.Image:
+def _1977(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies 1977 filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.fill(cb.size, (243, 106, 188, 0.3))
-    cr = css.blending.screen(cb, cs)
-
-    cr = css.contrast(cr, 1.1)
-    cr = css.brightness(cr, 1.1)
-    cr = css.saturate(cr, 1.3)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["_1977"], im, intensity=intensity)
@@ -14,30 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def aden(im: Image.Image) -> Image.Image:
+def aden(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Aden filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-
-    cs = util.fill(cb.size, (66, 10, 14))
-    cs = css.blending.darken(cb, cs)
 
-    alpha_mask = util.linear_gradient_mask(cb.size, start=0.8)
-    cr = Image.composite(cs, cb, alpha_mask)
-
-    cr = css.hue_rotate(cr, -20)
-    cr = css.contrast(cr, 0.9)
-    cr = css.saturate(cr, 0.85)
-    cr = css.brightness(cr, 1.2)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["aden"], im, intensity=intensity)
@@ -0,0 +1,324 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Filters on NumPy arrays.
+
+Each filter takes an (H, W, 3) uint8 array and returns an array, without
+the caller converting to and from `PIL.Image`. Pillow stores RGB pixels
+in 4 bytes, so an RGB array is copied once into the image and once out of
+it. Row-strided arrays (e.g. crops of a larger array) are read in place,
+and other layouts are made contiguous first.
+
+The returned arrays are writable and own their pixels, so they can be
+modified in place or passed on (e.g. to `torch.from_numpy`).
+Other arguments (e.g. `intensity`) are passed to the filter, and
+grayscale filters return an (H, W) array with `mode="L"`.
+
+The filters also take an (N, H, W, 3) batch in one call (see `apply`),
+and write their output to a preallocated uint8 array with `out=`, e.g.
+a slice of a training batch. Batch outputs are written there directly.
+Per-size data such as gradients and LUTs are cached, so they are built
+once for the batch, and color-only filters run on the whole batch at once.
+"""
+
+from collections.abc import Callable, Hashable
+from functools import update_wrapper
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+from pilgram._1977 import _1977 as _exact_1977
+from pilgram.aden import aden as _exact_aden
+from pilgram.brannan import brannan as _exact_brannan
+from pilgram.brooklyn import brooklyn as _exact_brooklyn
+from pilgram.clarendon import clarendon as _exact_clarendon
+from pilgram.earlybird import earlybird as _exact_earlybird
+from pilgram.gingham import gingham as _exact_gingham
+from pilgram.graph.nodes import (
+    LinearGradient,
+    LinearGradientMask,
+    Node,
+    RadialGradient,
+    RadialGradientMask,
+    children,
+)
+from pilgram.graph.specs import SPECS
+from pilgram.hudson import hudson as _exact_hudson
+from pilgram.inkwell import inkwell as _exact_inkwell
+from pilgram.kelvin import kelvin as _exact_kelvin
+from pilgram.lark import lark as _exact_lark
+from pilgram.lofi import lofi as _exact_lofi
+from pilgram.maven import maven as _exact_maven
+from pilgram.mayfair import mayfair as _exact_mayfair
+from pilgram.moon import moon as _exact_moon
+from pilgram.nashville import nashville as _exact_nashville
+from pilgram.perpetua import perpetua as _exact_perpetua
+from pilgram.reyes import reyes as _exact_reyes
+from pilgram.rise import rise as _exact_rise
+from pilgram.slumber import slumber as _exact_slumber
+from pilgram.stinson import stinson as _exact_stinson
+from pilgram.toaster import toaster as _exact_toaster
+from pilgram.valencia import valencia as _exact_valencia
+from pilgram.walden import walden as _exact_walden
+from pilgram.willow import willow as _exact_willow
+from pilgram.xpro2 import xpro2 as _exact_xpro2
+
+ArrayFunction = Callable[..., np.ndarray]
+
+
+def to_image(arr: np.ndarray) -> Image.Image:
+    """Converts an HWC array to an RGB image with a single copy.
+
+    Arguments:
+        arr: An (H, W, 3) uint8 array. The pixels may be strided between
+            rows (e.g. a crop) or in any other layout.
+
+    Returns:
+        The RGB image.
+
+    Raises:
+        ValueError: if `arr` is not an (H, W, 3) uint8 array.
+    """
+
+    if arr.dtype != np.uint8 or arr.ndim != 3 or arr.shape[2] != 3:
+        raise ValueError(f"Unsupported array: {arr.dtype} {arr.shape}")
+
+    height, width = arr.shape[:2]
+    row_stride = arr.strides[0]
+    if arr.strides[1:] != (3, 1) or row_stride < width * 3:
+        arr = np.ascontiguousarray(arr)
+        row_stride = width * 3
+
+    # NOTE: the rows are read from a flat view spanning the pixels,
+    #       so no contiguous copy is made for row-strided arrays
+    span = (height - 1) * row_stride + width * 3 if height else 0
+    data = np.lib.stride_tricks.as_strided(
+        arr, shape=(span,), strides=(1,), writeable=False
+    )
+
+    return Image.frombuffer("RGB", (width, height), data, "raw", "RGB", row_stride, 1)
+
+
+def to_array(im: Image.Image) -> np.ndarray:
+    """Converts an image to a writable array with a single copy.
+
+    Arguments:
+        im: An image.
+
+    Returns:
+        The (H, W, C) array, or (H, W) for a single band image.
+    """
+
+    # NOTE: `np.asarray` copies as much but returns a read-only array
+    return np.array(im)
+
+
+def _check_output(out: np.ndarray, shape: tuple[int, ...]) -> None:
+    """Checks that a destination array matches the output shape"""
+
+    if out.dtype != np.uint8 or out.shape != shape:
+        raise ValueError(f"Unsupported output: {out.dtype} {out.shape}")
+
+
+def _apply_batch(
+    fn: Callable[..., Image.Image],
+    arr: np.ndarray,
+    color_only: bool,
+    kwargs: dict[str, Any],
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Applies a filter to each image of a batch, see `apply`"""
+
+    n, height, width = arr.shape[:3]
+
+    shared: dict[str, Any] = {}
+    varying: dict[str, list[Any]] = {}
+    for key, value in kwargs.items():
+        if isinstance(value, list | np.ndarray):
+            if len(value) != n:
+                raise ValueError(f"Expected {n} values of {key}: {len(value)}")
+            varying[key] = list(value)
+        else:
+            shared[key] = value
+
+    # NOTE: images with the same parameters are filtered together
+    groups: dict[tuple[Hashable, ...], list[int]] = {}
+    for i in range(n):
+        groups.setdefault(tuple(v[i] for v in varying.values()), []).append(i)
+
+    buffer: np.ndarray | None = None
+    for values, indices in groups.items():
+        params = shared | dict(zip(varying, values, strict=True))
+        if color_only:
+            # NOTE: a color-only filter works on the stacked images as one
+            stack = arr if len(indices) == n else arr[indices]
+            results = to_array(fn(to_image(stack.reshape(-1, width, 3)), **params))
+        else:
+            results = np.stack(
+                [to_array(fn(to_image(arr[i]), **params)) for i in indices]
+            )
+        results = results.reshape(len(indices), height, width, -1)
+
+        if buffer is None:
+            shape = (n, *results.shape[1:])
+            if out is not None:
+                # NOTE: single band outputs are written through a view
+                _check_output(out, shape if shape[-1] != 1 else shape[:-1])
+                buffer = out if shape[-1] != 1 else out[..., None]
+            elif len(groups) == 1:
+                buffer = results
+                break
+            else:
+                buffer = np.empty(shape, dtype=np.uint8)
+        buffer[indices] = results
+
+    if out is not None:
+        return out
+
+    assert buffer is not None
+    return buffer if buffer.shape[-1] != 1 else buffer[..., 0]
+
+
+def apply(
+    fn: Callable[..., Image.Image],
+    arr: np.ndarray,
+    color_only: bool = False,
+    *,
+    out: np.ndarray | None = None,
+    **kwargs: Any,
+) -> np.ndarray:
+    """Applies a filter to an array or a batch of arrays.
+
+    A batch is an (N, H, W, 3) array. Each keyword argument can be
+    a single value for the whole batch, or a list (or array) of N values
+    for each image, e.g. `deg=[0, 10, 20]` for `css.hue_rotate`.
+    Images with the same values are filtered together.
+
+    Color-only filters (whose output pixel depends on nothing but the input
+    pixel color) filter the stacked images of a batch as a single image.
+    The other filters filter each image in turn.
+
+    Arguments:
+        fn: A filter function which takes and returns an image.
+        arr: An (H, W, 3) uint8 array or an (N, H, W, 3) batch of them.
+        color_only: An optional boolean. True if `fn` is color-only.
+            Defaults to False.
+        out: An optional uint8 array of the output shape, which the output
+            is written to and returned instead of a new array.
+            Defaults to None.
+        **kwargs: Optional arguments of `fn`.
+
+    Returns:
+        The output array, or an (N, H, W, C) batch
+        (or (N, H, W) for single band outputs), or `out`.
+
+    Raises:
+        AssertionError: if an intensity is not between 0 and 1.
+        ValueError: if `arr` or `out` is not supported or the number of
+            per-image values is not N.
+    """
+
+    if arr.ndim == 4:
+        return _apply_batch(fn, arr, color_only, kwargs, out)
+
+    result = to_array(fn(to_image(arr), **kwargs))
+    if out is None:
+        return result
+
+    _check_output(out, result.shape)
+    np.copyto(out, result)
+    return out
+
+
+def _is_color_only(node: Node) -> bool:
+    """Returns True if a filter graph contains no gradients"""
+
+    gradients = (LinearGradient, LinearGradientMask, RadialGradient, RadialGradientMask)
+    if isinstance(node, gradients):
+        return False
+
+    return all(_is_color_only(child) for child in children(node))
+
+
+def _array(fn: Callable[..., Image.Image]) -> ArrayFunction:
+    """Returns the filter applied to an array or a batch of arrays."""
+
+    color_only = _is_color_only(SPECS[fn.__name__])
+
+    def array_filter(arr: np.ndarray, **kwargs: Any) -> np.ndarray:
+        return apply(fn, arr, color_only, **kwargs)
+
+    return update_wrapper(array_filter, fn)
+
+
+_1977 = _array(_exact_1977)
+aden = _array(_exact_aden)
+brannan = _array(_exact_brannan)
+brooklyn = _array(_exact_brooklyn)
+clarendon = _array(_exact_clarendon)
+earlybird = _array(_exact_earlybird)
+gingham = _array(_exact_gingham)
+hudson = _array(_exact_hudson)
+inkwell = _array(_exact_inkwell)
+kelvin = _array(_exact_kelvin)
+lark = _array(_exact_lark)
+lofi = _array(_exact_lofi)
+maven = _array(_exact_maven)
+mayfair = _array(_exact_mayfair)
+moon = _array(_exact_moon)
+nashville = _array(_exact_nashville)
+perpetua = _array(_exact_perpetua)
+reyes = _array(_exact_reyes)
+rise = _array(_exact_rise)
+slumber = _array(_exact_slumber)
+stinson = _array(_exact_stinson)
+toaster = _array(_exact_toaster)
+valencia = _array(_exact_valencia)
+walden = _array(_exact_walden)
+willow = _array(_exact_willow)
+xpro2 = _array(_exact_xpro2)
+
+__all__ = [
+    "_1977",
+    "aden",
+    "brannan",
+    "brooklyn",
+    "clarendon",
+    "earlybird",
+    "gingham",
+    "hudson",
+    "inkwell",
+    "kelvin",
+    "lark",
+    "lofi",
+    "maven",
+    "mayfair",
+    "moon",
+    "nashville",
+    "perpetua",
+    "reyes",
+    "rise",
+    "slumber",
+    "stinson",
+    "toaster",
+    "valencia",
+    "walden",
+    "willow",
+    "xpro2",
+    "apply",
+    "to_array",
+    "to_image",
+]
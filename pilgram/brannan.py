@@ -14,24 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def brannan(im: Image.Image) -> Image.Image:
+def brannan(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Brannan filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-    cs = util.fill(cb.size, (161, 44, 199, 0.31))
-    cr = css.blending.lighten(cb, cs)
 
-    cr = css.sepia(cr, 0.5)
-    cr = css.contrast(cr, 1.4)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["brannan"], im, intensity=intensity)
@@ -14,31 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def brooklyn(im: Image.Image) -> Image.Image:
+def brooklyn(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Brooklyn filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-
-    cs1 = util.fill(cb.size, (168, 223, 193, 0.4))
-    cm1 = css.blending.overlay(cb, cs1)
 
-    cs2 = util.fill(cb.size, (196, 183, 200))
-    cm2 = css.blending.overlay(cb, cs2)
-
-    gradient_mask = util.radial_gradient_mask(cb.size, length=0.7)
-    cr = Image.composite(cm1, cm2, gradient_mask)
-
-    cr = css.contrast(cr, 0.9)
-    cr = css.brightness(cr, 1.1)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["brooklyn"], im, intensity=intensity)
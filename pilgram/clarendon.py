@@ -14,25 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def clarendon(im: Image.Image) -> Image.Image:
+def clarendon(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Clarendon filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.fill(cb.size, (127, 187, 227, 0.2))
-    cr = css.blending.overlay(cb, cs)
-
-    cr = css.contrast(cr, 1.2)
-    cr = css.saturate(cr, 1.35)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["clarendon"], im, intensity=intensity)
@@ -0,0 +1,193 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Filters compiled into lookup tables.
+
+Color-only filters never look at pixel positions, so each of them can be
+evaluated once on an identity lattice and then applied as a single 3D LUT
+pass. The output is within 5 levels of the exact filter over every
+24-bit color, since the LUT interpolates between its lattice nodes.
+A partial intensity is mixed into the 3D LUT, so it costs no extra pass.
+Palette (P) images are filtered by their palettes instead and returned
+as P images, the same as the exact filter (see `util.apply_palette`).
+YCbCr images (e.g. JPEG images decoded with `draft("YCbCr", size)`)
+are filtered by a YCbCr LUT and returned as YCbCr images, so they can be
+encoded again without converting them from and to RGB.
+
+The other filters are the exact filters themselves, which are executed
+as filter graphs (see `pilgram.graph`). Their separable parts over
+gradient masks are tabulated per mask level and applied in a single table
+lookup per band where it is cheaper.
+"""
+
+from collections.abc import Callable
+from functools import update_wrapper
+
+from PIL import Image
+
+from pilgram import util
+from pilgram._1977 import _1977 as _exact_1977
+from pilgram.aden import aden as _exact_aden
+from pilgram.brannan import brannan as _exact_brannan
+from pilgram.brooklyn import brooklyn as _exact_brooklyn
+from pilgram.clarendon import clarendon as _exact_clarendon
+from pilgram.earlybird import earlybird as _exact_earlybird
+from pilgram.gingham import gingham as _exact_gingham
+from pilgram.hudson import hudson as _exact_hudson
+from pilgram.inkwell import inkwell as _exact_inkwell
+from pilgram.kelvin import kelvin as _exact_kelvin
+from pilgram.lark import lark as _exact_lark
+from pilgram.lofi import lofi as _exact_lofi
+from pilgram.maven import maven as _exact_maven
+from pilgram.mayfair import mayfair as _exact_mayfair
+from pilgram.moon import moon as _exact_moon
+from pilgram.nashville import nashville as _exact_nashville
+from pilgram.perpetua import perpetua as _exact_perpetua
+from pilgram.reyes import reyes as _exact_reyes
+from pilgram.rise import rise as _exact_rise
+from pilgram.slumber import slumber as _exact_slumber
+from pilgram.stinson import stinson as _exact_stinson
+from pilgram.toaster import toaster as _exact_toaster
+from pilgram.types import FilterFunction
+from pilgram.valencia import valencia as _exact_valencia
+from pilgram.walden import walden as _exact_walden
+from pilgram.willow import willow as _exact_willow
+from pilgram.xpro2 import xpro2 as _exact_xpro2
+
+
+def _compiled(fn: FilterFunction) -> FilterFunction:
+    """Returns the filter applied through its cached 3D LUT."""
+
+    def compiled_filter(im: Image.Image, intensity: float = 1) -> Image.Image:
+        if im.mode == "P":
+            return util.apply_palette(im, fn, intensity)
+        elif im.mode == "YCbCr":
+            lut = util.compile_color_lut(fn, mode="YCbCr", intensity=intensity)
+            return util.apply_color_lut(im, lut, "YCbCr")
+
+        lut = util.compile_color_lut(fn, intensity=intensity)
+        return util.apply_color_lut(im, lut)
+
+    return update_wrapper(compiled_filter, fn)
+
+
+def _compiled_grayscale(fn: FilterFunction) -> Callable[..., Image.Image]:
+    """Returns the grayscale filter applied through its cached 3D LUT.
+
+    Unlike `_compiled`, the wrapper also takes the `mode` of the exact
+    filter, so it does not copy the signature and docstring of `fn`.
+    """
+
+    compiled_filter: Callable[..., Image.Image] = _compiled(fn)
+
+    def grayscale_filter(
+        im: Image.Image, intensity: float = 1, *, mode: str = "RGB"
+    ) -> Image.Image:
+        if mode not in ("RGB", "L"):
+            raise ValueError(f"Unsupported mode: {mode!r}")
+        elif mode == "L" and intensity != 1:
+            raise ValueError("Intensity is only supported in RGB mode")
+
+        if mode == "RGB":
+            return compiled_filter(im, intensity)
+
+        # NOTE: the bands of the LUT output are equal, so any of them is
+        #       the grayscale output
+        lut = util.compile_color_lut(fn)
+        return util.apply_color_lut(im, lut).getchannel("R")
+
+    name = fn.__name__
+    grayscale_filter.__module__ = __name__
+    grayscale_filter.__name__ = name
+    grayscale_filter.__qualname__ = name
+    grayscale_filter.__doc__ = f"""Applies {name.capitalize()} filter by its 3D LUT.
+
+    The output is within 5 levels of `pilgram.{name}`.
+
+    Arguments:
+        im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, which is mixed into the 3D LUT in RGB mode.
+            Defaults to 1.
+        mode: An optional string. The output mode (RGB or L).
+            Defaults to RGB.
+
+    Returns:
+        The output image.
+
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+        ValueError: if `mode` is not RGB or L,
+            or `mode` is L and `intensity` is not 1.
+    """
+
+    return grayscale_filter
+
+
+_1977 = _compiled(_exact_1977)
+aden = _exact_aden
+brannan = _compiled(_exact_brannan)
+brooklyn = _exact_brooklyn
+clarendon = _compiled(_exact_clarendon)
+earlybird = _exact_earlybird
+gingham = _compiled(_exact_gingham)
+hudson = _exact_hudson
+inkwell = _compiled_grayscale(_exact_inkwell)
+kelvin = _compiled(_exact_kelvin)
+lark = _compiled(_exact_lark)
+lofi = _exact_lofi
+maven = _compiled(_exact_maven)
+mayfair = _exact_mayfair
+moon = _compiled_grayscale(_exact_moon)
+nashville = _compiled(_exact_nashville)
+perpetua = _exact_perpetua
+reyes = _compiled(_exact_reyes)
+rise = _exact_rise
+slumber = _compiled(_exact_slumber)
+stinson = _compiled(_exact_stinson)
+toaster = _exact_toaster
+valencia = _compiled(_exact_valencia)
+walden = _compiled(_exact_walden)
+willow = _exact_willow
+xpro2 = _exact_xpro2
+
+__all__ = [
+    "_1977",
+    "aden",
+    "brannan",
+    "brooklyn",
+    "clarendon",
+    "earlybird",
+    "gingham",
+    "hudson",
+    "inkwell",
+    "kelvin",
+    "lark",
+    "lofi",
+    "maven",
+    "mayfair",
+    "moon",
+    "nashville",
+    "perpetua",
+    "reyes",
+    "rise",
+    "slumber",
+    "stinson",
+    "toaster",
+    "valencia",
+    "walden",
+    "willow",
+    "xpro2",
+]
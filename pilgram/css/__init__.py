@@ -13,11 +13,24 @@
 # limitations under the License.
 
 from pilgram.css import blending  # noqa
-from pilgram.css.brightness import brightness
-from pilgram.css.contrast import contrast
-from pilgram.css.grayscale import grayscale
-from pilgram.css.hue_rotate import hue_rotate
-from pilgram.css.saturate import saturate
-from pilgram.css.sepia import sepia
+from pilgram.css.brightness import brightness, brightness_lut
+from pilgram.css.contrast import contrast, contrast_lut
+from pilgram.css.grayscale import grayscale, grayscale_matrix
+from pilgram.css.hue_rotate import hue_rotate, hue_rotate_matrix
+from pilgram.css.saturate import saturate, saturate_matrix
+from pilgram.css.sepia import sepia, sepia_matrix
 
-__all__ = ["brightness", "contrast", "grayscale", "hue_rotate", "saturate", "sepia"]
+__all__ = [
+    "brightness",
+    "brightness_lut",
+    "contrast",
+    "contrast_lut",
+    "grayscale",
+    "grayscale_matrix",
+    "hue_rotate",
+    "hue_rotate_matrix",
+    "saturate",
+    "saturate_matrix",
+    "sepia",
+    "sepia_matrix",
+]
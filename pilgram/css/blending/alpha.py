@@ -12,20 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache, reduce
+
 import numpy as np
 from PIL import Image, ImageChops
 
-from pilgram.types import BlendingFunction
-from pilgram.util import add, invert, subtract
-
-
-def add3(im1: Image.Image, im2: Image.Image, im3: Image.Image) -> Image.Image:
-    im1_array = np.asarray(im1, dtype=np.int16)
-    im2_array = np.asarray(im2)
-    im3_array = np.asarray(im3)
-    im_array = im1_array + im2_array + im3_array
-    im_array = im_array.clip(0, 255).astype(np.uint8)
-    return Image.fromarray(im_array)
+from pilgram.types import (
+    BlendingFunction,
+    BlendingSource,
+    ColorBlendingFunction,
+    Output,
+)
+from pilgram.util import fill, fill_color, from_planes, scratch_arena, write_output
 
 
 def split_alpha(im: Image.Image) -> tuple[Image.Image, Image.Image | None]:
@@ -40,13 +38,13 @@ def split_alpha(im: Image.Image) -> tuple[Image.Image, Image.Image | None]:
 
     if im.mode == "RGBA":
         # NOTE: `merge` is slower than `convert` when using Vanilla Pillow
-        a = im.split()[3]
+        a = im.getchannel("A")
         im = im.convert("RGB")
         return im, a
     elif im.mode == "RGB":
         return im, None
     else:
-        raise ValueError("Unsupported mode: " + im.mode)
+        raise ValueError(f"Unsupported mode: {im.mode!r}")
 
 
 def alpha_to_rgb(im: Image.Image) -> Image.Image:
@@ -63,13 +61,205 @@ def alpha_to_rgb(im: Image.Image) -> Image.Image:
         im = im.convert("RGB")
         return im
     else:
-        raise ValueError("Unsupported mode: " + im.mode)
+        raise ValueError(f"Unsupported mode: {im.mode!r}")
 
 
-def alpha_blend(
+def _multiply(
+    a: np.ndarray | int, b: np.ndarray | int, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Returns `a x b / 255` truncated as `ImageChops.multiply`, in fixed point"""
+    t: np.ndarray = np.multiply(a, b, dtype=np.uint16, out=out)
+    with scratch_arena:
+        t += np.right_shift(t, 8, out=scratch_arena.empty(t.shape, np.uint16))
+    t += 1
+    t >>= 8
+    return t
+
+
+@lru_cache(maxsize=256)
+def _multiply_lut(a: int) -> tuple[int, ...]:
+    """Returns a per-band LUT of `a x C / 255` truncated as `ImageChops.multiply`"""
+    return tuple(a * i // 255 for i in range(256)) * 3
+
+
+def _scale(weight: np.ndarray | int, opacity: int) -> np.ndarray | int:
+    """Returns an 8-bit weight scaled by an 8-bit opacity, rounded"""
+
+    if opacity == 255:
+        return weight
+    elif isinstance(weight, int):
+        return (weight * opacity + 127) // 255
+
+    t: np.ndarray = np.multiply(weight, opacity, dtype=np.uint16)
+    t += 128
+    t += t >> 8
+    t >>= 8
+    return t
+
+
+def _alpha(a: Image.Image) -> np.ndarray | int:
+    """Returns an alpha band as an array, or as an integer if it is constant"""
+
+    lo, hi = a.getextrema()
+    assert isinstance(lo, int)
+
+    if lo == hi:
+        return lo
+    else:
+        return np.asarray(a)
+
+
+def _composite(*layers: tuple[np.ndarray | int, Image.Image]) -> Image.Image:
+    """Sums RGB images weighted by 8-bit alpha.
+
+    Each term is truncated as `ImageChops.multiply` and the sum is clipped.
+    Constant weights are applied as LUTs, and the other sums are computed
+    in arrays drawn from `util.scratch_arena`.
+    """
+
+    if all(isinstance(weight, int) for weight, _ in layers):
+        terms = [im.point(_multiply_lut(int(weight))) for weight, im in layers]
+        return reduce(ImageChops.add, terms)
+
+    # NOTE: bands are processed as planes, since broadcasting the weight
+    #       over interleaved RGB pixels is much slower
+    w, h = layers[0][1].size
+    with scratch_arena:
+        out = scratch_arena.zeros((3, h, w), np.uint16)
+        term = scratch_arena.empty((h, w), np.uint16)
+        for weight, im in layers:
+            for out_band, band in zip(out, im.split(), strict=True):
+                out_band += _multiply(weight, np.asarray(band), term)
+
+        np.minimum(out, 255, out=out)
+        planes = scratch_arena.empty((3, h, w), np.uint8)
+        np.copyto(planes, out, casting="unsafe")
+        return from_planes(planes)
+
+
+def solid_color(im: Image.Image) -> tuple[int, ...] | None:
+    """Returns the color of an image filled with a single color.
+
+    Arguments:
+        im: An image (RGB or RGBA).
+
+    Returns:
+        A tuple of the band values, or None if the image has several colors.
+    """
+
+    # NOTE: a few pixels rule out most images without scanning them
+    w, h = im.size
+    pixel = im.getpixel((0, 0))
+    corners = ((w - 1, 0), (0, h - 1), (w - 1, h - 1), (w // 2, h // 2))
+    if any(im.getpixel(xy) != pixel for xy in corners):
+        return None
+
+    extrema = im.getextrema()
+    assert isinstance(extrema[0], tuple)
+
+    if all(lo == hi for lo, hi in extrema):
+        return tuple(int(lo) for lo, _ in extrema)
+    else:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _blending_lut(
+    blending: BlendingFunction,
+    mode: str,
+    color: tuple[int, ...],
+    opacity: float = 1,
+) -> tuple[int, ...]:
+    """Returns a per-band LUT blending a solid color over an RGB backdrop"""
+
+    ramp = bytes(i for i in range(256) for _ in range(3))
+    cb = Image.frombytes("RGB", (256, 1), ramp)
+    cs = Image.new(mode, (256, 1), color)
+    cr = _apply_opacity(cb, alpha_blend(cb, cs, blending), opacity)
+
+    return tuple(b"".join(band.tobytes() for band in cr.split()))
+
+
+@lru_cache(maxsize=16)
+def _blending_luts(
+    blending: BlendingFunction, mode: str, colors: bytes, opacity: float = 1
+) -> list[tuple[int, ...]]:
+    """Returns per-band LUTs blending each of solid colors over an RGB backdrop"""
+
+    n = len(colors) // len(mode)
+    ramp = bytes(i for i in range(256) for _ in range(3))
+    cb = Image.frombytes("RGB", (256, n), ramp * n)
+    cs = Image.frombytes(mode, (1, n), colors)
+    cs = cs.resize((256, n), Image.Resampling.NEAREST)
+    cr = _apply_opacity(cb, alpha_blend(cb, cs, blending), opacity)
+
+    # NOTE: a row of each band is the LUT of each color
+    bands = [np.asarray(band) for band in cr.split()]
+    return [
+        tuple(np.concatenate([band[i] for band in bands]).tolist()) for i in range(n)
+    ]
+
+
+def _blend_strip(
     im1: Image.Image,
     im2: Image.Image,
     blending: BlendingFunction,
+    opacity: float = 1,
+    out: Image.Image | None = None,
+) -> Image.Image:
+    """Blends a row or column of colors repeated over an RGB backdrop.
+
+    The backdrop is split into bands of rows (or columns) with the same
+    source color, and each band is blended by a LUT into `out`
+    (which can be the backdrop itself) or a new image.
+    """
+
+    # NOTE: a 1x1 source over a 1-pixel wide (or high) backdrop is
+    #       a row (or column), so the orientation is taken from the match
+    vertical = im2.size == (1, im1.height)
+    colors = np.asarray(im2).reshape(-1, len(im2.mode))
+
+    # NOTE: start and end of each run of the same colors
+    changes = np.any(colors[1:] != colors[:-1], axis=1)
+    starts = [0, *(np.flatnonzero(changes) + 1).tolist()]
+    ends = [*starts[1:], len(colors)]
+
+    luts = _blending_luts(blending, im2.mode, colors[starts].tobytes(), opacity)
+
+    if out is None:
+        out = Image.new("RGB", im1.size)
+    for start, end, lut in zip(starts, ends, luts, strict=True):
+        if vertical:
+            box = (0, start, im1.width, end)
+        else:
+            box = (start, 0, end, im1.height)
+        out.paste(im1.crop(box).point(lut), box)
+
+    return out
+
+
+def _apply_opacity(
+    backdrop: Image.Image, im: Image.Image, opacity: float
+) -> Image.Image:
+    """Blends an output image with its RGB backdrop by the opacity"""
+
+    if opacity == 1:
+        return im
+
+    return Image.blend(backdrop, im, opacity)
+
+
+def alpha_blend(
+    im1: Image.Image,
+    im2: BlendingSource,
+    blending: BlendingFunction,
+    separable: bool = False,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+    color_blending: ColorBlendingFunction | None = None,
 ) -> Image.Image:
     """Simple alpha blending
 
@@ -88,40 +278,169 @@ def alpha_blend(
     See the W3C document:
     https://www.w3.org/TR/compositing-1/#blending
 
+    If `blending` is separable, that is, each output band depends only on
+    the same band of the inputs, a solid color source over an RGB backdrop
+    is applied as a single per-band LUT.
+
+    If `color_blending` is given, a solid color source over an RGB backdrop
+    is passed to it as is (e.g. to a per-color table of a non-separable
+    blending), without being filled to the size of the backdrop.
+
+    A source of a single column (or row) is repeated across the backdrop,
+    e.g. a vertical (or horizontal) gradient. If `blending` is separable
+    and the backdrop is RGB, each run of rows (or columns) with the same
+    source color is applied as a per-band LUT, without the source ever
+    being resized to the backdrop.
+
+    The compositing is done in 8-bit fixed point, truncating each term
+    as `ImageChops.multiply`. Constant alpha is applied with LUTs.
+
+    The output is then blended with the backdrop by `opacity` and
+    composited over the backdrop through `mask`, as `Image.composite`.
+    In the LUT paths above, the opacity is folded into the same LUTs,
+    and with an alpha channel it scales the 8-bit weights of the
+    composited terms, so it costs no extra pass over the image.
+    Otherwise, it is applied as `Image.blend`.
+
+    The output can be written to `out` or over the backdrop with `inplace`
+    (see `util.write_output`). Outputs of a row or column source and
+    masked outputs are written there directly, without a new image.
+
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+            The source image can also be a single column or row
+            of the height or width of the backdrop.
         blending: The blending method.
+        separable: An optional boolean. True if `blending` is separable.
+            Defaults to False.
+        opacity: An optional float between 0 and 1. The opacity of
+            the blended output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L), the size of the backdrop.
+            The output is kept where the mask is white and the backdrop
+            where it is black. Defaults to None.
+        out: An optional destination image or array of the output.
+            Defaults to None.
+        inplace: An optional boolean. True to overwrite the backdrop
+            with the output. Defaults to False.
+        color_blending: An optional blending method of an RGB backdrop
+            and an RGB color, the same as `blending` with the color filled.
+            Defaults to None.
 
     Returns:
         The output image.
+
+    Raises:
+        AssertionError: if `opacity` is not between 0 and 1,
+            `mask` is not an L image of the backdrop size,
+            or both `out` and `inplace` are given
+        ValueError: if `out` does not match the output.
     """
 
+    assert 0 <= opacity <= 1
+    assert mask is None or (mask.mode == "L" and mask.size == im1.size)
+    assert out is None or not inplace
+
+    # NOTE: an RGB destination image of the backdrop size is written directly
+    dest = im1 if inplace else out
+    direct: Image.Image | None = None
+    if isinstance(dest, Image.Image) and dest.mode == "RGB" and dest.size == im1.size:
+        direct = dest
+
+    blendings = (blending, color_blending)
+    if mask is None:
+        im = _alpha_blend(im1, im2, blendings, separable, opacity, direct)
+    else:
+        # NOTE: the backdrop is read again through the mask, so the blended
+        #       output is not written over it
+        im = _alpha_blend(im1, im2, blendings, separable, opacity)
+        backdrop = split_alpha(im1)[0]
+        if direct is None:
+            im = Image.composite(im, backdrop, mask)
+        else:
+            if direct is not backdrop:
+                direct.paste(backdrop)
+            direct.paste(im, None, mask)
+            im = direct
+
+    return write_output(im1, im, out, inplace)
+
+
+def _alpha_blend(
+    im1: Image.Image,
+    im2: BlendingSource,
+    blendings: tuple[BlendingFunction, ColorBlendingFunction | None],
+    separable: bool,
+    opacity: float,
+    out: Image.Image | None = None,
+) -> Image.Image:
+    """Blends and applies opacity, see `alpha_blend`"""
+
+    blending, color_blending = blendings
+
+    if isinstance(im2, tuple):
+        cs = fill_color(im2)
+        if separable and im1.mode == "RGB":
+            mode = "RGBA" if len(cs) == 4 else "RGB"
+            return im1.point(_blending_lut(blending, mode, cs, opacity))
+        elif color_blending is not None and im1.mode == "RGB":
+            im_blended = color_blending(im1, (cs[0], cs[1], cs[2]))
+            if len(cs) == 3:
+                return _apply_opacity(im1, im_blended, opacity)
+
+            # NOTE: the same as the constant alpha of a filled source below
+            w = _scale(cs[3], round(opacity * 255))
+            return _composite((w, im_blended), (255 - w, im1))
+
+        im2 = fill(im1.size, im2)
+    elif im2.size in ((1, im1.height), (im1.width, 1)) and im2.size != im1.size:
+        if separable and im1.mode == "RGB":
+            return _blend_strip(im1, im2, blending, opacity, out)
+
+        im2 = im2.resize(im1.size, Image.Resampling.NEAREST)
+    elif (
+        separable
+        and im1.mode == "RGB"
+        and im2.mode in ("RGB", "RGBA")
+        and im2.size == im1.size
+    ):
+        color = solid_color(im2)
+        if color is not None:
+            return im1.point(_blending_lut(blending, im2.mode, color, opacity))
+
     im1, a1 = split_alpha(im1)
     im2, a2 = split_alpha(im2)
     im_blended = blending(im1, im2)
 
+    if a1 is None and a2 is None:
+        # NOTE: there are no alpha weights to fold the opacity into,
+        #       so it is applied as a single `Image.blend` pass
+        return _apply_opacity(im1, im_blended, opacity)
+
+    # NOTE: the opacity scales the weights of the composited terms and
+    #       the rest goes to the backdrop, instead of costing another pass
+    op = round(opacity * 255)
+
     if a1 is not None and a2 is not None:
-        im_blended_alpha = ImageChops.multiply(a1, a2)
-        im1_alpha = subtract(a1, im_blended_alpha)
-        im2_alpha = subtract(a2, im_blended_alpha)
-        c1 = ImageChops.multiply(alpha_to_rgb(im2_alpha), im2)
-        c2 = ImageChops.multiply(alpha_to_rgb(im_blended_alpha), im_blended)
-        c3 = ImageChops.multiply(alpha_to_rgb(im1_alpha), im1)
-        im_blended = add3(c1, c2, c3)
-    elif a1 is not None:
-        a1_rgb = alpha_to_rgb(a1)
-        a1_invert_rgb = alpha_to_rgb(invert(a1))
-        im_blended = add(
-            ImageChops.multiply(a1_rgb, im_blended),
-            ImageChops.multiply(a1_invert_rgb, im2),
-        )
-    elif a2 is not None:
-        a2_rgb = alpha_to_rgb(a2)
-        a2_invert_rgb = alpha_to_rgb(invert(a2))
-        im_blended = add(
-            ImageChops.multiply(a2_rgb, im_blended),
-            ImageChops.multiply(a2_invert_rgb, im1),
+        alpha1, alpha2 = _alpha(a1), _alpha(a2)
+        alpha_blended: np.ndarray | int
+        if isinstance(alpha1, int) and isinstance(alpha2, int):
+            alpha_blended = alpha1 * alpha2 // 255
+        else:
+            alpha_blended = _multiply(alpha1, alpha2)
+        w = _scale(alpha_blended, op)
+        return _composite(
+            (_scale(alpha2, op) - w, im2),
+            (w, im_blended),
+            (_scale(alpha1, op) - w + (255 - op), im1),
         )
-
-    return im_blended
+    elif a1 is not None:
+        w = _scale(_alpha(a1), op)
+        layers = [(w, im_blended), (op - w, im2)]
+        if op != 255:
+            layers.append((255 - op, im1))
+        return _composite(*layers)
+    else:
+        assert a2 is not None
+        w = _scale(_alpha(a2), op)
+        return _composite((w, im_blended), (255 - w, im1))
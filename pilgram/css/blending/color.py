@@ -12,25 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from PIL import Image, ImageMath
-from PIL.ImageMath import _Operand
-from PIL.ImageMath import imagemath_convert as _convert
-from PIL.ImageMath import imagemath_float as _float
+from functools import lru_cache
 
-from pilgram.css.blending.alpha import alpha_blend
-from pilgram.css.blending.nonseparable import lum_im, set_lum_im
-from pilgram.types import RGBOperands
+import numpy as np
+from PIL import Image
 
+from pilgram.css.blending.alpha import alpha_blend, solid_color
+from pilgram.css.blending.nonseparable import from_image, lum_im, set_lum, to_image
+from pilgram.types import BlendingSource, Output, RGBColor
+from pilgram.util import scratch_arena
 
-def _color_image_math(
-    cs: RGBOperands, lum_cb: _Operand, lum_cs: _Operand
-) -> RGBOperands:
-    """Returns ImageMath operands for color blend mode"""
-    cs = (_float(cs[0]), _float(cs[1]), _float(cs[2]))
-    lum_cb = _float(lum_cb)
-    lum_cs = _float(lum_cs)
 
-    return set_lum_im(cs, lum_cb, lum_cs)
+@lru_cache(maxsize=256)
+def _color_lut(color: tuple[int, ...]) -> tuple[int, ...]:
+    """Returns the color blend mode of a solid source color
+    for every luminosity of the backdrop.
+
+    Arguments:
+        color: The source color.
+
+    Returns:
+        A per-band LUT for an RGB image of Lum(Cb).
+    """
+
+    lum_cb = np.arange(256, dtype=np.float32).reshape(1, 256)
+    lum_cs = np.asarray(lum_im(Image.new("RGB", (1, 1), color)), dtype=np.float32)
+    cs = np.empty((3, 1, 256), dtype=np.float32)
+    cs[...] = np.array(color, dtype=np.float32).reshape(3, 1, 1)
+
+    cr = to_image(set_lum(cs, lum_cb, lum_cs))
+    return tuple(b"".join(band.tobytes() for band in cr.split()))
+
+
+def _color_solid(im1: Image.Image, color: RGBColor) -> Image.Image:
+    """The color blend mode of a solid source color.
+
+    Arguments:
+        im1: A backdrop image (RGB).
+        color: The source color.
+
+    Returns:
+        The output image.
+    """
+
+    # NOTE: the output only depends on Lum(Cb)
+    return lum_im(im1).convert("RGB").point(_color_lut(color))
 
 
 def _color(im1: Image.Image, im2: Image.Image) -> Image.Image:
@@ -44,26 +70,27 @@ def _color(im1: Image.Image, im2: Image.Image) -> Image.Image:
         The output image.
     """
 
-    r, g, b = im2.split()  # Cs
-    lum_cb = lum_im(im1)  # Lum(Cb)
-    lum_cs = lum_im(im2)  # Lum(C) in SetLum
-
-    bands = ImageMath.lambda_eval(
-        lambda args: _color_image_math(
-            (args["r"], args["g"], args["b"]), args["lum_cb"], args["lum_cs"]
-        ),
-        r=r,
-        g=g,
-        b=b,
-        lum_cb=lum_cb,
-        lum_cs=lum_cs,
-    )
-    bands = [_convert(band, "L").im for band in bands]
+    color = solid_color(im2)
+    if color is not None:
+        return _color_solid(im1, (color[0], color[1], color[2]))
 
-    return Image.merge("RGB", bands)
+    with scratch_arena:
+        cs = from_image(im2)  # Cs
+        lum_cb = np.asarray(lum_im(im1), dtype=np.float32)  # Lum(Cb)
+        lum_cs = np.asarray(lum_im(im2), dtype=np.float32)  # Lum(C) in SetLum
 
+        return to_image(set_lum(cs, lum_cb, lum_cs))
 
-def color(im1: Image.Image, im2: Image.Image) -> Image.Image:
+
+def color(
+    im1: Image.Image,
+    im2: BlendingSource,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
     """Creates a color with the hue and saturation of the source color
     and the luminosity of the backdrop color.
 
@@ -76,10 +103,27 @@ def color(im1: Image.Image, im2: Image.Image) -> Image.Image:
 
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+        opacity: An optional float between 0 and 1. The opacity of
+            the output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L). The output is applied
+            where the mask is white. Defaults to None.
+        out: An optional destination image or array of the output
+            (see `util.write_output`). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im1` with
+            the output. Defaults to False.
 
     Returns:
         The output image.
     """
 
-    return alpha_blend(im1, im2, _color)
+    return alpha_blend(
+        im1,
+        im2,
+        _color,
+        opacity=opacity,
+        mask=mask,
+        out=out,
+        inplace=inplace,
+        color_blending=_color_solid,
+    )
@@ -17,6 +17,8 @@ from PIL.ImageMath import _Operand
 from PIL.ImageMath import imagemath_convert as _convert
 
 from pilgram.css.blending.alpha import alpha_blend
+from pilgram.css.blending.separable import lookup_blending
+from pilgram.types import BlendingSource, Output
 
 
 def _color_burn_image_math(cb: _Operand, cs: _Operand) -> _Operand:
@@ -49,7 +51,18 @@ def _color_burn(im1: Image.Image, im2: Image.Image) -> Image.Image:
     )
 
 
-def color_burn(im1: Image.Image, im2: Image.Image) -> Image.Image:
+_color_burn_lookup = lookup_blending(_color_burn)
+
+
+def color_burn(
+    im1: Image.Image,
+    im2: BlendingSource,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
     """Darkens the backdrop color to reflect the source color.
 
     The color burn formula is defined as:
@@ -66,10 +79,27 @@ def color_burn(im1: Image.Image, im2: Image.Image) -> Image.Image:
 
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+        opacity: An optional float between 0 and 1. The opacity of
+            the output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L). The output is applied
+            where the mask is white. Defaults to None.
+        out: An optional destination image or array of the output
+            (see `util.write_output`). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im1` with
+            the output. Defaults to False.
 
     Returns:
         The output image.
     """
 
-    return alpha_blend(im1, im2, _color_burn)
+    return alpha_blend(
+        im1,
+        im2,
+        _color_burn_lookup,
+        separable=True,
+        opacity=opacity,
+        mask=mask,
+        out=out,
+        inplace=inplace,
+    )
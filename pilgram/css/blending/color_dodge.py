@@ -18,6 +18,8 @@ from PIL.ImageMath import imagemath_convert as _convert
 from PIL.ImageMath import imagemath_float as _float
 
 from pilgram.css.blending.alpha import alpha_blend
+from pilgram.css.blending.separable import lookup_blending
+from pilgram.types import BlendingSource, Output
 from pilgram.util import invert
 
 
@@ -54,7 +56,18 @@ def _color_dodge(im1: Image.Image, im2: Image.Image) -> Image.Image:
     )
 
 
-def color_dodge(im1: Image.Image, im2: Image.Image) -> Image.Image:
+_color_dodge_lookup = lookup_blending(_color_dodge)
+
+
+def color_dodge(
+    im1: Image.Image,
+    im2: BlendingSource,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
     """Brightens the backdrop color to reflect the source color.
 
     The color dodge formula is defined as:
@@ -71,10 +84,27 @@ def color_dodge(im1: Image.Image, im2: Image.Image) -> Image.Image:
 
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+        opacity: An optional float between 0 and 1. The opacity of
+            the output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L). The output is applied
+            where the mask is white. Defaults to None.
+        out: An optional destination image or array of the output
+            (see `util.write_output`). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im1` with
+            the output. Defaults to False.
 
     Returns:
         The output image.
     """
 
-    return alpha_blend(im1, im2, _color_dodge)
+    return alpha_blend(
+        im1,
+        im2,
+        _color_dodge_lookup,
+        separable=True,
+        opacity=opacity,
+        mask=mask,
+        out=out,
+        inplace=inplace,
+    )
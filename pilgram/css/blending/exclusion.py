@@ -16,6 +16,8 @@ import numpy as np
 from PIL import Image, ImageChops
 
 from pilgram.css.blending.alpha import alpha_blend
+from pilgram.css.blending.separable import lookup_blending
+from pilgram.types import BlendingSource, Output
 
 
 def _exclusion(im1: Image.Image, im2: Image.Image) -> Image.Image:
@@ -35,7 +37,18 @@ def _exclusion(im1: Image.Image, im2: Image.Image) -> Image.Image:
     return Image.fromarray(screen - multiply)
 
 
-def exclusion(im1: Image.Image, im2: Image.Image) -> Image.Image:
+_exclusion_lookup = lookup_blending(_exclusion)
+
+
+def exclusion(
+    im1: Image.Image,
+    im2: BlendingSource,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
     """Produces an effect like Difference but lower in contrast.
 
     The exclusion formula is defined as:
@@ -47,10 +60,27 @@ def exclusion(im1: Image.Image, im2: Image.Image) -> Image.Image:
 
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+        opacity: An optional float between 0 and 1. The opacity of
+            the output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L). The output is applied
+            where the mask is white. Defaults to None.
+        out: An optional destination image or array of the output
+            (see `util.write_output`). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im1` with
+            the output. Defaults to False.
 
     Returns:
         The output image.
     """
 
-    return alpha_blend(im1, im2, _exclusion)
+    return alpha_blend(
+        im1,
+        im2,
+        _exclusion_lookup,
+        separable=True,
+        opacity=opacity,
+        mask=mask,
+        out=out,
+        inplace=inplace,
+    )
@@ -17,7 +17,8 @@ from PIL import Image, ImageChops
 
 from pilgram import util
 from pilgram.css.blending.alpha import alpha_blend
-from pilgram.types import LUT256
+from pilgram.css.blending.separable import lookup_blending
+from pilgram.types import LUT256, BlendingSource, Output
 
 LUT_2x: LUT256 = [int(util.clip(2 * i)) for i in range(256)]
 LUT_2x_1: LUT256 = [int(util.clip(2 * i - 255)) for i in range(256)]
@@ -44,7 +45,18 @@ def _hard_light(im1: Image.Image, im2: Image.Image) -> Image.Image:
     return Image.fromarray(cm)
 
 
-def hard_light(im1: Image.Image, im2: Image.Image) -> Image.Image:
+_hard_light_lookup = lookup_blending(_hard_light)
+
+
+def hard_light(
+    im1: Image.Image,
+    im2: BlendingSource,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
     """Multiplies or screens the colors, depending on the source color value
 
     The hard light formula is defined as:
@@ -59,10 +71,27 @@ def hard_light(im1: Image.Image, im2: Image.Image) -> Image.Image:
 
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+        opacity: An optional float between 0 and 1. The opacity of
+            the output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L). The output is applied
+            where the mask is white. Defaults to None.
+        out: An optional destination image or array of the output
+            (see `util.write_output`). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im1` with
+            the output. Defaults to False.
 
     Returns:
         The output image.
     """
 
-    return alpha_blend(im1, im2, _hard_light)
+    return alpha_blend(
+        im1,
+        im2,
+        _hard_light_lookup,
+        separable=True,
+        opacity=opacity,
+        mask=mask,
+        out=out,
+        inplace=inplace,
+    )
@@ -12,23 +12,66 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from PIL import Image, ImageMath
-from PIL.ImageMath import _Operand
-from PIL.ImageMath import imagemath_convert as _convert
-from PIL.ImageMath import imagemath_float as _float
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+from pilgram.css.blending.alpha import alpha_blend, solid_color
+from pilgram.css.blending.nonseparable import (
+    from_image,
+    lum_im,
+    sat,
+    sat_im,
+    set_lum,
+    set_sat,
+    to_image,
+)
+from pilgram.types import BlendingSource, Output, RGBColor
+from pilgram.util import scratch_arena
+
+
+@lru_cache(maxsize=64)
+def _hue_table(color: tuple[int, ...]) -> np.ndarray:
+    """Returns the hue blend mode of a solid source color
+    for every saturation and luminosity of the backdrop.
 
-from pilgram.css.blending.alpha import alpha_blend
-from pilgram.css.blending.nonseparable import lum_im, sat, set_lum, set_sat
-from pilgram.types import RGBOperands
+    Arguments:
+        color: The source color.
+
+    Returns:
+        A read-only uint8 array of shape (65536, 3),
+        indexed by `Sat(Cb) << 8 | Lum(Cb)`.
+    """
+
+    values = np.arange(256, dtype=np.float32)
+    sat_cb = np.repeat(values, 256).reshape(256, 256)
+    lum_cb = np.tile(values, 256).reshape(256, 256)
+    cs = np.empty((3, 256, 256), dtype=np.float32)
+    cs[...] = np.array(color, dtype=np.float32).reshape(3, 1, 1)
 
+    table = np.asarray(to_image(set_lum(set_sat(cs, sat_cb), lum_cb)))
+    table = table.reshape(65536, 3)
+    table.flags.writeable = False
 
-def _hue_image_math(cb: RGBOperands, cs: RGBOperands, lum_cb: _Operand) -> RGBOperands:
-    """Returns ImageMath operands for hue blend mode"""
-    cb = (_float(cb[0]), _float(cb[1]), _float(cb[2]))
-    cs = (_float(cs[0]), _float(cs[1]), _float(cs[2]))
-    lum_cb = _float(lum_cb)
+    return table
 
-    return set_lum(set_sat(cs, sat(cb)), lum_cb)
+
+def _hue_solid(im1: Image.Image, color: RGBColor) -> Image.Image:
+    """The hue blend mode of a solid source color.
+
+    Arguments:
+        im1: A backdrop image (RGB).
+        color: The source color.
+
+    Returns:
+        The output image.
+    """
+
+    # NOTE: the output only depends on Sat(Cb) and Lum(Cb)
+    index = np.left_shift(np.asarray(sat_im(im1)), 8, dtype=np.uint16)
+    index |= np.asarray(lum_im(im1))
+    return Image.fromarray(np.take(_hue_table(color), index, axis=0))
 
 
 def _hue(im1: Image.Image, im2: Image.Image) -> Image.Image:
@@ -42,30 +85,27 @@ def _hue(im1: Image.Image, im2: Image.Image) -> Image.Image:
         The output image.
     """
 
-    r1, g1, b1 = im1.split()  # Cb
-    r2, g2, b2 = im2.split()  # Cs
-    lum_cb = lum_im(im1)  # Lum(Cb)
-
-    bands = ImageMath.lambda_eval(
-        lambda args: _hue_image_math(
-            (args["r1"], args["g1"], args["b1"]),
-            (args["r2"], args["g2"], args["b2"]),
-            args["lum_cb"],
-        ),
-        r1=r1,
-        g1=g1,
-        b1=b1,
-        r2=r2,
-        g2=g2,
-        b2=b2,
-        lum_cb=lum_cb,
-    )
-    bands = [_convert(band, "L").im for band in bands]
+    color = solid_color(im2)
+    if color is not None:
+        return _hue_solid(im1, (color[0], color[1], color[2]))
 
-    return Image.merge("RGB", bands)
+    with scratch_arena:
+        cb = from_image(im1)  # Cb
+        cs = from_image(im2)  # Cs
+        lum_cb = np.asarray(lum_im(im1), dtype=np.float32)  # Lum(Cb)
 
+        return to_image(set_lum(set_sat(cs, sat(cb)), lum_cb))
 
-def hue(im1: Image.Image, im2: Image.Image) -> Image.Image:
+
+def hue(
+    im1: Image.Image,
+    im2: BlendingSource,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
     """Creates a color with the hue of the source color
     and the saturation and luminosity of the backdrop color.
 
@@ -78,10 +118,27 @@ def hue(im1: Image.Image, im2: Image.Image) -> Image.Image:
 
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+        opacity: An optional float between 0 and 1. The opacity of
+            the output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L). The output is applied
+            where the mask is white. Defaults to None.
+        out: An optional destination image or array of the output
+            (see `util.write_output`). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im1` with
+            the output. Defaults to False.
 
     Returns:
         The output image.
     """
 
-    return alpha_blend(im1, im2, _hue)
+    return alpha_blend(
+        im1,
+        im2,
+        _hue,
+        opacity=opacity,
+        mask=mask,
+        out=out,
+        inplace=inplace,
+        color_blending=_hue_solid,
+    )
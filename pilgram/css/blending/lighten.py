@@ -15,6 +15,7 @@
 from PIL import Image, ImageChops
 
 from pilgram.css.blending.alpha import alpha_blend
+from pilgram.types import BlendingSource, Output
 
 
 def _lighten(im1: Image.Image, im2: Image.Image) -> Image.Image:
@@ -31,7 +32,15 @@ def _lighten(im1: Image.Image, im2: Image.Image) -> Image.Image:
     return ImageChops.lighter(im1, im2)
 
 
-def lighten(im1: Image.Image, im2: Image.Image) -> Image.Image:
+def lighten(
+    im1: Image.Image,
+    im2: BlendingSource,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
     """Selects the lighter of the backdrop and source colors.
 
     The lighten formula is defined as:
@@ -43,10 +52,27 @@ def lighten(im1: Image.Image, im2: Image.Image) -> Image.Image:
 
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+        opacity: An optional float between 0 and 1. The opacity of
+            the output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L). The output is applied
+            where the mask is white. Defaults to None.
+        out: An optional destination image or array of the output
+            (see `util.write_output`). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im1` with
+            the output. Defaults to False.
 
     Returns:
         The output image.
     """
 
-    return alpha_blend(im1, im2, _lighten)
+    return alpha_blend(
+        im1,
+        im2,
+        _lighten,
+        separable=True,
+        opacity=opacity,
+        mask=mask,
+        out=out,
+        inplace=inplace,
+    )
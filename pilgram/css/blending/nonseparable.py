@@ -12,29 +12,80 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from PIL import Image
-from PIL.ImageMath import _Operand
-from PIL.ImageMath import imagemath_float as _float
-from PIL.ImageMath import imagemath_max as _max
-from PIL.ImageMath import imagemath_min as _min
 
-from pilgram.types import RGBOperands
+import numpy as np
+from PIL import Image, ImageChops
 
+from pilgram.util import from_planes, scratch_arena, to_planes
 
-def _min3(c: tuple[_Operand, _Operand, _Operand]) -> _Operand:
-    """Returns minimum value of 3 elements as ImageMath operands."""
+# NOTE: colors are float32 arrays of shape (3, ...), one plane per band,
+# so that per-pixel min/max are elementwise operations between planes.
+
+
+def _divide(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Divides arrays in place, giving 0 where the divisor is 0 as `ImageMath`"""
+    zero = b == 0
+    a /= b + zero
+    a *= ~zero
+    return a
+
+
+def _min3(c: np.ndarray) -> np.ndarray:
+    """Returns minimum value of 3 bands."""
+    r, g, b = c
+    cmin: np.ndarray = np.minimum(np.minimum(r, g), b)
+    return cmin
+
+
+def _max3(c: np.ndarray) -> np.ndarray:
+    """Returns maximum value of 3 bands."""
     r, g, b = c
-    return _min(_min(r, g), b)
+    cmax: np.ndarray = np.maximum(np.maximum(r, g), b)
+    return cmax
 
 
-def _max3(c: tuple[_Operand, _Operand, _Operand]) -> _Operand:
-    """Returns maximum value of 3 elements as ImageMath operands."""
+def _mid3(c: np.ndarray) -> np.ndarray:
+    """Returns median value of 3 bands with a sorting network."""
     r, g, b = c
-    return _max(_max(r, g), b)
+    cmid: np.ndarray = np.maximum(np.minimum(r, g), np.minimum(np.maximum(r, g), b))
+    return cmid
+
+
+def from_image(im: Image.Image) -> np.ndarray:
+    """Converts an RGB image to colors.
+
+    Arguments:
+        im: An RGB image.
+
+    Returns:
+        A float32 array of shape (3, height, width), drawn from
+        `util.scratch_arena`.
+    """
+
+    return to_planes(im, np.float32)
+
+
+def to_image(c: np.ndarray) -> Image.Image:
+    """Converts colors to an RGB image.
+
+    Values are clipped and truncated as `Image.convert` does from float.
+
+    Arguments:
+        c: A float32 array of shape (3, height, width).
+
+    Returns:
+        The RGB image.
+    """
+
+    np.clip(c, 0, 255, out=c)
+    with scratch_arena:
+        cm = scratch_arena.empty(c.shape, np.uint8)
+        np.copyto(cm, c, casting="unsafe")
+        return from_planes(cm)
 
 
-def _clip_color(c: RGBOperands) -> RGBOperands:
-    """Returns clipped color as ImageMath operands.
+def clip_color(c: np.ndarray) -> np.ndarray:
+    """Clips the color in place.
 
     The formula is defined as:
 
@@ -53,39 +104,49 @@ def _clip_color(c: RGBOperands) -> RGBOperands:
     See: https://www.w3.org/TR/compositing-1/#blendingnonseparable
 
     Arguments:
-        c: A tuple of 3 ImageMath operands. The color.
+        c: A C-contiguous float32 array of colors.
 
     Returns:
-        A tuple of 3 ImageMath operands. The clipped color.
+        The clipped color, `c` itself.
+
+    Raises:
+        AssertionError: if `c` is not C-contiguous.
     """
 
-    r, g, b = c
+    assert c.flags.c_contiguous
 
-    L = lum(c)
-    n = _min3(c)
-    x = _max3(c)
+    L = lum(c).ravel()
+    n = _min3(c).ravel()
+    x = _max3(c).ravel()
 
-    def fn(c: _Operand) -> _Operand:
-        # C = L + ((C - L) * L) / (L - n)
-        #   = (L * (L - n)) / (L - n) + ((C - L) * L) / (L - n)
-        #   = ((L * (L - n)) + ((C - L) * L)) / (L - n)
-        #   = (L^2 - nL + CL - L^2) / (L - n)
-        #   = (CL - nL) / (L - n)
-        #   = (L * (C - n)) / (L - n)
-        return (n < 0) * ((L * (c - n)) / (L - n)) + (n >= 0) * c
+    # NOTE: only the pixels out of range are computed
+    bands = c.reshape(3, -1)
 
-    def fx(c: _Operand) -> _Operand:
-        return (x > 255) * (L + ((c - L) * (255 - L)) / (x - L)) + (x <= 255) * c
+    # C = L + ((C - L) * L) / (L - n)
+    #   = (L * (C - n)) / (L - n)
+    under = np.flatnonzero(n < 0)
+    if under.size > 0:
+        L_under, n_under = L[under], n[under]
+        cn = bands[:, under]
+        cn -= n_under
+        cn *= L_under
+        bands[:, under] = _divide(cn, L_under - n_under)
 
-    r = fx(fn(r))
-    g = fx(fn(g))
-    b = fx(fn(b))
+    over = np.flatnonzero(x > 255)
+    if over.size > 0:
+        L_over, x_over = L[over], x[over]
+        cx = bands[:, over]
+        cx -= L_over
+        cx *= 255 - L_over
+        cx = _divide(cx, x_over - L_over)
+        cx += L_over
+        bands[:, over] = cx
 
-    return (r, g, b)
+    return c
 
 
-def lum(c: RGBOperands) -> _Operand:
-    """Returns luminosity as ImageMath operands.
+def lum(c: np.ndarray) -> np.ndarray:
+    """Returns luminosity.
 
     The formula is defined as:
 
@@ -94,13 +155,17 @@ def lum(c: RGBOperands) -> _Operand:
     See: https://www.w3.org/TR/compositing-1/#blendingnonseparable
 
     Arguments:
-        c: A tuple of 3 ImageMath operands. The color.
+        c: A float32 array of colors.
 
     Returns:
-        An ImageMath operand. The luminosity.
+        A float32 array. The luminosity.
     """
+
     r, g, b = c
-    return _float(r) * 0.3 + _float(g) * 0.59 + _float(b) * 0.11
+    L: np.ndarray = r * np.float32(0.3)
+    L += g * np.float32(0.59)
+    L += b * np.float32(0.11)
+    return L
 
 
 def lum_im(im: Image.Image) -> Image.Image:
@@ -121,8 +186,8 @@ def lum_im(im: Image.Image) -> Image.Image:
     return im.convert("L")
 
 
-def set_lum(c: RGBOperands, l1: _Operand) -> RGBOperands:
-    """Set luminosity to the color.
+def set_lum(c: np.ndarray, l1: np.ndarray, l2: np.ndarray | None = None) -> np.ndarray:
+    """Set luminosity to the color in place.
 
     The formula is defined as:
 
@@ -136,54 +201,43 @@ def set_lum(c: RGBOperands, l1: _Operand) -> RGBOperands:
     See: https://www.w3.org/TR/compositing-1/#blendingnonseparable
 
     Arguments:
-        c: A tuple of 3 ImageMath operands. The color.
-        l1: An ImageMath operand. The luminosity to set.
+        c: A C-contiguous float32 array of colors.
+        l1: A float32 array. The luminosity to set.
+        l2: An optional float32 array. Lum(C) if it is already known
+            (e.g. from `lum_im`). Defaults to `lum(c)`.
 
     Returns:
-        A tuple of 3 ImageMath operands.
+        The color, `c` itself.
     """
 
-    r, g, b = c
-
-    d = l1 - lum(c)
-    r += d
-    g += d
-    b += d
+    d = l1 - (lum(c) if l2 is None else l2)
+    c += d
 
-    return _clip_color((r, g, b))
+    return clip_color(c)
 
 
-def set_lum_im(c: RGBOperands, l1: _Operand, l2: _Operand) -> RGBOperands:
-    """Set luminosity to the color from image.
+def sat(c: np.ndarray) -> np.ndarray:
+    """Returns saturation.
 
     The formula is defined as:
 
-        SetLum(C, l)
-            d = l - Lum(C)
-            Cred = Cred + d
-            Cgreen = Cgreen + d
-            Cblue = Cblue + d
-            return ClipColor(C)
+        Sat(C) = max(Cred, Cgreen, Cblue) - min(Cred, Cgreen, Cblue)
 
     See: https://www.w3.org/TR/compositing-1/#blendingnonseparable
 
     Arguments:
-        c: A tuple of 3 ImageMath operands. The color.
-        l1: An ImageMath operand. The image of l.
-        l2: An ImageMath operand. The image of Lum(C).
+        c: A float32 array of colors.
 
     Returns:
-        A tuple of 3 ImageMath operands.
+        A float32 array. The saturation.
     """
 
-    r, g, b = c
-    d = l1 - l2
-
-    return _clip_color((r + d, g + d, b + d))
+    s: np.ndarray = _max3(c) - _min3(c)
+    return s
 
 
-def sat(c: RGBOperands) -> _Operand:
-    """Returns saturation as ImageMath operands.
+def sat_im(im: Image.Image) -> Image.Image:
+    """Returns saturation as image.
 
     The formula is defined as:
 
@@ -192,17 +246,20 @@ def sat(c: RGBOperands) -> _Operand:
     See: https://www.w3.org/TR/compositing-1/#blendingnonseparable
 
     Arguments:
-        c: A tuple of 3 operands. The color.
+        im: An input image (RGB).
 
     Returns:
-        An ImageMath operand. The saturation.
+        The saturation image.
     """
 
-    return _max3(c) - _min3(c)
+    r, g, b = im.split()
+    cmax = ImageChops.lighter(ImageChops.lighter(r, g), b)
+    cmin = ImageChops.darker(ImageChops.darker(r, g), b)
+    return ImageChops.subtract(cmax, cmin)
 
 
-def set_sat(c: RGBOperands, s: _Operand) -> RGBOperands:
-    """Set saturation to the color.
+def set_sat(c: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """Set saturation to the color in place.
 
     The formula is defined as:
 
@@ -217,32 +274,31 @@ def set_sat(c: RGBOperands, s: _Operand) -> RGBOperands:
 
     See: https://www.w3.org/TR/compositing-1/#blendingnonseparable
 
+    If two components are the largest, both are treated as Cmax.
+
     Arguments:
-        c: A tuple of 3 ImageMath operands. The color.
-        s: An ImageMath operand. The saturation to set.
+        c: A float32 array of colors.
+        s: A float32 array. The saturation to set.
 
     Returns:
-        A tuple of 3 ImageMath operands.
+        The color, `c` itself.
     """
 
-    r, g, b = c
-
-    cmax = _max3(c)
     cmin = _min3(c)
-    cmid = r + g + b - cmax - cmin
-    new_cmid = ((cmid - cmin) * s) / (cmax - cmin)
-
-    # NOTE: use cmax if cmax == cmid
-    cmid_r = (cmax > cmin) * (cmax > cmid) * (cmid == r) * new_cmid
-    cmid_g = (cmax > cmin) * (cmax > cmid) * (cmid == g) * new_cmid
-    cmid_b = (cmax > cmin) * (cmax > cmid) * (cmid == b) * new_cmid
-
-    cmax_r = (cmax > cmin) * (cmax == r) * s
-    cmax_g = (cmax > cmin) * (cmax == g) * s
-    cmax_b = (cmax > cmin) * (cmax == b) * s
-
-    return (
-        cmid_r + cmax_r,
-        cmid_g + cmax_g,
-        cmid_b + cmax_b,
-    )
+    cmid = _mid3(c)
+    cmax = _max3(c)
+
+    new_cmid = cmid - cmin
+    new_cmid *= s
+    new_cmid = _divide(new_cmid, cmax - cmin)
+
+    is_max = c == cmax
+    is_max &= cmax > cmin
+    is_mid = c == cmid
+    is_mid &= cmax > cmid
+
+    # NOTE: the masks are exclusive
+    np.multiply(is_mid, new_cmid, out=c)
+    c += is_max * s
+
+    return c
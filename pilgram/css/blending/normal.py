@@ -15,6 +15,7 @@
 from PIL import Image
 
 from pilgram.css.blending.alpha import alpha_blend
+from pilgram.types import BlendingSource, Output
 
 
 def _normal(im1: Image.Image, im2: Image.Image) -> Image.Image:
@@ -31,7 +32,15 @@ def _normal(im1: Image.Image, im2: Image.Image) -> Image.Image:
     return im2
 
 
-def normal(im1: Image.Image, im2: Image.Image) -> Image.Image:
+def normal(
+    im1: Image.Image,
+    im2: BlendingSource,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
     """The blending formula simply selects the source color.
 
     The normal formula is defined as:
@@ -43,10 +52,27 @@ def normal(im1: Image.Image, im2: Image.Image) -> Image.Image:
 
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+        opacity: An optional float between 0 and 1. The opacity of
+            the output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L). The output is applied
+            where the mask is white. Defaults to None.
+        out: An optional destination image or array of the output
+            (see `util.write_output`). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im1` with
+            the output. Defaults to False.
 
     Returns:
         The output image.
     """
 
-    return alpha_blend(im1, im2, _normal)
+    return alpha_blend(
+        im1,
+        im2,
+        _normal,
+        separable=True,
+        opacity=opacity,
+        mask=mask,
+        out=out,
+        inplace=inplace,
+    )
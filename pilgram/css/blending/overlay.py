@@ -14,10 +14,38 @@
 
 from PIL import Image
 
-from pilgram.css.blending.hard_light import hard_light
+from pilgram.css.blending.alpha import alpha_blend
+from pilgram.css.blending.hard_light import _hard_light
+from pilgram.css.blending.separable import lookup_blending
+from pilgram.types import BlendingSource, Output
 
 
-def overlay(im1: Image.Image, im2: Image.Image) -> Image.Image:
+def _overlay(im1: Image.Image, im2: Image.Image) -> Image.Image:
+    """The overlay blend mode.
+
+    Arguments:
+        im1: A backdrop image (RGB).
+        im2: A source image (RGB).
+
+    Returns:
+        The output image.
+    """
+
+    return _hard_light(im2, im1)
+
+
+_overlay_lookup = lookup_blending(_overlay)
+
+
+def overlay(
+    im1: Image.Image,
+    im2: BlendingSource,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
     """Multiplies or screens the colors, depending on the backdrop color value
 
     The overlay formula is defined as:
@@ -29,10 +57,27 @@ def overlay(im1: Image.Image, im2: Image.Image) -> Image.Image:
 
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+        opacity: An optional float between 0 and 1. The opacity of
+            the output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L). The output is applied
+            where the mask is white. Defaults to None.
+        out: An optional destination image or array of the output
+            (see `util.write_output`). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im1` with
+            the output. Defaults to False.
 
     Returns:
         The output image.
     """
 
-    return hard_light(im2, im1)
+    return alpha_blend(
+        im1,
+        im2,
+        _overlay_lookup,
+        separable=True,
+        opacity=opacity,
+        mask=mask,
+        out=out,
+        inplace=inplace,
+    )
@@ -0,0 +1,77 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from functools import cache
+
+import numpy as np
+from PIL import Image
+
+from pilgram.types import BlendingFunction
+from pilgram.util import scratch_arena
+
+
+@cache
+def blending_table(blending: BlendingFunction) -> np.ndarray:
+    """Returns a table of a separable blend mode for every pair of values.
+
+    The table is computed by blending all 65536 pairs at once,
+    so it matches `blending` exactly.
+
+    Arguments:
+        blending: A separable blending function for RGB images.
+
+    Returns:
+        A read-only uint8 array of 65536 elements, indexed by `Cb << 8 | Cs`.
+    """
+
+    values = np.arange(256, dtype=np.uint8)
+    cb = np.repeat(values, 256)
+    cs = np.tile(values, 256)
+    im1 = Image.fromarray(np.stack([cb] * 3, axis=-1).reshape(256, 256, 3))
+    im2 = Image.fromarray(np.stack([cs] * 3, axis=-1).reshape(256, 256, 3))
+
+    table = np.asarray(blending(im1, im2))[:, :, 0].ravel()
+    table.flags.writeable = False
+
+    return table
+
+
+def lookup_blending(blending: BlendingFunction) -> BlendingFunction:
+    """Returns a blending function looking up the table of `blending`.
+
+    Each call is a single gather over the images instead of
+    the arithmetic and the intermediate images of `blending`.
+    The index and output arrays are drawn from `util.scratch_arena`.
+
+    Arguments:
+        blending: A separable blending function for RGB images.
+
+    Returns:
+        The blending function.
+    """
+
+    def lookup(im1: Image.Image, im2: Image.Image) -> Image.Image:
+        cb, cs = np.asarray(im1), np.asarray(im2)
+        with scratch_arena:
+            index = scratch_arena.empty(cb.shape, np.uint16)
+            np.left_shift(cb, 8, out=index, dtype=np.uint16)
+            index |= cs
+            cm = scratch_arena.empty(cb.shape, np.uint8)
+            np.take(blending_table(blending), index, out=cm)
+
+            # NOTE: `fromarray` copies RGB pixels, so the scratch array is free
+            return Image.fromarray(cm)
+
+    return lookup
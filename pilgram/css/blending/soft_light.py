@@ -20,7 +20,8 @@ from PIL import Image, ImageChops
 
 from pilgram import util
 from pilgram.css.blending.alpha import alpha_blend
-from pilgram.types import LUT256
+from pilgram.css.blending.separable import lookup_blending
+from pilgram.types import LUT256, BlendingSource, Output
 
 
 def _d_cb(cb: int) -> float:
@@ -65,7 +66,18 @@ def _soft_light(im1: Image.Image, im2: Image.Image) -> Image.Image:
     return Image.fromarray(cm)
 
 
-def soft_light(im1: Image.Image, im2: Image.Image) -> Image.Image:
+_soft_light_lookup = lookup_blending(_soft_light)
+
+
+def soft_light(
+    im1: Image.Image,
+    im2: BlendingSource,
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+    *,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
     """Darkens or lightens the colors, depending on the source color value.
 
     The soft light formula is defined as:
@@ -87,10 +99,27 @@ def soft_light(im1: Image.Image, im2: Image.Image) -> Image.Image:
 
     Arguments:
         im1: A backdrop image (RGB or RGBA).
-        im2: A source image (RGB or RGBA).
+        im2: A source image (RGB or RGBA) or color (see `util.fill`).
+        opacity: An optional float between 0 and 1. The opacity of
+            the output over the backdrop. Defaults to 1.
+        mask: An optional mask image (L). The output is applied
+            where the mask is white. Defaults to None.
+        out: An optional destination image or array of the output
+            (see `util.write_output`). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im1` with
+            the output. Defaults to False.
 
     Returns:
         The output image.
     """
 
-    return alpha_blend(im1, im2, _soft_light)
+    return alpha_blend(
+        im1,
+        im2,
+        _soft_light_lookup,
+        separable=True,
+        opacity=opacity,
+        mask=mask,
+        out=out,
+        inplace=inplace,
+    )
@@ -12,12 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from importlib import import_module
+
+import numpy as np
 import pytest
-from PIL import Image
+from PIL import Image, ImageChops
 from pytest_mock import MockerFixture
 
 from pilgram import util
-from pilgram.css.blending.alpha import alpha_blend, alpha_to_rgb, split_alpha
+from pilgram.css.blending.alpha import (
+    _multiply,
+    alpha_blend,
+    alpha_to_rgb,
+    solid_color,
+    split_alpha,
+)
+from pilgram.types import RGBAColor, RGBColor
 
 
 def _normal(cb: Image.Image, cs: Image.Image) -> Image.Image:
@@ -145,3 +155,245 @@ def test_alpha_blend_normal_opaque_backdrop_with_opaque_source() -> None:
 
     expected = split_alpha(cs)[0]
     assert cr == expected
+
+
+def test_solid_color() -> None:
+    assert solid_color(util.fill((2, 2), (0, 128, 255))) == (0, 128, 255)
+    assert solid_color(util.fill((2, 2), (0, 128, 255, 0.5))) == (0, 128, 255, 128)
+
+
+def test_solid_color_single_pixel() -> None:
+    im = util.fill((5, 5), (0, 128, 255))
+    im.putpixel((1, 3), (0, 0, 0))
+    assert solid_color(im) is None
+
+
+def test_solid_color_gradient() -> None:
+    im = util.linear_gradient((2, 2), (0, 0, 0), (255, 255, 255))
+    assert solid_color(im) is None
+
+
+@pytest.mark.parametrize(
+    "mode",
+    [
+        "color_burn",
+        "color_dodge",
+        "darken",
+        "difference",
+        "exclusion",
+        "hard_light",
+        "lighten",
+        "multiply",
+        "normal",
+        "overlay",
+        "screen",
+        "soft_light",
+    ],
+)
+@pytest.mark.parametrize("color", [(0, 128, 255), (255, 128, 0, 0.4)])
+def test_alpha_blend_solid_color(
+    mode: str, color: RGBColor | RGBAColor, mocker: MockerFixture
+) -> None:
+    blending = getattr(import_module(f"pilgram.css.blending.{mode}"), f"_{mode}")
+    cb = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (16, 16, 3), dtype=np.uint8)
+    )
+    cs = util.fill(cb.size, color)
+    expected = alpha_blend(cb, cs, blending)
+
+    assert alpha_blend(cb, color, blending, separable=True) == expected
+
+    spy = mocker.spy(Image.Image, "point")
+    assert alpha_blend(cb, cs, blending, separable=True) == expected
+    assert spy.call_count == 1
+
+
+def test_alpha_blend_color_nonseparable() -> None:
+    cb = util.fill((2, 2), (0, 128, 255))
+    cr = alpha_blend(cb, (255, 128, 0), _normal)
+
+    assert cr == util.fill((2, 2), (255, 128, 0))
+
+
+def test_alpha_blend_color_rgba_backdrop() -> None:
+    cb = util.fill((2, 2), (0, 128, 255, 0))
+    cr = alpha_blend(cb, (255, 128, 0), _normal, separable=True)
+
+    assert cr == util.fill((2, 2), (255, 128, 0))
+
+
+@pytest.mark.parametrize("mode", ["multiply", "soft_light"])
+@pytest.mark.parametrize("strip_size", [(1, 12), (16, 1)])
+@pytest.mark.parametrize("separable", [True, False])
+@pytest.mark.parametrize("source_mode", ["RGB", "RGBA"])
+def test_alpha_blend_strip(
+    mode: str, strip_size: tuple[int, int], separable: bool, source_mode: str
+) -> None:
+    blending = getattr(import_module(f"pilgram.css.blending.{mode}"), f"_{mode}")
+    rng = np.random.default_rng(0)
+    cb = Image.fromarray(rng.integers(0, 256, (12, 16, 3), dtype=np.uint8))
+
+    # NOTE: runs of the same colors
+    w, h = strip_size
+    n = len(source_mode)
+    colors = rng.integers(0, 256, (4, 1, n), dtype=np.uint8).repeat(w * h // 4, axis=0)
+    cs = Image.fromarray(colors.reshape(h, w, n))
+
+    expected = alpha_blend(cb, cs.resize(cb.size, Image.Resampling.NEAREST), blending)
+    assert alpha_blend(cb, cs, blending, separable=separable) == expected
+
+
+@pytest.mark.parametrize("size", [(1, 4), (4, 1)])
+@pytest.mark.parametrize("separable", [True, False])
+def test_alpha_blend_strip_single_pixel(size: tuple[int, int], separable: bool) -> None:
+    cb = Image.new("RGB", size, (200, 100, 50))
+    cs = Image.new("RGB", (1, 1), (100, 50, 20))
+
+    expected = alpha_blend(cb, util.fill(size, (100, 50, 20)), ImageChops.multiply)
+    actual = alpha_blend(cb, cs, ImageChops.multiply, separable=separable)
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_multiply() -> None:
+    values = np.arange(256, dtype=np.uint8)
+    a, b = np.meshgrid(values, values)
+
+    expected = ImageChops.multiply(Image.fromarray(a), Image.fromarray(b))
+    assert np.array_equal(_multiply(a, b), np.asarray(expected))
+
+
+def _alpha_blend_reference(cb: Image.Image, cs: Image.Image) -> Image.Image:
+    """The multiply blend mode composited with ImageChops"""
+
+    a1, a2 = cb.getchannel("A"), cs.getchannel("A")
+    cb, cs = cb.convert("RGB"), cs.convert("RGB")
+    a12 = ImageChops.multiply(a1, a2)
+    terms = [
+        ImageChops.multiply(ImageChops.subtract(a2, a12).convert("RGB"), cs),
+        ImageChops.multiply(a12.convert("RGB"), ImageChops.multiply(cb, cs)),
+        ImageChops.multiply(ImageChops.subtract(a1, a12).convert("RGB"), cb),
+    ]
+    return ImageChops.add(ImageChops.add(terms[0], terms[1]), terms[2])
+
+
+@pytest.mark.parametrize(
+    ("alpha1", "alpha2"), [(None, None), (None, 51), (204, None), (204, 51)]
+)
+def test_alpha_blend_rgba(alpha1: int | None, alpha2: int | None) -> None:
+    rng = np.random.default_rng(0)
+    cb = Image.fromarray(rng.integers(0, 256, (16, 16, 4), dtype=np.uint8))
+    cs = Image.fromarray(rng.integers(0, 256, (16, 16, 4), dtype=np.uint8))
+    if alpha1 is not None:
+        cb.putalpha(alpha1)
+    if alpha2 is not None:
+        cs.putalpha(alpha2)
+
+    actual = alpha_blend(cb, cs, ImageChops.multiply)
+    assert actual == _alpha_blend_reference(cb, cs)
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["color", "solid", "strip", "image"],
+)
+@pytest.mark.parametrize("separable", [False, True])
+def test_alpha_blend_opacity_and_mask(source: str, separable: bool) -> None:
+    rng = np.random.default_rng(0)
+    cb = Image.fromarray(rng.integers(0, 256, (12, 16, 3), dtype=np.uint8))
+    mask = Image.fromarray(rng.integers(0, 256, (12, 16), dtype=np.uint8))
+    cs: Image.Image | RGBAColor
+    if source == "color":
+        cs = (0, 128, 255, 0.5)
+    elif source == "solid":
+        cs = util.fill(cb.size, (0, 128, 255))
+    elif source == "strip":
+        cs = Image.fromarray(rng.integers(0, 256, (12, 1, 3), dtype=np.uint8))
+    else:
+        cs = Image.fromarray(rng.integers(0, 256, (12, 16, 3), dtype=np.uint8))
+
+    cr = alpha_blend(cb, cs, ImageChops.multiply, separable=separable)
+    expected = Image.composite(Image.blend(cb, cr, 0.3), cb, mask)
+
+    actual = alpha_blend(
+        cb, cs, ImageChops.multiply, separable=separable, opacity=0.3, mask=mask
+    )
+    if source == "color":
+        # NOTE: the opacity scales the alpha of the source in 8 bits
+        diff = np.asarray(actual, np.int16) - np.asarray(expected, np.int16)
+        assert np.abs(diff).max() <= 1
+    else:
+        assert actual == expected
+
+
+@pytest.mark.parametrize("bands", [(4, 3), (3, 4), (4, 4)])
+@pytest.mark.parametrize("opacity", [0, 0.3, 1])
+def test_alpha_blend_opacity_alpha(bands: tuple[int, int], opacity: float) -> None:
+    rng = np.random.default_rng(0)
+    cb = Image.fromarray(rng.integers(0, 256, (12, 16, bands[0]), dtype=np.uint8))
+    cs = Image.fromarray(rng.integers(0, 256, (12, 16, bands[1]), dtype=np.uint8))
+    cr = alpha_blend(cb, cs, ImageChops.multiply)
+    expected = np.asarray(Image.blend(cb.convert("RGB"), cr, opacity), np.int16)
+
+    # NOTE: the opacity scales the 8-bit weights of the composited terms
+    actual = alpha_blend(cb, cs, ImageChops.multiply, opacity=opacity)
+    assert np.abs(np.asarray(actual, np.int16) - expected).max() <= 2
+
+
+def test_alpha_blend_invalid_opacity_and_mask() -> None:
+    cb = util.fill((4, 4), (0, 128, 255))
+
+    with pytest.raises(AssertionError):
+        alpha_blend(cb, (0, 0, 0), _normal, opacity=1.5)
+
+    with pytest.raises(AssertionError):
+        alpha_blend(cb, (0, 0, 0), _normal, mask=Image.new("L", (2, 2)))
+
+
+@pytest.mark.parametrize("source", ["color", "strip", "image"])
+@pytest.mark.parametrize("masked", [False, True])
+@pytest.mark.parametrize("inplace", [False, True])
+def test_alpha_blend_output(source: str, masked: bool, inplace: bool) -> None:
+    rng = np.random.default_rng(0)
+    cb = Image.fromarray(rng.integers(0, 256, (12, 16, 3), dtype=np.uint8))
+    mask = Image.fromarray(rng.integers(0, 256, (12, 16), dtype=np.uint8))
+    cs: Image.Image | RGBAColor
+    if source == "color":
+        cs = (0, 128, 255, 0.5)
+    elif source == "strip":
+        cs = Image.fromarray(rng.integers(0, 256, (12, 1, 3), dtype=np.uint8))
+    else:
+        cs = Image.fromarray(rng.integers(0, 256, (12, 16, 3), dtype=np.uint8))
+
+    m = mask if masked else None
+    expected = alpha_blend(
+        cb, cs, ImageChops.multiply, separable=True, opacity=0.3, mask=m
+    )
+
+    out = cb if inplace else Image.new("RGB", cb.size)
+    actual = alpha_blend(
+        cb,
+        cs,
+        ImageChops.multiply,
+        separable=True,
+        opacity=0.3,
+        mask=m,
+        out=None if inplace else out,
+        inplace=inplace,
+    )
+    assert actual is out
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_alpha_blend_output_array() -> None:
+    cb = util.fill((4, 4), (0, 128, 255))
+    out = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    actual = alpha_blend(cb, (255, 0, 0, 0.5), _normal, out=out)
+    assert np.array_equal(out, np.asarray(actual))
+
+
+def test_alpha_blend_output_rgba_backdrop() -> None:
+    cb = util.fill((4, 4), (0, 128, 255, 0.5))
+
+    with pytest.raises(ValueError):
+        alpha_blend(cb, (0, 0, 0), _normal, inplace=True)
@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import tracemalloc
+
 import numpy as np
 import pytest
 from PIL import Image
+from pytest_benchmark.fixture import BenchmarkFixture
 
 from pilgram import css, util
 from pilgram.css.blending.tests.helpers import assert_alpha_support
+from pilgram.types import RGBAColor, RGBColor
 
 
 def test_hue1() -> None:
@@ -56,5 +60,47 @@ def test_hue2() -> None:
     assert list(hue.get_flattened_data()) == expected_approx  # almost eq
 
 
+@pytest.mark.parametrize("color", [(3, 230, 26), (216, 205, 203), (128, 128, 128)])
+def test_hue_solid_source(color: RGBColor) -> None:
+    rng = np.random.default_rng(0)
+    cb = Image.fromarray(rng.integers(0, 256, (64, 64, 3), dtype=np.uint8))
+    cs = util.fill(cb.size, color)
+
+    # NOTE: a single different pixel disables the solid source path
+    cs_varying = cs.copy()
+    cs_varying.putpixel((0, 0), (0, 0, 0))
+
+    actual = np.asarray(css.blending.hue(cb, cs))[1:]
+    expected = np.asarray(css.blending.hue(cb, cs_varying))[1:]
+    assert np.array_equal(actual, expected)
+
+
+@pytest.mark.parametrize("color", [(3, 230, 26), (216, 205, 203, 0.5)])
+@pytest.mark.parametrize("opacity", [1, 0.4])
+def test_hue_color_source(
+    color: RGBColor | RGBAColor, opacity: float, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rng = np.random.default_rng(0)
+    cb = Image.fromarray(rng.integers(0, 256, (64, 64, 3), dtype=np.uint8))
+    expected = css.blending.hue(cb, util.fill(cb.size, color), opacity)
+
+    # NOTE: the color is blended as is, without filling a source layer
+    monkeypatch.setattr(css.blending.alpha, "fill", None)
+    actual = css.blending.hue(cb, color, opacity)
+    assert actual == expected
+
+
 def test_hue_alpha_support() -> None:
     assert_alpha_support(css.blending.hue)
+
+
+def test_hue_benchmark(benchmark: BenchmarkFixture) -> None:
+    with Image.open("examples/mtjimba.jpg") as im:
+        cs = util.linear_gradient(im.size, (3, 230, 26), (216, 205, 203))
+
+        tracemalloc.start()
+        css.blending.hue(im, cs)
+        benchmark.extra_info["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        benchmark(css.blending.hue, im, cs)
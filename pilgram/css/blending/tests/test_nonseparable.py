@@ -12,79 +12,79 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+
 from math import floor
 
+import numpy as np
 import pytest
-from PIL import Image, ImageMath
-from PIL.ImageMath import imagemath_convert as _convert
 
 from pilgram import util
 from pilgram.css.blending.nonseparable import (
-    _clip_color,
     _max3,
+    _mid3,
     _min3,
+    clip_color,
+    from_image,
     lum,
     lum_im,
     sat,
+    sat_im,
     set_lum,
     set_sat,
+    to_image,
 )
 
 
+def _color(*c: float) -> np.ndarray:
+    return np.array(c, dtype=np.float32).reshape(3, 1, 1)
+
+
 def test_min3() -> None:
-    im = util.fill((1, 1), (0, 128, 255))
-    r, g, b = im.split()
-    im_min = ImageMath.lambda_eval(
-        lambda args: _convert(_min3((args["r"], args["g"], args["b"])), "L"),
-        r=r,
-        g=g,
-        b=b,
-    )
+    assert _min3(_color(0, 128, 255)).tolist() == [[0]]
+
 
-    assert list(im_min.get_flattened_data()) == [0]
+def test_mid3() -> None:
+    assert _mid3(_color(0, 128, 255)).tolist() == [[128]]
+    assert _mid3(_color(255, 0, 128)).tolist() == [[128]]
+    assert _mid3(_color(128, 255, 128)).tolist() == [[128]]
 
 
 def test_max3() -> None:
-    im = util.fill((1, 1), (0, 128, 255))
-    r, g, b = im.split()
-    im_max = ImageMath.lambda_eval(
-        lambda args: _convert(_max3((args["r"], args["g"], args["b"])), "L"),
-        r=r,
-        g=g,
-        b=b,
-    )
+    assert _max3(_color(0, 128, 255)).tolist() == [[255]]
+
+
+def test_from_image() -> None:
+    c = from_image(util.fill((2, 1), (0, 128, 255)))
+
+    assert c.dtype == np.float32
+    assert c.shape == (3, 1, 2)
+    assert c.flags.c_contiguous
+    assert c[:, 0, 0].tolist() == [0, 128, 255]
+
 
-    assert list(im_max.get_flattened_data()) == [255]
+def test_to_image() -> None:
+    im = to_image(_color(-1, 128.9, 256))
+
+    assert im.mode == "RGB"
+    assert im.getpixel((0, 0)) == (0, 128, 255)
 
 
 def test_clip_color() -> None:
-    im = util.fill((1, 1), (0, 128, 255))
-    r, g, b = im.split()
-    bands = ImageMath.lambda_eval(
-        lambda args: _clip_color((args["r"] - 64, args["g"], args["b"] + 64)),
-        r=r,
-        g=g,
-        b=b,
-    )
+    c = clip_color(_color(-64, 128, 255 + 64))
 
     expected = [
-        [pytest.approx(25.70517158047366, 1e-6)],
-        [pytest.approx(106.8796587856024, 1e-6)],
-        [pytest.approx(187.63136220320442, 1e-6)],
+        pytest.approx(25.70517158047366, 1e-6),
+        pytest.approx(106.8796587856024, 1e-6),
+        pytest.approx(187.63136220320442, 1e-6),
     ]
-    assert [list(band.im.get_flattened_data()) for band in bands] == expected
+    assert c.ravel().tolist() == expected
 
 
 def test_lum() -> None:
-    im = util.fill((1, 1), (0, 128, 255))
-    r, g, b = im.split()
-    im_f = ImageMath.lambda_eval(
-        lambda args: lum((args["r"], args["g"], args["b"])), r=r, g=g, b=b
-    )
-    im_l = im_f.convert("L")
+    L = lum(_color(0, 128, 255))
 
-    assert list(im_f.get_flattened_data()) == [pytest.approx(103.57, 1e-6)]
-    assert list(im_l.get_flattened_data()) == [floor(103.57)]
+    assert L.tolist() == [[pytest.approx(103.57, 1e-6)]]
+    assert floor(L[0, 0]) == floor(103.57)
 
 
 def test_lum_im() -> None:
@@ -95,113 +95,51 @@ def test_lum_im() -> None:
 
 
 def test_set_lum() -> None:
-    im1 = util.fill((1, 1), (0, 128, 255))
-    im2 = util.fill((1, 1), (128, 128, 128))
-    r1, g1, b1 = im1.split()
-    r2, g2, b2 = im2.split()
-    bands = ImageMath.lambda_eval(
-        lambda args: set_lum(
-            (args["r1"], args["g1"], args["b1"]),
-            lum((args["r2"], args["g2"], args["b2"])),
-        ),
-        r1=r1,
-        g1=g1,
-        b1=b1,
-        r2=r2,
-        g2=g2,
-        b2=b2,
-    )
+    c = set_lum(_color(0, 128, 255), lum(_color(128, 128, 128)))
 
     expected1 = [
-        [pytest.approx(41.13881001122631, 1e-6)],
-        [pytest.approx(148.48874067225782, 1e-6)],
-        [255],
+        pytest.approx(41.13881001122631, 1e-6),
+        pytest.approx(148.48874067225782, 1e-6),
+        255,
     ]
-    assert [list(band.im.get_flattened_data()) for band in bands] == expected1
+    assert c.ravel().tolist() == expected1
+
+    expected2 = (floor(41.13881001122631), floor(148.48874067225782), 255)
+    assert to_image(c).getpixel((0, 0)) == expected2
+
 
-    im_set_lum = Image.merge("RGB", [_convert(band, "L").im for band in bands])
-    expected2 = [(floor(41.13881001122631), floor(148.48874067225782), 255)]
-    assert list(im_set_lum.get_flattened_data()) == expected2
+def test_set_lum_known_lum() -> None:
+    l1 = np.full((1, 1), 128, dtype=np.float32)
+    l2 = np.full((1, 1), 100, dtype=np.float32)
+    c = set_lum(_color(0, 128, 200), l1, l2)
+
+    assert c.ravel().tolist() == [28, 156, 228]
 
 
 def test_sat() -> None:
+    assert sat(_color(80, 128, 200)).tolist() == [[120]]
+
+
+def test_sat_im() -> None:
     im = util.fill((1, 1), (80, 128, 200))
-    r, g, b = im.split()
-    im_sat = ImageMath.lambda_eval(
-        lambda args: _convert(sat((args["r"], args["g"], args["b"])), "L"),
-        r=r,
-        g=g,
-        b=b,
-    )
+    im_sat = sat_im(im)
 
+    assert im_sat.mode == "L"
     assert list(im_sat.get_flattened_data()) == [120]
 
 
 def test_set_sat_cmax_gt_cmin() -> None:
-    im1 = util.fill((1, 1), (0, 128, 255))
-    im2 = util.fill((1, 1), (64, 96, 128))  # sat = 64
-    r1, g1, b1 = im1.split()
-    r2, g2, b2 = im2.split()
-    bands = ImageMath.lambda_eval(
-        lambda args: set_sat(
-            (args["r1"], args["g1"], args["b1"]),
-            sat((args["r2"], args["g2"], args["b2"])),
-        ),
-        r1=r1,
-        g1=g1,
-        b1=b1,
-        r2=r2,
-        g2=g2,
-        b2=b2,
-    )
+    c = set_sat(_color(0, 128, 255), sat(_color(64, 96, 128)))  # sat = 64
 
-    expected = [
-        [0],
-        [pytest.approx(32.12549019607843, abs=1)],
-        [64],
-    ]
-    assert [list(band.im.get_flattened_data()) for band in bands] == expected
+    expected = [0, pytest.approx(32.12549019607843, abs=1), 64]
+    assert c.ravel().tolist() == expected
 
 
 def test_set_sat_cmax_eq_cmid_gt_cmin() -> None:
-    im1 = util.fill((1, 1), (0, 128, 128))
-    im2 = util.fill((1, 1), (64, 96, 128))  # sat = 64
-    r1, g1, b1 = im1.split()
-    r2, g2, b2 = im2.split()
-    bands = ImageMath.lambda_eval(
-        lambda args: set_sat(
-            (args["r1"], args["g1"], args["b1"]),
-            sat((args["r2"], args["g2"], args["b2"])),
-        ),
-        r1=r1,
-        g1=g1,
-        b1=b1,
-        r2=r2,
-        g2=g2,
-        b2=b2,
-    )
-
-    expected = [[0], [64], [64]]
-    assert [list(band.im.get_flattened_data()) for band in bands] == expected
+    c = set_sat(_color(0, 128, 128), sat(_color(64, 96, 128)))  # sat = 64
+    assert c.ravel().tolist() == [0, 64, 64]
 
 
 def test_set_sat_cmax_eq_cmin() -> None:
-    im1 = util.fill((1, 1), (128, 128, 128))
-    im2 = util.fill((1, 1), (64, 96, 128))  # sat = 64
-    r1, g1, b1 = im1.split()
-    r2, g2, b2 = im2.split()
-    bands = ImageMath.lambda_eval(
-        lambda args: set_sat(
-            (args["r1"], args["g1"], args["b1"]),
-            sat((args["r2"], args["g2"], args["b2"])),
-        ),
-        r1=r1,
-        g1=g1,
-        b1=b1,
-        r2=r2,
-        g2=g2,
-        b2=b2,
-    )
-
-    expected = [[0], [0], [0]]
-    assert [list(band.im.get_flattened_data()) for band in bands] == expected
+    c = set_sat(_color(128, 128, 128), sat(_color(64, 96, 128)))  # sat = 64
+    assert c.ravel().tolist() == [0, 0, 0]
@@ -0,0 +1,64 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from importlib import import_module
+
+import numpy as np
+import pytest
+from PIL import Image
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pilgram import css, util
+from pilgram.css.blending.separable import blending_table, lookup_blending
+from pilgram.css.blending.soft_light import _soft_light
+
+SEPARABLE_MODES = [
+    "color_burn",
+    "color_dodge",
+    "darken",
+    "difference",
+    "exclusion",
+    "hard_light",
+    "lighten",
+    "multiply",
+    "normal",
+    "overlay",
+    "screen",
+    "soft_light",
+]
+
+
+def test_blending_table() -> None:
+    table = blending_table(_soft_light)
+
+    assert table.shape == (65536,)
+    assert table.dtype == np.uint8
+    assert not table.flags.writeable
+
+
+@pytest.mark.parametrize("mode", SEPARABLE_MODES)
+def test_lookup_blending(mode: str) -> None:
+    blending = getattr(import_module(f"pilgram.css.blending.{mode}"), f"_{mode}")
+    rng = np.random.default_rng(0)
+    im1 = Image.fromarray(rng.integers(0, 256, (32, 32, 3), dtype=np.uint8))
+    im2 = Image.fromarray(rng.integers(0, 256, (32, 32, 3), dtype=np.uint8))
+
+    assert lookup_blending(blending)(im1, im2) == blending(im1, im2)
+
+
+def test_soft_light_gradient_benchmark(benchmark: BenchmarkFixture) -> None:
+    with Image.open("examples/mtjimba.jpg") as im:
+        cs = util.linear_gradient(im.size, (0, 91, 154), (230, 193, 61), False)
+        benchmark(css.blending.soft_light, im, cs)
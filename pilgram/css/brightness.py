@@ -12,9 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
 
 from PIL import Image
 
+from pilgram import util
+from pilgram.types import LUT256
+
+
+@lru_cache(maxsize=256)
+def brightness_lut(amount: float = 1) -> LUT256:
+    """Returns the LUT of the brightness operation.
+
+    Arguments:
+        amount: An optional number. The filter amount (percentage).
+            Defaults to 1.
+
+    Returns:
+        The LUT. The values are rounded and clipped as `Image.point` does.
+
+    Raises:
+        AssertionError: if `amount` is less than 0.
+    """
+
+    assert amount >= 0
+
+    return tuple(int(util.clip(round(x * amount))) for x in range(256))
+
 
 def brightness(im: Image.Image, amount: float = 1) -> Image.Image:
     """Adjusts the brightness.
@@ -40,6 +64,4 @@ def brightness(im: Image.Image, amount: float = 1) -> Image.Image:
         AssertionError: if `amount` is less than 0.
     """
 
-    assert amount >= 0
-
-    return im.point(lambda x: round(x * amount))
+    return util.apply_lut(im, brightness_lut(amount))
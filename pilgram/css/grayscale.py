@@ -13,32 +13,24 @@
 # limitations under the License.
 
 
+from functools import lru_cache
+
 from PIL import Image
 
 from pilgram import util
+from pilgram.types import ColorMatrix
 
 
-def grayscale(im: Image.Image, amount: float = 1) -> Image.Image:
-    """Converts image to grayscale.
-
-    A grayscale operation is equivalent to the following matrix operation:
-
-    | R' |     |0.2126+0.7874g  0.7152-0.7152g  0.0722-0.0722g 0  0 |   | R |
-    | G' |     |0.2126-0.2126g  0.7152+0.2848g  0.0722-0.0722g 0  0 |   | G |
-    | B' |  =  |0.2126-0.2126g  0.7152-0.7152g  0.0722+0.9278g 0  0 | * | B |
-    | A' |     |            0               0               0  1  0 |   | A |
-    | 1  |     |            0               0               0  0  1 |   | 1 |
-
-    See the W3C document:
-    https://www.w3.org/TR/filter-effects-1/#grayscaleEquivalent
+@lru_cache(maxsize=256)
+def grayscale_matrix(amount: float = 1) -> ColorMatrix:
+    """Returns the color matrix of the grayscale operation.
 
     Arguments:
-        im: An input image.
         amount: An optional number. The filter amount (percentage).
             Defaults to 1.
 
     Returns:
-        The output image.
+        The 3x4 color matrix for `Image.convert`.
 
     Raises:
         AssertionError: if `amount` is less than 0.
@@ -47,7 +39,8 @@ def grayscale(im: Image.Image, amount: float = 1) -> Image.Image:
     assert amount >= 0
 
     g = 1 - min(amount, 1)
-    matrix = (
+
+    return (
         0.2126 + 0.7874 * g,
         0.7152 - 0.7152 * g,
         0.0722 - 0.0722 * g,
@@ -62,5 +55,31 @@ def grayscale(im: Image.Image, amount: float = 1) -> Image.Image:
         0,
     )
 
-    grayscaled = util.or_convert(im, "RGB").convert("RGB", matrix)
-    return util.or_convert(grayscaled, im.mode)
+
+def grayscale(im: Image.Image, amount: float = 1) -> Image.Image:
+    """Converts image to grayscale.
+
+    A grayscale operation is equivalent to the following matrix operation:
+
+    | R' |     |0.2126+0.7874g  0.7152-0.7152g  0.0722-0.0722g 0  0 |   | R |
+    | G' |     |0.2126-0.2126g  0.7152+0.2848g  0.0722-0.0722g 0  0 |   | G |
+    | B' |  =  |0.2126-0.2126g  0.7152-0.7152g  0.0722+0.9278g 0  0 | * | B |
+    | A' |     |            0               0               0  1  0 |   | A |
+    | 1  |     |            0               0               0  0  1 |   | 1 |
+
+    See the W3C document:
+    https://www.w3.org/TR/filter-effects-1/#grayscaleEquivalent
+
+    Arguments:
+        im: An input image.
+        amount: An optional number. The filter amount (percentage).
+            Defaults to 1.
+
+    Returns:
+        The output image.
+
+    Raises:
+        AssertionError: if `amount` is less than 0.
+    """
+
+    return util.apply_color_matrix(im, grayscale_matrix(amount))
@@ -13,10 +13,43 @@
 # limitations under the License.
 
 import math
+from functools import lru_cache
 
 from PIL import Image
 
 from pilgram import util
+from pilgram.types import ColorMatrix
+
+
+@lru_cache(maxsize=256)
+def hue_rotate_matrix(deg: float = 0) -> ColorMatrix:
+    """Returns the color matrix of the hue rotate operation.
+
+    Arguments:
+        deg: An optional number. The hue rotate value (degrees).
+            Defaults to 0.
+
+    Returns:
+        The 3x4 color matrix for `Image.convert`.
+    """
+
+    cos_hue = math.cos(math.radians(deg))
+    sin_hue = math.sin(math.radians(deg))
+
+    return (
+        0.213 + cos_hue * 0.787 - sin_hue * 0.213,
+        0.715 - cos_hue * 0.715 - sin_hue * 0.715,
+        0.072 - cos_hue * 0.072 + sin_hue * 0.928,
+        0,
+        0.213 - cos_hue * 0.213 + sin_hue * 0.143,
+        0.715 + cos_hue * 0.285 + sin_hue * 0.140,
+        0.072 - cos_hue * 0.072 - sin_hue * 0.283,
+        0,
+        0.213 - cos_hue * 0.213 - sin_hue * 0.787,
+        0.715 - cos_hue * 0.715 + sin_hue * 0.715,
+        0.072 + cos_hue * 0.928 + sin_hue * 0.072,
+        0,
+    )
 
 
 def hue_rotate(im: Image.Image, deg: float = 0) -> Image.Image:
@@ -54,23 +87,4 @@ def hue_rotate(im: Image.Image, deg: float = 0) -> Image.Image:
         The output image.
     """
 
-    cos_hue = math.cos(math.radians(deg))
-    sin_hue = math.sin(math.radians(deg))
-
-    matrix = (
-        0.213 + cos_hue * 0.787 - sin_hue * 0.213,
-        0.715 - cos_hue * 0.715 - sin_hue * 0.715,
-        0.072 - cos_hue * 0.072 + sin_hue * 0.928,
-        0,
-        0.213 - cos_hue * 0.213 + sin_hue * 0.143,
-        0.715 + cos_hue * 0.285 + sin_hue * 0.140,
-        0.072 - cos_hue * 0.072 - sin_hue * 0.283,
-        0,
-        0.213 - cos_hue * 0.213 - sin_hue * 0.787,
-        0.715 - cos_hue * 0.715 + sin_hue * 0.715,
-        0.072 + cos_hue * 0.928 + sin_hue * 0.072,
-        0,
-    )
-
-    rotated = util.or_convert(im, "RGB").convert("RGB", matrix)
-    return util.or_convert(rotated, im.mode)
+    return util.apply_color_matrix(im, hue_rotate_matrix(deg))
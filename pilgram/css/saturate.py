@@ -13,32 +13,24 @@
 # limitations under the License.
 
 
+from functools import lru_cache
+
 from PIL import Image
 
 from pilgram import util
+from pilgram.types import ColorMatrix
 
 
-def saturate(im: Image.Image, amount: float = 1) -> Image.Image:
-    """Saturates image.
-
-    A saturate operation is equivalent to the following matrix operation:
-
-        | R' |     |0.213+0.787s  0.715-0.715s  0.072-0.072s 0  0 |   | R |
-        | G' |     |0.213-0.213s  0.715+0.285s  0.072-0.072s 0  0 |   | G |
-        | B' |  =  |0.213-0.213s  0.715-0.715s  0.072+0.928s 0  0 | * | B |
-        | A' |     |           0            0             0  1  0 |   | A |
-        | 1  |     |           0            0             0  0  1 |   | 1 |
-
-    See the W3C document:
-    https://www.w3.org/TR/SVG11/filters.html#feColorMatrixValuesAttribute
+@lru_cache(maxsize=256)
+def saturate_matrix(amount: float = 1) -> ColorMatrix:
+    """Returns the color matrix of the saturate operation.
 
     Arguments:
-        im: An input image.
         amount: An optional number. The filter amount (percentage).
             Defaults to 1.
 
     Returns:
-        The output image.
+        The 3x4 color matrix for `Image.convert`.
 
     Raises:
         AssertionError: if `amount` is less than 0.
@@ -46,7 +38,7 @@ def saturate(im: Image.Image, amount: float = 1) -> Image.Image:
 
     assert amount >= 0
 
-    matrix = (
+    return (
         0.213 + 0.787 * amount,
         0.715 - 0.715 * amount,
         0.072 - 0.072 * amount,
@@ -61,5 +53,31 @@ def saturate(im: Image.Image, amount: float = 1) -> Image.Image:
         0,
     )
 
-    saturated = util.or_convert(im, "RGB").convert("RGB", matrix)
-    return util.or_convert(saturated, im.mode)
+
+def saturate(im: Image.Image, amount: float = 1) -> Image.Image:
+    """Saturates image.
+
+    A saturate operation is equivalent to the following matrix operation:
+
+        | R' |     |0.213+0.787s  0.715-0.715s  0.072-0.072s 0  0 |   | R |
+        | G' |     |0.213-0.213s  0.715+0.285s  0.072-0.072s 0  0 |   | G |
+        | B' |  =  |0.213-0.213s  0.715-0.715s  0.072+0.928s 0  0 | * | B |
+        | A' |     |           0            0             0  1  0 |   | A |
+        | 1  |     |           0            0             0  0  1 |   | 1 |
+
+    See the W3C document:
+    https://www.w3.org/TR/SVG11/filters.html#feColorMatrixValuesAttribute
+
+    Arguments:
+        im: An input image.
+        amount: An optional number. The filter amount (percentage).
+            Defaults to 1.
+
+    Returns:
+        The output image.
+
+    Raises:
+        AssertionError: if `amount` is less than 0.
+    """
+
+    return util.apply_color_matrix(im, saturate_matrix(amount))
@@ -13,32 +13,24 @@
 # limitations under the License.
 
 
+from functools import lru_cache
+
 from PIL import Image
 
 from pilgram import util
+from pilgram.types import ColorMatrix
 
 
-def sepia(im: Image.Image, amount: float = 1) -> Image.Image:
-    """Converts image to sepia.
-
-    A sepia operation is equivalent to the following matrix operation:
-
-    | R' |     |0.393+0.607s  0.769-0.769s  0.189-0.189s 0  0 |   | R |
-    | G' |     |0.349-0.349s  0.686+0.314s  0.168-0.168s 0  0 |   | G |
-    | B' |  =  |0.272-0.272g  0.534-0.534g  0.131+0.869g 0  0 | * | B |
-    | A' |     |          0             0             0  1  0 |   | A |
-    | 1  |     |          0             0             0  0  1 |   | 1 |
-
-    See the W3C document:
-    https://www.w3.org/TR/filter-effects-1/#sepiaEquivalent
+@lru_cache(maxsize=256)
+def sepia_matrix(amount: float = 1) -> ColorMatrix:
+    """Returns the color matrix of the sepia operation.
 
     Arguments:
-        im: An input image.
         amount: An optional number. The filter amount (percentage).
             Defaults to 1.
 
     Returns:
-        The output image.
+        The 3x4 color matrix for `Image.convert`.
 
     Raises:
         AssertionError: if `amount` is less than 0.
@@ -47,7 +39,8 @@ def sepia(im: Image.Image, amount: float = 1) -> Image.Image:
     assert amount >= 0
 
     amount = 1 - min(amount, 1)
-    matrix = (
+
+    return (
         0.393 + 0.607 * amount,
         0.769 - 0.769 * amount,
         0.189 - 0.189 * amount,
@@ -62,5 +55,31 @@ def sepia(im: Image.Image, amount: float = 1) -> Image.Image:
         0,
     )
 
-    sepia_toned = util.or_convert(im, "RGB").convert("RGB", matrix)
-    return util.or_convert(sepia_toned, im.mode)
+
+def sepia(im: Image.Image, amount: float = 1) -> Image.Image:
+    """Converts image to sepia.
+
+    A sepia operation is equivalent to the following matrix operation:
+
+    | R' |     |0.393+0.607s  0.769-0.769s  0.189-0.189s 0  0 |   | R |
+    | G' |     |0.349-0.349s  0.686+0.314s  0.168-0.168s 0  0 |   | G |
+    | B' |  =  |0.272-0.272g  0.534-0.534g  0.131+0.869g 0  0 | * | B |
+    | A' |     |          0             0             0  1  0 |   | A |
+    | 1  |     |          0             0             0  0  1 |   | 1 |
+
+    See the W3C document:
+    https://www.w3.org/TR/filter-effects-1/#sepiaEquivalent
+
+    Arguments:
+        im: An input image.
+        amount: An optional number. The filter amount (percentage).
+            Defaults to 1.
+
+    Returns:
+        The output image.
+
+    Raises:
+        AssertionError: if `amount` is less than 0.
+    """
+
+    return util.apply_color_matrix(im, sepia_matrix(amount))
@@ -72,3 +72,16 @@ def test_brightness_hsv() -> None:
     assert list(im_b.get_flattened_data()) == list(im_b2_rgb.get_flattened_data())
     assert im_b2.size == im2.size
     assert im_b2.mode == im2.mode
+
+
+def test_brightness_lut() -> None:
+    im = util.fill((4, 4), (174, 56, 3))
+    im_b = util.apply_lut(im, css.brightness_lut(1.5))
+
+    assert im_b == css.brightness(im, 1.5)
+    assert css.brightness_lut(1.5)[255] == 255  # clipped
+
+
+def test_brightness_lut_less_than_0() -> None:
+    with pytest.raises(AssertionError):
+        css.brightness_lut(-1)
@@ -78,3 +78,25 @@ def test_contrast_hsv() -> None:
     )
     assert contrasted_im2.size == im2.size
     assert contrasted_im2.mode == im2.mode
+
+
+def test_contrast_lut() -> None:
+    im = util.fill((4, 4), (174, 56, 3))
+    contrasted_im = util.apply_lut(im, css.contrast_lut(2))
+
+    assert contrasted_im == css.contrast(im, 2)
+    assert css.contrast_lut(2)[0] == 0  # clipped
+    assert css.contrast_lut(2)[255] == 255  # clipped
+
+
+def test_contrast_lut_with_brightness_lut() -> None:
+    im = util.fill((4, 4), (174, 56, 3))
+    actual = util.apply_lut(im, css.contrast_lut(1.5), css.brightness_lut(1.2))
+    expected = css.brightness(css.contrast(im, 1.5), 1.2)
+
+    assert actual == expected
+
+
+def test_contrast_lut_less_than_0() -> None:
+    with pytest.raises(AssertionError):
+        css.contrast_lut(-1)
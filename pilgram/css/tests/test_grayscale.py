@@ -76,3 +76,16 @@ def test_grayscale_hsv() -> None:
     )
     assert grayscaled_im2.size == im2.size
     assert grayscaled_im2.mode == im2.mode
+
+
+def test_grayscale_matrix() -> None:
+    im = util.fill((4, 4), (174, 56, 3))
+    matrix = css.grayscale_matrix(0.5)
+
+    assert len(matrix) == 12
+    assert im.convert("RGB", matrix) == css.grayscale(im, 0.5)
+
+
+def test_grayscale_matrix_less_than_0() -> None:
+    with pytest.raises(AssertionError):
+        css.grayscale_matrix(-1)
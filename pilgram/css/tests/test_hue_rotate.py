@@ -85,3 +85,11 @@ def test_hue_rotate_hsv() -> None:
     assert hue_rotated_im_data == hue_rotated_im2_rgb_data
     assert hue_rotated_im2.size == im2.size
     assert hue_rotated_im2.mode == im2.mode
+
+
+def test_hue_rotate_matrix() -> None:
+    im = util.fill((4, 4), (174, 56, 3))
+    matrix = css.hue_rotate_matrix(90)
+
+    assert len(matrix) == 12
+    assert im.convert("RGB", matrix) == css.hue_rotate(im, 90)
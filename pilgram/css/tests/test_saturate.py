@@ -79,3 +79,16 @@ def test_saturate_hsv() -> None:
     )
     assert saturated_im2.size == im2.size
     assert saturated_im2.mode == im2.mode
+
+
+def test_saturate_matrix() -> None:
+    im = util.fill((4, 4), (174, 56, 3))
+    matrix = css.saturate_matrix(0.5)
+
+    assert len(matrix) == 12
+    assert im.convert("RGB", matrix) == css.saturate(im, 0.5)
+
+
+def test_saturate_matrix_less_than_0() -> None:
+    with pytest.raises(AssertionError):
+        css.saturate_matrix(-1)
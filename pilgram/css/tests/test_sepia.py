@@ -76,3 +76,16 @@ def test_sepia_hsv() -> None:
     )
     assert sepiaed_im2.size == im2.size
     assert sepiaed_im2.mode == im2.mode
+
+
+def test_sepia_matrix() -> None:
+    im = util.fill((4, 4), (174, 56, 3))
+    matrix = css.sepia_matrix(0.5)
+
+    assert len(matrix) == 12
+    assert im.convert("RGB", matrix) == css.sepia(im, 0.5)
+
+
+def test_sepia_matrix_less_than_0() -> None:
+    with pytest.raises(AssertionError):
+        css.sepia_matrix(-1)
@@ -14,27 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def earlybird(im: Image.Image) -> Image.Image:
+def earlybird(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Earlybird filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.radial_gradient(
-        cb.size, [(208, 186, 142), (54, 3, 9), (29, 2, 16)], [0.2, 0.85, 1]
-    )
-    cr = css.blending.overlay(cb, cs)
-
-    cr = css.contrast(cr, 0.9)
-    cr = css.sepia(cr, 0.2)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["earlybird"], im, intensity=intensity)
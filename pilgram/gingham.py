@@ -14,25 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def gingham(im: Image.Image) -> Image.Image:
+def gingham(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Gingham filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.fill(cb.size, (230, 230, 250))
-    cr = css.blending.soft_light(cb, cs)
-
-    cr = css.brightness(cr, 1.05)
-    cr = css.hue_rotate(cr, -10)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["gingham"], im, intensity=intensity)
@@ -0,0 +1,51 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from pilgram.graph import ops, spatial, specs  # noqa
+from pilgram.graph.evaluate import evaluate
+from pilgram.graph.execute import execute
+from pilgram.graph.nodes import (
+    Blend,
+    Composite,
+    Fill,
+    Input,
+    LinearGradient,
+    LinearGradientMask,
+    Matrix,
+    Node,
+    Opacity,
+    Point,
+    RadialGradient,
+    RadialGradientMask,
+)
+from pilgram.graph.optimize import optimize
+
+__all__ = [
+    "Blend",
+    "Composite",
+    "Fill",
+    "Input",
+    "LinearGradient",
+    "LinearGradientMask",
+    "Matrix",
+    "Node",
+    "Opacity",
+    "Point",
+    "RadialGradient",
+    "RadialGradientMask",
+    "evaluate",
+    "execute",
+    "optimize",
+]
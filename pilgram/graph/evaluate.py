@@ -0,0 +1,226 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections.abc import Callable
+
+from PIL import Image
+
+from pilgram import css, util
+from pilgram.graph.nodes import (
+    Blend,
+    Composite,
+    Fill,
+    Input,
+    LinearGradient,
+    LinearGradientMask,
+    Matrix,
+    Node,
+    Opacity,
+    Point,
+    RadialGradient,
+    RadialGradientMask,
+)
+from pilgram.types import Layer
+
+
+def _evaluate(
+    node: Node, cb: Image.Image, memo: dict[Node, Image.Image]
+) -> Image.Image:
+    """Evaluates a node with memoization"""
+
+    if node in memo:
+        return memo[node]
+
+    def arg(child: Node) -> Image.Image:
+        return _evaluate(child, cb, memo)
+
+    def layer(child: Node) -> Layer:
+        if isinstance(child, Fill) and child not in memo:
+            return child.color  # NOTE: consumed without filling
+        return arg(child)
+
+    im: Image.Image
+    match node:
+        case Input():
+            im = cb
+        case Fill():
+            im = util.fill(cb.size, node.color)
+        case RadialGradient():
+            im = util.radial_gradient(cb.size, node.colors, node.positions)
+        case LinearGradient():
+            im = util.linear_gradient(cb.size, node.start, node.end, node.is_horizontal)
+        case RadialGradientMask():
+            im = util.radial_gradient_mask(
+                cb.size, node.length, node.scale, node.center
+            )
+        case LinearGradientMask():
+            im = util.linear_gradient_mask(
+                cb.size, node.start, node.end, node.is_horizontal
+            )
+        case Opacity(backdrop=backdrop, layer=Blend() as blend) if (
+            blend.backdrop == backdrop and blend not in memo
+        ):
+            # NOTE: the opacity is applied inside the blending
+            im = _blend(blend, cb, memo, opacity=node.opacity)
+        case Composite(
+            image1=Opacity(backdrop=backdrop, layer=Blend() as blend) as faded,
+            image2=image2,
+        ) if (
+            image2 == backdrop
+            and blend.backdrop == backdrop
+            and blend not in memo
+            and faded not in memo
+        ):
+            # NOTE: both the opacity and the mask are applied inside the blending
+            im = _blend(blend, cb, memo, opacity=faded.opacity, mask=arg(node.mask))
+        case Composite(image1=Blend() as blend, image2=backdrop) if (
+            blend.backdrop == backdrop and blend not in memo
+        ):
+            im = _blend(blend, cb, memo, mask=arg(node.mask))
+        case Blend():
+            im = _blend(node, cb, memo)
+        case Composite():
+            im1, im2 = layer(node.image1), layer(node.image2)
+            im = util.composite(im1, im2, arg(node.mask))
+        case Opacity():
+            im1, im2 = layer(node.backdrop), layer(node.layer)
+            if isinstance(im1, tuple) and isinstance(im2, tuple):
+                im1 = arg(node.backdrop)
+            im = util.blend(im1, im2, node.opacity)
+        case Point():
+            im = util.apply_lut(arg(node.image), node.lut)
+        case Matrix():
+            im = util.apply_color_matrix(arg(node.image), *node.matrices)
+        case _:
+            raise ValueError(f"Unsupported node: {type(node).__name__}")
+
+    memo[node] = im
+    return im
+
+
+def _blend(
+    node: Blend,
+    cb: Image.Image,
+    memo: dict[Node, Image.Image],
+    opacity: float = 1,
+    mask: Image.Image | None = None,
+) -> Image.Image:
+    """Evaluates a blend node, optionally with an opacity and a mask"""
+
+    blending: Callable[..., Image.Image] = getattr(css.blending, node.mode)
+    backdrop = _evaluate(node.backdrop, cb, memo)
+    source = node.source
+    if isinstance(source, Fill) and source not in memo:
+        return blending(backdrop, source.color, opacity, mask)
+    elif (
+        isinstance(source, LinearGradient)
+        and not source.is_horizontal
+        and source not in memo
+    ):
+        # NOTE: blend a single column repeated over the backdrop
+        size = (1, backdrop.height)
+        strip = util.linear_gradient(size, source.start, source.end, False)
+        return blending(backdrop, strip, opacity, mask)
+
+    return blending(backdrop, _evaluate(source, cb, memo), opacity, mask)
+
+
+def _is_grayscale(node: Node) -> bool:
+    """Returns True if every band of the node output is the same.
+
+    That is, the node is a color matrix whose last matrix outputs the same
+    value to every band (e.g. grayscale), followed by any LUTs.
+    """
+
+    match node:
+        case Point():
+            return _is_grayscale(node.image)
+        case Matrix():
+            matrix = node.matrices[-1]
+            return matrix[0:4] == matrix[4:8] == matrix[8:12]
+        case _:
+            return False
+
+
+def _evaluate_grayscale(
+    node: Node, cb: Image.Image, memo: dict[Node, Image.Image]
+) -> Image.Image:
+    """Evaluates a grayscale node (see `_is_grayscale`) as an L image"""
+
+    if node in memo:
+        # NOTE: converting equal bands to L keeps the values
+        return memo[node].convert("L")
+
+    match node:
+        case Point():
+            im = _evaluate_grayscale(node.image, cb, memo)
+            return util.apply_lut(im, node.lut)
+        case Matrix():
+            im = _evaluate(node.image, cb, memo)
+            return util.apply_color_matrix(im, *node.matrices, mode="L")
+        case _:
+            raise ValueError(f"Unsupported node: {type(node).__name__}")
+
+
+def _evaluate_output(
+    node: Node, cb: Image.Image, memo: dict[Node, Image.Image], mode: str
+) -> Image.Image:
+    """Evaluates the output node of a filter graph in the mode.
+
+    A grayscale output is evaluated as a single band and expanded
+    to RGB only if requested.
+    """
+
+    if mode not in ("RGB", "L"):
+        raise ValueError(f"Unsupported mode: {mode!r}")
+
+    if not _is_grayscale(node):
+        if mode == "L":
+            raise ValueError("The graph does not output grayscale")
+        im = _evaluate(node, cb, memo)
+        # NOTE: never return the input itself (e.g. at zero intensity)
+        return cb.copy() if im is cb else im
+
+    im = _evaluate_grayscale(node, cb, memo)
+    if mode == "L":
+        return im
+
+    # NOTE: `merge` is faster than `convert` to expand a single band
+    return Image.merge("RGB", (im, im, im))
+
+
+def evaluate(node: Node, im: Image.Image, mode: str = "RGB") -> Image.Image:
+    """Evaluates a filter graph as written.
+
+    Identical subgraphs (e.g. the same mask used twice) are evaluated once.
+    If the graph ends in a grayscale color matrix (and any LUTs after it),
+    that part is evaluated as a single band.
+
+    Arguments:
+        node: The output node of a filter graph.
+        im: An input image.
+        mode: An optional string. The output mode (RGB or L).
+            L is only supported for graphs ending in grayscale.
+            Defaults to RGB.
+
+    Returns:
+        The output image.
+
+    Raises:
+        ValueError: if the graph contains an unsupported node
+            or `mode` is not supported.
+    """
+
+    return _evaluate_output(node, util.or_convert(im, "RGB"), {}, mode)
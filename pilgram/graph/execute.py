@@ -0,0 +1,68 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from PIL import Image
+
+from pilgram.graph.evaluate import evaluate
+from pilgram.graph.nodes import Input, Node, Opacity
+from pilgram.graph.optimize import optimize
+from pilgram.graph.spatial import evaluate_fused
+
+
+def execute(
+    node: Node,
+    im: Image.Image,
+    optimized: bool = True,
+    mode: str = "RGB",
+    intensity: float = 1,
+) -> Image.Image:
+    """Executes a filter graph.
+
+    A partial intensity puts the output over the input as an `Opacity` node,
+    so the mix is optimized with the rest of the graph: it is tabulated
+    into the final LUT or table lookup where the graph is separable
+    (see `spatial`), and costs an extra `Image.blend` pass only elsewhere.
+
+    Arguments:
+        node: The output node of a filter graph.
+        im: An input image.
+        optimized: An optional boolean. Optimizes the graph before evaluation
+            and fuses its separable subgraphs if True
+            (see `optimize` and `spatial.evaluate_fused`). Defaults to True.
+        mode: An optional string. The output mode (RGB or L).
+            L is only supported for graphs ending in grayscale
+            (see `evaluate`). Defaults to RGB.
+        intensity: An optional float between 0 and 1. The strength of
+            the graph, mixing the output with the input as `Image.blend`.
+            Defaults to 1.
+
+    Returns:
+        The output image.
+
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+        ValueError: if the graph contains an unsupported node
+            or `mode` is not supported.
+    """
+
+    assert 0 <= intensity <= 1
+
+    if intensity != 1:
+        node = Opacity(Input(), node, intensity)
+
+    if optimized:
+        return evaluate_fused(optimize(node), im, mode)
+    else:
+        return evaluate(node, im, mode)
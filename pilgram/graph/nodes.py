@@ -0,0 +1,161 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from dataclasses import dataclass
+
+from pilgram.types import ColorMatrix, RGBAColor, RGBColor
+
+BLEND_MODES = (
+    "color",
+    "color_burn",
+    "color_dodge",
+    "darken",
+    "difference",
+    "exclusion",
+    "hard_light",
+    "hue",
+    "lighten",
+    "multiply",
+    "normal",
+    "overlay",
+    "screen",
+    "soft_light",
+)
+
+
+@dataclass(frozen=True)
+class Node:
+    """A node of a filter graph.
+
+    Nodes are immutable and compared by value,
+    so identical subgraphs are evaluated only once.
+    """
+
+
+@dataclass(frozen=True)
+class Input(Node):
+    """The input image converted to RGB."""
+
+
+@dataclass(frozen=True)
+class Fill(Node):
+    """A layer filled with a color (see `util.fill`)."""
+
+    color: RGBColor | RGBAColor
+
+
+@dataclass(frozen=True)
+class RadialGradient(Node):
+    """A radial gradient layer (see `util.radial_gradient`)."""
+
+    colors: tuple[RGBColor, ...]
+    positions: tuple[float, ...] | None = None
+
+
+@dataclass(frozen=True)
+class LinearGradient(Node):
+    """A linear gradient layer (see `util.linear_gradient`)."""
+
+    start: RGBColor
+    end: RGBColor
+    is_horizontal: bool = True
+
+
+@dataclass(frozen=True)
+class RadialGradientMask(Node):
+    """A radial gradient mask (see `util.radial_gradient_mask`)."""
+
+    length: float = 0
+    scale: float = 1
+    center: tuple[float, float] = (0.5, 0.5)
+
+
+@dataclass(frozen=True)
+class LinearGradientMask(Node):
+    """A linear gradient mask (see `util.linear_gradient_mask`)."""
+
+    start: float = 0
+    end: float = 1
+    is_horizontal: bool = True
+
+
+@dataclass(frozen=True)
+class Blend(Node):
+    """Blends a source over a backdrop (see `css.blending`)."""
+
+    mode: str
+    backdrop: Node
+    source: Node
+
+    def __post_init__(self) -> None:
+        if self.mode not in BLEND_MODES:
+            raise ValueError(f"Unsupported blend mode: {self.mode}")
+
+
+@dataclass(frozen=True)
+class Composite(Node):
+    """Selects `image1` where the mask is white (see `Image.composite`)."""
+
+    image1: Node
+    image2: Node
+    mask: Node
+
+
+@dataclass(frozen=True)
+class Opacity(Node):
+    """Puts a layer over a backdrop with an opacity (see `Image.blend`)."""
+
+    backdrop: Node
+    layer: Node
+    opacity: float
+
+
+@dataclass(frozen=True)
+class Point(Node):
+    """Applies a 256-entry LUT to every band (see `util.apply_lut`)."""
+
+    image: Node
+    lut: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class Matrix(Node):
+    """Applies color matrices in order (see `util.apply_color_matrix`)."""
+
+    image: Node
+    matrices: tuple[ColorMatrix, ...]
+
+
+def children(node: Node) -> tuple[Node, ...]:
+    """Returns the input nodes of a node.
+
+    Arguments:
+        node: A node.
+
+    Returns:
+        A tuple of nodes.
+    """
+
+    match node:
+        case Blend():
+            return (node.backdrop, node.source)
+        case Composite():
+            return (node.image1, node.image2, node.mask)
+        case Opacity():
+            return (node.backdrop, node.layer)
+        case Point() | Matrix():
+            return (node.image,)
+        case _:
+            return ()
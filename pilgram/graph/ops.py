@@ -0,0 +1,49 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Builders of color operation nodes, named after `pilgram.css`."""
+
+from pilgram import css
+from pilgram.graph.nodes import Matrix, Node, Point
+
+
+def brightness(image: Node, amount: float = 1) -> Node:
+    """Returns a node adjusting the brightness (see `css.brightness`)."""
+    return Point(image, tuple(css.brightness_lut(amount)))
+
+
+def contrast(image: Node, amount: float = 1) -> Node:
+    """Returns a node adjusting the contrast (see `css.contrast`)."""
+    return Point(image, tuple(css.contrast_lut(amount)))
+
+
+def grayscale(image: Node, amount: float = 1) -> Node:
+    """Returns a node converting to grayscale (see `css.grayscale`)."""
+    return Matrix(image, (css.grayscale_matrix(amount),))
+
+
+def hue_rotate(image: Node, deg: float = 0) -> Node:
+    """Returns a node rotating the hue (see `css.hue_rotate`)."""
+    return Matrix(image, (css.hue_rotate_matrix(deg),))
+
+
+def saturate(image: Node, amount: float = 1) -> Node:
+    """Returns a node saturating the colors (see `css.saturate`)."""
+    return Matrix(image, (css.saturate_matrix(amount),))
+
+
+def sepia(image: Node, amount: float = 1) -> Node:
+    """Returns a node converting to sepia (see `css.sepia`)."""
+    return Matrix(image, (css.sepia_matrix(amount),))
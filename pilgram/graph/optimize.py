@@ -0,0 +1,209 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections.abc import Callable
+from dataclasses import fields, replace
+from functools import lru_cache
+
+from PIL import Image
+
+from pilgram import util
+from pilgram.graph.evaluate import evaluate
+from pilgram.graph.nodes import (
+    Blend,
+    Composite,
+    Fill,
+    LinearGradientMask,
+    Matrix,
+    Node,
+    Opacity,
+    Point,
+    RadialGradientMask,
+    children,
+)
+from pilgram.types import ColorMatrix
+
+IDENTITY_LUT = tuple(range(256))
+
+
+def _is_constant(node: Node) -> bool:
+    """Returns True if the node is the same color everywhere"""
+
+    match node:
+        case Fill():
+            return True
+        case Blend() | Opacity() | Point() | Matrix():
+            return all(_is_constant(child) for child in children(node))
+        case _:
+            return False
+
+
+def _is_rgb(node: Node) -> bool:
+    """Returns True if the node is evaluated to an RGB image"""
+
+    match node:
+        case Fill():
+            return len(node.color) == 3
+        case Composite():
+            return _is_rgb(node.image1) and _is_rgb(node.image2)
+        case Opacity():
+            return _is_rgb(node.backdrop) and _is_rgb(node.layer)
+        case Point() | Matrix():
+            return _is_rgb(node.image)
+        case RadialGradientMask() | LinearGradientMask():
+            return False
+        case _:
+            return True
+
+
+def _is_identity_matrix(matrix: ColorMatrix) -> bool:
+    """Returns True if the matrix does not change 8-bit colors"""
+
+    identity = util.compose_color_matrices()
+    return all(abs(x - y) < 1e-6 for x, y in zip(matrix, identity, strict=True))
+
+
+def fold_constants(node: Node) -> Node:
+    """Replaces a color operation on fill layers with a single fill layer.
+
+    Arguments:
+        node: A node whose children are already optimized.
+
+    Returns:
+        The optimized node.
+    """
+
+    if isinstance(node, Fill) or not _is_constant(node):
+        return node
+
+    pixel = evaluate(node, Image.new("RGB", (1, 1))).getpixel((0, 0))
+    assert isinstance(pixel, tuple)
+
+    if len(pixel) == 3:
+        return Fill((pixel[0], pixel[1], pixel[2]))
+    else:
+        return Fill((pixel[0], pixel[1], pixel[2], pixel[3] / 255))
+
+
+def remove_noops(node: Node) -> Node:
+    """Removes a stage which does not change its input.
+
+    Arguments:
+        node: A node whose children are already optimized.
+
+    Returns:
+        The optimized node.
+    """
+
+    match node:
+        case Point() if node.lut == IDENTITY_LUT:
+            return node.image
+        case Matrix():
+            matrices = tuple(m for m in node.matrices if not _is_identity_matrix(m))
+            if not matrices:
+                return node.image
+            if matrices != node.matrices:
+                return Matrix(node.image, matrices)
+        case Opacity() if node.opacity == 0 or node.backdrop == node.layer:
+            return node.backdrop
+        case Opacity() if node.opacity == 1:
+            return node.layer
+        case Composite() if node.image1 == node.image2:
+            return node.image1
+        case Blend(source=Fill(color=(_, _, _, 0))) if _is_rgb(node.backdrop):
+            return node.backdrop
+
+    return node
+
+
+def fuse_color_ops(node: Node) -> Node:
+    """Merges adjacent LUTs, adjacent color matrices and nested opacities.
+
+    LUTs are composed into one (see `util.compose_luts`). Color matrices are
+    merged into one chain, which `util.apply_color_matrix` multiplies
+    where it can not change the result. A layer put over a backdrop twice
+    is put once with the product of the opacities, which skips rounding
+    the inner mix (at most 1 of 255 apart).
+
+    Arguments:
+        node: A node whose children are already optimized.
+
+    Returns:
+        The optimized node.
+    """
+
+    match node:
+        case Point(image=Point()):
+            inner = node.image
+            assert isinstance(inner, Point)
+            return Point(inner.image, tuple(util.compose_luts(inner.lut, node.lut)))
+        case Matrix(image=Matrix()):
+            inner = node.image
+            assert isinstance(inner, Matrix)
+            return Matrix(inner.image, inner.matrices + node.matrices)
+        case Opacity(layer=Opacity()):
+            inner = node.layer
+            assert isinstance(inner, Opacity)
+            if inner.backdrop == node.backdrop:
+                opacity = inner.opacity * node.opacity
+                return Opacity(node.backdrop, inner.layer, opacity)
+
+    return node
+
+
+PASSES: tuple[Callable[[Node], Node], ...] = (
+    fold_constants,
+    remove_noops,
+    fuse_color_ops,
+)
+
+
+def _map_children(node: Node, fn: Callable[[Node], Node]) -> Node:
+    """Returns the node with its children replaced"""
+
+    changes = {}
+    for field in fields(node):
+        value = getattr(node, field.name)
+        if isinstance(value, Node):
+            changes[field.name] = fn(value)
+
+    return replace(node, **changes) if changes else node
+
+
+@lru_cache(maxsize=256)
+def optimize(node: Node) -> Node:
+    """Optimizes a filter graph.
+
+    The passes in `PASSES` are applied to every node from the leaves up,
+    until nothing changes.
+
+    Arguments:
+        node: The output node of a filter graph.
+
+    Returns:
+        The output node of the optimized graph.
+    """
+
+    node = _map_children(node, optimize)
+
+    while True:
+        rewritten = node
+        for pass_ in PASSES:
+            rewritten = pass_(rewritten)
+
+        if rewritten == node:
+            return node
+
+        node = rewritten
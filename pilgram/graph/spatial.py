@@ -0,0 +1,348 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Fused evaluation of the separable parts of filter graphs.
+
+A subgraph made only of per-band stages (separable blends, composites,
+opacities and LUTs) over the input and gradient masks computes each output
+band from the same input band and the mask levels at the pixel. For every
+combination of mask levels, it is a precompiled per-band LUT. The whole
+subgraph is therefore tabulated once on a small grid of input values and
+mask levels, and then applied in a single table lookup per band, instead
+of a full-size image for every stage. A subgraph without masks is a single
+per-band LUT.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+from pilgram import util
+from pilgram.graph.evaluate import _evaluate, _evaluate_output
+from pilgram.graph.nodes import (
+    Blend,
+    Composite,
+    Fill,
+    Input,
+    LinearGradient,
+    LinearGradientMask,
+    Node,
+    Opacity,
+    Point,
+    RadialGradient,
+    RadialGradientMask,
+    children,
+)
+
+SEPARABLE_MODES = frozenset(
+    {
+        "color_burn",
+        "color_dodge",
+        "darken",
+        "difference",
+        "exclusion",
+        "hard_light",
+        "lighten",
+        "multiply",
+        "normal",
+        "overlay",
+        "screen",
+        "soft_light",
+    }
+)
+
+# NOTE: the maximum number of combinations of mask levels to tabulate
+MAX_LEVELS = 1024
+
+# NOTE: the relative costs of the stages in full-image LUT passes, measured
+#       with Pillow and NumPy. Blends of two images through a 65536-entry
+#       table (see `css.blending.separable`) are the most costly.
+LOOKUP_MODES = frozenset(
+    {"color_burn", "color_dodge", "exclusion", "hard_light", "overlay", "soft_light"}
+)
+LOOKUP_BLEND_COST = 4.0
+BLEND_COST = 1.5
+COMPOSITE_COST = 1.5
+STAGE_COST = 1.0
+
+# NOTE: the costs of a table lookup per band, by the number of masks.
+#       Without masks, the table is applied as a LUT by `Image.point`.
+KERNEL_COSTS = {0: STAGE_COST, 1: 4.5, 2: 10.0}
+
+
+def _field(node: Node) -> Node | None:
+    """Returns the mask which determines a spatial leaf, or None"""
+
+    match node:
+        case RadialGradientMask() | LinearGradientMask():
+            return node
+        case RadialGradient():
+            n = len(node.colors)
+            positions = node.positions or tuple(np.linspace(0, 1, n))
+            return RadialGradientMask(length=positions[0], scale=positions[-1])
+        case LinearGradient():
+            return LinearGradientMask(is_horizontal=node.is_horizontal)
+        case _:
+            return None
+
+
+def is_separable(node: Node) -> bool:
+    """Returns True if each output band of the node depends only on
+    the same band of the input and the levels of gradient masks.
+
+    Arguments:
+        node: A node.
+
+    Returns:
+        A boolean.
+    """
+
+    match node:
+        case Input() | Fill():
+            return True
+        case Blend() if node.mode not in SEPARABLE_MODES:
+            return False
+        case Blend() | Composite() | Opacity() | Point():
+            return all(is_separable(child) for child in children(node))
+        case _:
+            return _field(node) is not None
+
+
+def _fields(node: Node) -> tuple[Node, ...]:
+    """Returns the distinct masks which determine the spatial leaves"""
+
+    field = _field(node)
+    if field is not None:
+        return (field,)
+
+    fields = (f for child in children(node) for f in _fields(child))
+    return tuple(dict.fromkeys(fields))
+
+
+def cost(node: Node) -> float:
+    """Estimates the cost of evaluating a separable subgraph stage by stage.
+
+    Arguments:
+        node: The output node of a separable subgraph.
+
+    Returns:
+        The cost in full-image LUT passes.
+    """
+
+    nodes: set[Node] = set()
+
+    def visit(node: Node) -> None:
+        if node not in nodes:
+            nodes.add(node)
+            for child in children(node):
+                visit(child)
+
+    visit(node)
+
+    total = 0.0
+    for n in nodes:
+        match n:
+            case Blend(source=Fill()) | Opacity() | Point():
+                total += STAGE_COST
+            case Blend(source=LinearGradient(is_horizontal=False)):
+                # NOTE: blended as a single column (see `evaluate`)
+                total += STAGE_COST
+            case Blend() if n.mode in LOOKUP_MODES:
+                total += LOOKUP_BLEND_COST
+            case Blend():
+                total += BLEND_COST
+            case Composite():
+                total += COMPOSITE_COST
+            case RadialGradient() | LinearGradient():
+                total += STAGE_COST
+
+    return total
+
+
+def frontier(node: Node) -> tuple[Node, ...]:
+    """Returns the largest separable subgraphs of more than a single leaf.
+
+    Arguments:
+        node: The output node of a filter graph.
+
+    Returns:
+        A tuple of the distinct output nodes of the subgraphs.
+    """
+
+    if not children(node):
+        return ()
+
+    if is_separable(node):
+        return (node,)
+
+    nodes = (n for child in children(node) for n in frontier(child))
+    return tuple(dict.fromkeys(nodes))
+
+
+def _grid_leaf(node: Node, levels: np.ndarray) -> Image.Image:
+    """Returns a spatial leaf evaluated for each row of mask levels"""
+
+    mask = Image.fromarray(np.repeat(levels[:, None], 256, axis=1))
+
+    match node:
+        case RadialGradient():
+            n = len(node.colors)
+            positions = node.positions or tuple(np.linspace(0, 1, n))
+            return util.apply_color_ramp(mask, util.color_ramp(node.colors, positions))
+        case LinearGradient():
+            lut = util.color_ramp([node.start, node.end], [0, 1])
+            return util.apply_color_ramp(mask, lut)
+        case _:
+            return mask
+
+
+def _leaves(node: Node) -> tuple[Node, ...]:
+    """Returns the distinct spatial leaves of the node"""
+
+    if _field(node) is not None:
+        return (node,)
+
+    leaves = (leaf for child in children(node) for leaf in _leaves(child))
+    return tuple(dict.fromkeys(leaves))
+
+
+@lru_cache(maxsize=64)
+def tabulate(node: Node, levels: bytes) -> np.ndarray:
+    """Evaluates a separable subgraph for every input value and mask level.
+
+    Arguments:
+        node: The output node of a separable subgraph (see `is_separable`).
+        levels: A (J, F) uint8 array of the levels of the F masks of
+            the subgraph (see `frontier`) as bytes, one row per combination.
+            A subgraph without masks takes a single row of a zero level.
+
+    Returns:
+        A read-only (3, J x 256) uint8 array. The band b of a pixel whose
+        input value is c with the mask levels of the row j is
+        `table[b, j x 256 + c]`.
+    """
+
+    fields = _fields(node)
+    rows = np.frombuffer(levels, dtype=np.uint8).reshape(-1, max(len(fields), 1))
+    ramp = np.tile(np.arange(256, dtype=np.uint8), (len(rows), 1))
+
+    cb = Image.merge("RGB", [Image.fromarray(ramp)] * 3)
+    memo = {
+        leaf: _grid_leaf(leaf, rows[:, fields.index(_field(leaf))])
+        for leaf in _leaves(node)
+    }
+    im = _evaluate(node, cb, memo)
+
+    table = np.asarray(util.or_convert(im, "RGB")).reshape(-1, 3).T.copy()
+    table.flags.writeable = False
+    return table
+
+
+def _levels(masks: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray] | None:
+    """Returns the combinations of mask levels and the row of each pixel"""
+
+    if len(masks) == 1:
+        levels = np.arange(256, dtype=np.uint8)[:, None]
+        return levels, masks[0]
+
+    if len(masks) != 2:
+        return None
+
+    with util.scratch_arena:
+        key = util.scratch_arena.empty(masks[0].shape, np.uint16)
+        np.left_shift(masks[0], 8, out=key, dtype=np.uint16)
+        key |= masks[1]
+        present = np.zeros(65536, dtype=bool)
+        present[key] = True
+        codes = np.flatnonzero(present)
+        if len(codes) > MAX_LEVELS:
+            return None
+
+        remap = np.zeros(65536, dtype=np.uint16)
+        remap[codes] = np.arange(len(codes))
+        levels = np.stack([codes >> 8, codes & 0xFF], axis=1).astype(np.uint8)
+        return levels, remap[key]
+
+
+def evaluate_separable(node: Node, cb: Image.Image) -> Image.Image | None:
+    """Evaluates a separable subgraph by table lookup.
+
+    Arguments:
+        node: The output node of a separable subgraph (see `frontier`).
+        cb: An input image (RGB only).
+
+    Returns:
+        The output image, or None if the subgraph depends on more than two
+        masks or on too many combinations of mask levels.
+    """
+
+    if not _fields(node):
+        table = tabulate(node, bytes(1))
+        return cb.point(table.ravel().tolist())
+
+    memo: dict[Node, Image.Image] = {}
+    masks = [np.asarray(_evaluate(f, cb, memo)) for f in _fields(node)]
+
+    found = _levels(masks)
+    if found is None:
+        return None
+
+    levels, rows = found
+    table = tabulate(node, levels.tobytes())
+
+    dtype = np.uint16 if len(levels) <= 256 else np.uint32
+    index = np.left_shift(rows, 8, dtype=dtype)
+    bands = [
+        Image.fromarray(band_table[index | np.asarray(band)])
+        for band_table, band in zip(table, cb.split(), strict=True)
+    ]
+    return Image.merge("RGB", bands)
+
+
+def evaluate_fused(node: Node, im: Image.Image, mode: str = "RGB") -> Image.Image:
+    """Evaluates a filter graph, fusing its separable subgraphs.
+
+    Each subgraph from `frontier` which costs no less stage by stage than
+    a table lookup is evaluated by `evaluate_separable`, and the rest of
+    the graph as `evaluate`. The output is the same.
+
+    Arguments:
+        node: The output node of a filter graph.
+        im: An input image.
+        mode: An optional string. The output mode (RGB or L, see `evaluate`).
+            Defaults to RGB.
+
+    Returns:
+        The output image.
+
+    Raises:
+        ValueError: if the graph contains an unsupported node
+            or `mode` is not supported.
+    """
+
+    cb = util.or_convert(im, "RGB")
+
+    memo: dict[Node, Image.Image] = {}
+    for subgraph in frontier(node):
+        kernel_cost = KERNEL_COSTS.get(len(_fields(subgraph)))
+        if kernel_cost is None or cost(subgraph) < kernel_cost:
+            continue
+
+        fused = evaluate_separable(subgraph, cb)
+        if fused is not None:
+            memo[subgraph] = fused
+
+    return _evaluate_output(node, cb, memo, mode)
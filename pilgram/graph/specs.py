@@ -0,0 +1,464 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""The built-in filters expressed as filter graphs.
+
+These graphs are the only definition of the built-in filters:
+each filter (e.g. `pilgram.clarendon`) executes its graph.
+"""
+
+from pilgram.graph.nodes import (
+    Blend,
+    Composite,
+    Fill,
+    Input,
+    LinearGradient,
+    LinearGradientMask,
+    Node,
+    Opacity,
+    RadialGradient,
+    RadialGradientMask,
+)
+from pilgram.graph.ops import (
+    brightness,
+    contrast,
+    grayscale,
+    hue_rotate,
+    saturate,
+    sepia,
+)
+
+
+def __1977() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((243, 106, 188, 0.3))
+    cr: Node = Blend("screen", cb, cs)
+
+    cr = contrast(cr, 1.1)
+    cr = brightness(cr, 1.1)
+    cr = saturate(cr, 1.3)
+
+    return cr
+
+
+def _aden() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((66, 10, 14))
+    cs = Blend("darken", cb, cs)
+
+    alpha_mask: Node = LinearGradientMask(start=0.8)
+    cr: Node = Composite(cs, cb, alpha_mask)
+
+    cr = hue_rotate(cr, -20)
+    cr = contrast(cr, 0.9)
+    cr = saturate(cr, 0.85)
+    cr = brightness(cr, 1.2)
+
+    return cr
+
+
+def _brannan() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((161, 44, 199, 0.31))
+    cr: Node = Blend("lighten", cb, cs)
+
+    cr = sepia(cr, 0.5)
+    cr = contrast(cr, 1.4)
+
+    return cr
+
+
+def _brooklyn() -> Node:
+    cb: Node = Input()
+
+    cs1: Node = Fill((168, 223, 193, 0.4))
+    cm1: Node = Blend("overlay", cb, cs1)
+
+    cs2: Node = Fill((196, 183, 200))
+    cm2: Node = Blend("overlay", cb, cs2)
+
+    gradient_mask: Node = RadialGradientMask(length=0.7)
+    cr: Node = Composite(cm1, cm2, gradient_mask)
+
+    cr = contrast(cr, 0.9)
+    cr = brightness(cr, 1.1)
+
+    return cr
+
+
+def _clarendon() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((127, 187, 227, 0.2))
+    cr: Node = Blend("overlay", cb, cs)
+
+    cr = contrast(cr, 1.2)
+    cr = saturate(cr, 1.35)
+
+    return cr
+
+
+def _earlybird() -> Node:
+    cb: Node = Input()
+
+    cs: Node = RadialGradient(
+        ((208, 186, 142), (54, 3, 9), (29, 2, 16)), (0.2, 0.85, 1)
+    )
+    cr: Node = Blend("overlay", cb, cs)
+
+    cr = contrast(cr, 0.9)
+    cr = sepia(cr, 0.2)
+
+    return cr
+
+
+def _gingham() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((230, 230, 250))
+    cr: Node = Blend("soft_light", cb, cs)
+
+    cr = brightness(cr, 1.05)
+    cr = hue_rotate(cr, -10)
+
+    return cr
+
+
+def _hudson() -> Node:
+    cb: Node = Input()
+
+    cs: Node = RadialGradient(((166, 177, 255), (52, 33, 52)), (0.5, 1))
+    cs = Blend("multiply", cb, cs)
+    cr: Node = Opacity(cb, cs, 0.5)
+
+    cr = brightness(cr, 1.2)
+    cr = contrast(cr, 0.9)
+    cr = saturate(cr, 1.1)
+
+    return cr
+
+
+def _inkwell() -> Node:
+    cb: Node = Input()
+
+    cr: Node = sepia(cb, 0.3)
+    cr = contrast(cr, 1.1)
+    cr = brightness(cr, 1.1)
+    cr = grayscale(cr)
+
+    return cr
+
+
+def _kelvin() -> Node:
+    cb: Node = Input()
+
+    cs1: Node = Fill((56, 44, 52))
+    cs: Node = Blend("color_dodge", cb, cs1)
+
+    cs2: Node = Fill((183, 125, 33))
+    cr: Node = Blend("overlay", cs, cs2)
+
+    return cr
+
+
+def _lark() -> Node:
+    cb: Node = Input()
+
+    cs1: Node = Fill((34, 37, 63))
+    cm1: Node = Blend("color_dodge", cb, cs1)
+
+    cs2: Node = Fill((242, 242, 242, 0.8))
+    cr: Node = Blend("darken", cm1, cs2)
+
+    cr = contrast(cr, 0.9)
+
+    return cr
+
+
+def _lofi() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((34, 34, 34))
+    cs = Blend("multiply", cb, cs)
+
+    mask: Node = RadialGradientMask(length=0.7, scale=1.5)
+    cr: Node = Composite(cb, cs, mask)
+
+    cr = saturate(cr, 1.1)
+    cr = contrast(cr, 1.5)
+
+    return cr
+
+
+def _maven() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((3, 230, 26, 0.2))
+    cr: Node = Blend("hue", cb, cs)
+
+    cr = sepia(cr, 0.25)
+    cr = brightness(cr, 0.95)
+    cr = contrast(cr, 0.95)
+    cr = saturate(cr, 1.5)
+
+    return cr
+
+
+def _mayfair() -> Node:
+    cb: Node = Input()
+    pos = (0.4, 0.4)
+
+    cs1: Node = Fill((255, 255, 255, 0.8))
+    cm1: Node = Blend("overlay", cb, cs1)
+
+    cs2: Node = Fill((255, 200, 200, 0.6))
+    cm2: Node = Blend("overlay", cb, cs2)
+
+    cs3: Node = Fill((17, 17, 17))
+    cm3: Node = Blend("overlay", cb, cs3)
+
+    mask1: Node = RadialGradientMask(scale=0.3, center=pos)
+    cs: Node = Composite(cm1, cm2, mask1)
+
+    mask2: Node = RadialGradientMask(length=0.3, scale=0.6, center=pos)
+    cs = Composite(cs, cm3, mask2)
+    cr: Node = Opacity(cb, cs, 0.4)
+
+    cr = contrast(cr, 1.1)
+    cr = saturate(cr, 1.1)
+
+    return cr
+
+
+def _moon() -> Node:
+    cb: Node = Input()
+
+    cs1: Node = Fill((160, 160, 160))
+    cs: Node = Blend("soft_light", cb, cs1)
+
+    cs2: Node = Fill((56, 56, 56))
+    cr: Node = Blend("lighten", cs, cs2)
+
+    cr = grayscale(cr)
+    cr = contrast(cr, 1.1)
+    cr = brightness(cr, 1.1)
+
+    return cr
+
+
+def _nashville() -> Node:
+    cb: Node = Input()
+
+    cs1: Node = Fill((247, 176, 153, 0.56))
+    cm1: Node = Blend("darken", cb, cs1)
+
+    cs2: Node = Fill((0, 70, 150, 0.4))
+    cr: Node = Blend("lighten", cm1, cs2)
+
+    cr = sepia(cr, 0.2)
+    cr = contrast(cr, 1.2)
+    cr = brightness(cr, 1.05)
+    cr = saturate(cr, 1.2)
+
+    return cr
+
+
+def _perpetua() -> Node:
+    cb: Node = Input()
+
+    cs: Node = LinearGradient((0, 91, 154), (230, 193, 61), False)
+    cs = Blend("soft_light", cb, cs)
+    cr: Node = Opacity(cb, cs, 0.5)
+
+    return cr
+
+
+def _reyes() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((239, 205, 173))
+    cs = Blend("soft_light", cb, cs)
+    cr: Node = Opacity(cb, cs, 0.5)
+
+    cr = sepia(cr, 0.22)
+    cr = brightness(cr, 1.1)
+    cr = contrast(cr, 0.85)
+    cr = saturate(cr, 0.75)
+
+    return cr
+
+
+def _rise() -> Node:
+    cb: Node = Input()
+
+    cs1: Node = Fill((236, 205, 169, 0.15))
+    cm1: Node = Blend("multiply", cb, cs1)
+
+    cs2: Node = Fill((50, 30, 7, 0.4))
+    cm2: Node = Blend("multiply", cb, cs2)
+
+    gradient_mask1: Node = RadialGradientMask(length=0.55)
+    cm: Node = Composite(cm1, cm2, gradient_mask1)
+
+    cs3: Node = Fill((232, 197, 152, 0.8))
+    cm3: Node = Blend("overlay", cm, cs3)
+    cm_: Node = Opacity(cm, cm3, 0.6)
+
+    gradient_mask2: Node = RadialGradientMask(scale=0.9)
+    cr: Node = Composite(cm_, cm, gradient_mask2)
+
+    cr = brightness(cr, 1.05)
+    cr = sepia(cr, 0.2)
+    cr = contrast(cr, 0.9)
+    cr = saturate(cr, 0.9)
+
+    return cr
+
+
+def _slumber() -> Node:
+    cb: Node = Input()
+
+    cs1: Node = Fill((69, 41, 12, 0.4))
+    cm: Node = Blend("lighten", cb, cs1)
+
+    cs2: Node = Fill((125, 105, 24, 0.5))
+    cr: Node = Blend("soft_light", cm, cs2)
+
+    cr = saturate(cr, 0.66)
+    cr = brightness(cr, 1.05)
+
+    return cr
+
+
+def _stinson() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((240, 149, 128, 0.2))
+    cr: Node = Blend("soft_light", cb, cs)
+
+    cr = contrast(cr, 0.75)
+    cr = saturate(cr, 0.85)
+    cr = brightness(cr, 1.15)
+
+    return cr
+
+
+def _toaster() -> Node:
+    cb: Node = Input()
+
+    cs: Node = RadialGradient(((128, 78, 15), (59, 0, 59)))
+    cr: Node = Blend("screen", cb, cs)
+
+    cr = contrast(cr, 1.5)
+    cr = brightness(cr, 0.9)
+
+    return cr
+
+
+def _valencia() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((58, 3, 57))
+    cs = Blend("exclusion", cb, cs)
+    cr: Node = Opacity(cb, cs, 0.5)
+
+    cr = contrast(cr, 1.08)
+    cr = brightness(cr, 1.08)
+    cr = sepia(cr, 0.08)
+
+    return cr
+
+
+def _walden() -> Node:
+    cb: Node = Input()
+
+    cs: Node = Fill((0, 68, 204))
+    cs = Blend("screen", cb, cs)
+    cr: Node = Opacity(cb, cs, 0.3)
+
+    cr = brightness(cr, 1.1)
+    cr = hue_rotate(cr, -10)
+    cr = sepia(cr, 0.3)
+    cr = saturate(cr, 1.6)
+
+    return cr
+
+
+def _willow() -> Node:
+    cb: Node = Input()
+
+    cs1: Node = RadialGradient(((212, 169, 175), (0, 0, 0)), (0.55, 1.5))
+    cm1: Node = Blend("overlay", cb, cs1)
+
+    cs2: Node = Fill((216, 205, 203))
+    cr: Node = Blend("color", cm1, cs2)
+
+    cr = grayscale(cr, 0.5)
+    cr = contrast(cr, 0.95)
+    cr = brightness(cr, 0.9)
+
+    return cr
+
+
+def _xpro2() -> Node:
+    cb: Node = Input()
+
+    cs1: Node = Fill((230, 231, 224))
+    cs2: Node = Fill((43, 42, 161))
+    cs2 = Opacity(cb, cs2, 0.6)
+
+    gradient_mask: Node = RadialGradientMask(length=0.4, scale=1.1)
+    cs: Node = Composite(cs1, cs2, gradient_mask)
+
+    cm1: Node = Blend("color_burn", cb, cs)
+    cm2: Node = Opacity(cb, cm1, 0.6)
+
+    cr: Node = Composite(cm1, cm2, gradient_mask)
+    cr = sepia(cr, 0.3)
+
+    return cr
+
+
+SPECS: dict[str, Node] = {
+    "_1977": __1977(),
+    "aden": _aden(),
+    "brannan": _brannan(),
+    "brooklyn": _brooklyn(),
+    "clarendon": _clarendon(),
+    "earlybird": _earlybird(),
+    "gingham": _gingham(),
+    "hudson": _hudson(),
+    "inkwell": _inkwell(),
+    "kelvin": _kelvin(),
+    "lark": _lark(),
+    "lofi": _lofi(),
+    "maven": _maven(),
+    "mayfair": _mayfair(),
+    "moon": _moon(),
+    "nashville": _nashville(),
+    "perpetua": _perpetua(),
+    "reyes": _reyes(),
+    "rise": _rise(),
+    "slumber": _slumber(),
+    "stinson": _stinson(),
+    "toaster": _toaster(),
+    "valencia": _valencia(),
+    "walden": _walden(),
+    "willow": _willow(),
+    "xpro2": _xpro2(),
+}
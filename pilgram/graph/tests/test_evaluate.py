@@ -0,0 +1,70 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+from PIL import Image
+from pytest_mock import MockerFixture
+
+from pilgram import css, util
+from pilgram.graph import Fill, Input, evaluate
+from pilgram.graph.nodes import Blend, Composite, Opacity, RadialGradientMask
+
+
+def test_evaluate() -> None:
+    im = util.fill((4, 4), (255, 0, 0))
+    node = Blend("normal", Input(), Fill((0, 0, 255)))
+
+    assert evaluate(node, im).getpixel((0, 0)) == (0, 0, 255)
+
+
+def test_evaluate_non_rgb() -> None:
+    im = Image.new("L", (4, 4), 128)
+    actual = evaluate(Input(), im)
+
+    assert actual.mode == "RGB"
+    assert actual.getpixel((0, 0)) == (128, 128, 128)
+
+
+def test_evaluate_identical_subgraphs_once(mocker: MockerFixture) -> None:
+    spy = mocker.spy(util, "radial_gradient_mask")
+    im = util.fill((4, 4), (255, 0, 0))
+    node = Composite(
+        Composite(Input(), Fill((0, 0, 0)), RadialGradientMask(0.5)),
+        Input(),
+        RadialGradientMask(0.5),
+    )
+
+    actual = evaluate(node, im)
+
+    assert spy.call_count == 1
+    assert np.asarray(actual).shape == (4, 4, 3)
+
+
+def test_evaluate_blend_with_opacity_and_mask() -> None:
+    rng = np.random.default_rng(0)
+    im = Image.fromarray(rng.integers(0, 256, (8, 8, 3), dtype=np.uint8))
+    blend = Blend("screen", Input(), Fill((0, 68, 204)))
+    cs = css.blending.screen(im, (0, 68, 204))
+    mask = util.radial_gradient_mask(im.size, 0.5)
+
+    actual = evaluate(Opacity(Input(), blend, 0.3), im)
+    assert actual == Image.blend(im, cs, 0.3)
+
+    actual = evaluate(Composite(blend, Input(), RadialGradientMask(0.5)), im)
+    assert actual == Image.composite(cs, im, mask)
+
+    node = Composite(Opacity(Input(), blend, 0.3), Input(), RadialGradientMask(0.5))
+    actual = evaluate(node, im)
+    assert actual == css.blending.screen(im, (0, 68, 204), opacity=0.3, mask=mask)
@@ -0,0 +1,38 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from pilgram.graph import Blend, Fill, Input, Matrix, Point
+from pilgram.graph.nodes import children
+
+
+def test_blend() -> None:
+    node = Blend("screen", Input(), Fill((0, 0, 0)))
+    assert node == Blend("screen", Input(), Fill((0, 0, 0)))
+    assert hash(node) == hash(Blend("screen", Input(), Fill((0, 0, 0))))
+
+
+def test_blend_invalid_mode() -> None:
+    with pytest.raises(ValueError):
+        Blend("foo", Input(), Fill((0, 0, 0)))
+
+
+def test_children() -> None:
+    fill = Fill((0, 0, 0))
+    assert children(Blend("screen", Input(), fill)) == (Input(), fill)
+    assert children(Point(fill, tuple(range(256)))) == (fill,)
+    assert children(Matrix(fill, ())) == (fill,)
+    assert children(fill) == ()
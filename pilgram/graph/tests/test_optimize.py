@@ -0,0 +1,114 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from pilgram import css, util
+from pilgram.graph import (
+    Blend,
+    Composite,
+    Fill,
+    Input,
+    Matrix,
+    Node,
+    Opacity,
+    Point,
+    ops,
+    optimize,
+)
+from pilgram.graph.optimize import fold_constants, fuse_color_ops, remove_noops
+
+
+def test_fold_constants() -> None:
+    node = ops.contrast(Blend("multiply", Fill((200, 200, 200)), Fill((255, 0, 0))), 2)
+    assert fold_constants(node) == Fill((255, 0, 0))
+
+
+def test_fold_constants_input() -> None:
+    node = Blend("multiply", Input(), Fill((255, 0, 0)))
+    assert fold_constants(node) is node
+
+
+def test_fold_constants_alpha() -> None:
+    node = Opacity(Fill((0, 0, 0, 0.5)), Fill((255, 255, 255, 0.5)), 0.5)
+    actual = fold_constants(node)
+
+    assert isinstance(actual, Fill)
+    assert actual.color[:3] == (127, 127, 127)
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        ops.contrast(Input()),
+        ops.saturate(Input()),
+        Opacity(Input(), Fill((0, 0, 0)), 0),
+        Opacity(Input(), Input(), 0.5),
+        Composite(Input(), Input(), Fill((0, 0, 0))),
+        Blend("screen", Input(), Fill((255, 255, 255, 0))),
+    ],
+)
+def test_remove_noops(node: Node) -> None:
+    assert remove_noops(node) == Input()
+
+
+def test_remove_noops_opacity_1() -> None:
+    node = Opacity(Input(), Fill((0, 0, 0)), 1)
+    assert remove_noops(node) == Fill((0, 0, 0))
+
+
+def test_remove_noops_identity_matrix() -> None:
+    node = Matrix(Input(), (css.saturate_matrix(), css.sepia_matrix()))
+    assert remove_noops(node) == Matrix(Input(), (css.sepia_matrix(),))
+
+
+def test_fuse_color_ops_point() -> None:
+    node = ops.brightness(ops.contrast(Input(), 1.1), 1.1)
+    expected = Point(
+        Input(),
+        tuple(util.compose_luts(css.contrast_lut(1.1), css.brightness_lut(1.1))),
+    )
+
+    assert fuse_color_ops(node) == expected
+
+
+def test_fuse_color_ops_matrix() -> None:
+    node = ops.saturate(ops.sepia(Input(), 0.3), 1.6)
+    expected = Matrix(Input(), (css.sepia_matrix(0.3), css.saturate_matrix(1.6)))
+
+    assert fuse_color_ops(node) == expected
+
+
+def test_fuse_color_ops_opacity() -> None:
+    cs = Blend("screen", Input(), Fill((0, 0, 0)))
+    node = Opacity(Input(), Opacity(Input(), cs, 0.5), 0.4)
+
+    assert fuse_color_ops(node) == Opacity(Input(), cs, 0.2)
+    assert fuse_color_ops(Opacity(cs, Opacity(Input(), cs, 0.5), 0.4)) == Opacity(
+        cs, Opacity(Input(), cs, 0.5), 0.4
+    )
+
+
+def test_optimize() -> None:
+    node = ops.brightness(
+        ops.contrast(ops.contrast(Blend("screen", Input(), Fill((0, 0, 0)))), 1.1),
+        1.1,
+    )
+    expected = Point(
+        Blend("screen", Input(), Fill((0, 0, 0))),
+        tuple(util.compose_luts(css.contrast_lut(1.1), css.brightness_lut(1.1))),
+    )
+
+    assert optimize(node) == expected
@@ -0,0 +1,119 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+import pytest
+from PIL import Image
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pilgram.graph import (
+    Blend,
+    Composite,
+    Fill,
+    Input,
+    LinearGradient,
+    Matrix,
+    Node,
+    RadialGradientMask,
+    evaluate,
+    optimize,
+    spatial,
+)
+from pilgram.graph.specs import SPECS
+
+
+@pytest.fixture
+def im() -> Image.Image:
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (48, 64, 3), dtype=np.uint8))
+
+
+def test_is_separable() -> None:
+    mask = RadialGradientMask(0.5)
+    assert spatial.is_separable(Composite(Input(), Fill((0, 0, 0)), mask))
+    assert spatial.is_separable(
+        Blend("overlay", Input(), LinearGradient((0,) * 3, (255,) * 3))
+    )
+    assert not spatial.is_separable(Blend("hue", Input(), Fill((0, 0, 0))))
+    assert not spatial.is_separable(Matrix(Input(), ((1.0,) * 12,)))
+
+
+def test_frontier() -> None:
+    mask = RadialGradientMask(0.5)
+    inner = Composite(Input(), Fill((0, 0, 0)), mask)
+    node = Blend("color", inner, Fill((0, 0, 255)))
+
+    assert spatial.frontier(node) == (inner,)
+    assert spatial.frontier(Blend("color", Input(), mask)) == ()
+    assert spatial.frontier(Input()) == ()
+
+    # NOTE: a subgraph without masks is tabulated as a single LUT
+    cs = Blend("overlay", Input(), Fill((0, 0, 0)))
+    assert spatial.frontier(cs) == (cs,)
+
+
+def test_cost() -> None:
+    mask = RadialGradientMask(0.5)
+    cs = Blend("overlay", Input(), Fill((0, 0, 0)))
+
+    assert spatial.cost(Composite(cs, Input(), mask)) == 2.5
+    assert spatial.cost(Composite(cs, cs, mask)) == 2.5  # evaluated once
+    assert spatial.cost(Blend("overlay", Input(), Composite(cs, Input(), mask))) == 6.5
+
+
+@pytest.mark.parametrize("name", sorted(SPECS))
+def test_evaluate_separable(im: Image.Image, name: str) -> None:
+    for node in spatial.frontier(optimize(SPECS[name])):
+        actual = spatial.evaluate_separable(node, im)
+
+        assert actual is not None
+        assert np.array_equal(np.asarray(actual), np.asarray(evaluate(node, im)))
+
+
+def test_evaluate_separable_too_many_masks(im: Image.Image) -> None:
+    node: Node = Input()
+    for length in (0.1, 0.2, 0.3):
+        node = Composite(node, Fill((0, 0, 0)), RadialGradientMask(length))
+
+    assert spatial.evaluate_separable(node, im) is None
+    assert np.array_equal(
+        np.asarray(spatial.evaluate_fused(node, im)), np.asarray(evaluate(node, im))
+    )
+
+
+def test_tabulate_read_only() -> None:
+    node = Composite(Input(), Fill((0, 0, 0)), RadialGradientMask(0.5))
+    levels = np.arange(256, dtype=np.uint8).tobytes()
+    table = spatial.tabulate(node, levels)
+
+    assert table.shape == (3, 256 * 256)
+    assert not table.flags.writeable
+    assert table[0, 255 * 256 + 100] == 100  # image1 where the mask is white
+    assert table[0, 100] == 0
+
+
+@pytest.mark.parametrize("name", sorted(SPECS))
+def test_evaluate_fused(im: Image.Image, name: str) -> None:
+    node = optimize(SPECS[name])
+    expected = evaluate(node, im)
+
+    assert np.array_equal(
+        np.asarray(spatial.evaluate_fused(node, im)), np.asarray(expected)
+    )
+
+
+def test_evaluate_fused_xpro2_benchmark(benchmark: BenchmarkFixture) -> None:
+    with Image.open("examples/mtjimba.jpg") as im:
+        benchmark(spatial.evaluate_fused, optimize(SPECS["xpro2"]), im)
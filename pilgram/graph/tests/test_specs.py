@@ -0,0 +1,88 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+import pytest
+from PIL import Image
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import pilgram
+from pilgram.graph import execute
+from pilgram.graph.specs import SPECS
+
+
+@pytest.fixture
+def im() -> Image.Image:
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (16, 16, 3), dtype=np.uint8))
+
+
+def test_specs_cover_filters() -> None:
+    assert sorted(SPECS) == sorted(n for n in pilgram.__all__ if n != "__version__")
+
+
+@pytest.mark.parametrize("name", sorted(SPECS))
+def test_execute(im: Image.Image, name: str) -> None:
+    # NOTE: the optimized graph gives the same output as the graph
+    #       evaluated stage by stage, which the filter is defined as
+    expected = np.asarray(execute(SPECS[name], im, optimized=False))
+
+    actual = np.asarray(execute(SPECS[name], im))
+    assert np.array_equal(actual, expected)
+
+    actual = np.asarray(getattr(pilgram, name)(im))
+    assert np.array_equal(actual, expected)
+
+
+@pytest.mark.parametrize("name", ["inkwell", "moon"])
+@pytest.mark.parametrize("optimized", [False, True])
+def test_execute_mode_l(im: Image.Image, name: str, optimized: bool) -> None:
+    expected = getattr(pilgram, name)(im, mode="L")
+
+    actual = execute(SPECS[name], im, optimized, mode="L")
+    assert actual.mode == "L"
+    assert actual == expected
+
+
+@pytest.mark.parametrize("name", sorted(SPECS))
+def test_execute_intensity(im: Image.Image, name: str) -> None:
+    # NOTE: the mix is folded into the graph, at most 1 of 255 apart
+    #       from rounding it separately
+    expected = np.asarray(execute(SPECS[name], im, intensity=0.4, optimized=False))
+
+    actual = np.asarray(execute(SPECS[name], im, intensity=0.4))
+    assert np.abs(actual.astype(np.int16) - expected).max() <= 1
+
+
+def test_execute_intensity_zero(im: Image.Image) -> None:
+    actual = execute(SPECS["kelvin"], im, intensity=0)
+
+    assert actual is not im
+    assert actual == im
+
+
+def test_execute_invalid_intensity(im: Image.Image) -> None:
+    with pytest.raises(AssertionError):
+        execute(SPECS["kelvin"], im, intensity=1.5)
+
+
+def test_execute_mode_l_not_grayscale(im: Image.Image) -> None:
+    with pytest.raises(ValueError):
+        execute(SPECS["clarendon"], im, mode="L")
+
+
+def test_execute_mayfair_benchmark(benchmark: BenchmarkFixture) -> None:
+    with Image.open("examples/mtjimba.jpg") as im:
+        benchmark(execute, SPECS["mayfair"], im)
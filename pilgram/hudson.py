@@ -14,27 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def hudson(im: Image.Image) -> Image.Image:
+def hudson(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Hudson filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.radial_gradient(cb.size, [(166, 177, 255), (52, 33, 52)], [0.5, 1])
-    cs = css.blending.multiply(cb, cs)
-    cr = Image.blend(cb, cs, 0.5)  # opacity
-
-    cr = css.brightness(cr, 1.2)
-    cr = css.contrast(cr, 0.9)
-    cr = css.saturate(cr, 1.1)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["hudson"], im, intensity=intensity)
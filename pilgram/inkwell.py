@@ -14,24 +14,39 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def inkwell(im: Image.Image) -> Image.Image:
+def inkwell(im: Image.Image, intensity: float = 1, *, mode: str = "RGB") -> Image.Image:
     """Applies Inkwell filter.
 
+    The output is grayscale, so it can also be returned as an L image.
+
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input in RGB mode
+            (see `graph.execute`). Defaults to 1.
+        mode: An optional string. The output mode (RGB or L).
+            Defaults to RGB.
 
     Returns:
         The output image.
+
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+        ValueError: if `mode` is not RGB or L,
+            or `mode` is L and `intensity` is not 1.
     """
 
-    cb = util.or_convert(im, "RGB")
+    if mode not in ("RGB", "L"):
+        raise ValueError(f"Unsupported mode: {mode!r}")
+    elif mode == "L" and intensity != 1:
+        raise ValueError("Intensity is only supported in RGB mode")
 
-    cr = css.sepia(cb, 0.3)
-    cr = css.contrast(cr, 1.1)
-    cr = css.brightness(cr, 1.1)
-    cr = css.grayscale(cr)
+    # NOTE: the grayscale output is computed as a single band
+    if mode == "L":
+        return execute(SPECS["inkwell"], im, mode="L")
 
-    return cr
+    return execute(SPECS["inkwell"], im, intensity=intensity)
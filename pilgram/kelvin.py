@@ -14,25 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def kelvin(im: Image.Image) -> Image.Image:
+def kelvin(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Kelvin filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs1 = util.fill(cb.size, (56, 44, 52))
-    cs = css.blending.color_dodge(cb, cs1)
-
-    cs2 = util.fill(cb.size, (183, 125, 33))
-    cr = css.blending.overlay(cs, cs2)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["kelvin"], im, intensity=intensity)
@@ -14,27 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def lark(im: Image.Image) -> Image.Image:
+def lark(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Lark filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-
-    cs1 = util.fill(cb.size, (34, 37, 63))
-    cm1 = css.blending.color_dodge(cb, cs1)
 
-    cs2 = util.fill(cb.size, (242, 242, 242, 0.8))
-    cr = css.blending.darken(cm1, cs2)
-
-    cr = css.contrast(cr, 0.9)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["lark"], im, intensity=intensity)
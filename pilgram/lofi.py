@@ -14,28 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def lofi(im: Image.Image) -> Image.Image:
+def lofi(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Lo-Fi filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-
-    cs = util.fill(cb.size, (34, 34, 34))
-    cs = css.blending.multiply(cb, cs)
 
-    mask = util.radial_gradient_mask(cb.size, length=0.7, scale=1.5)
-    cr = Image.composite(cb, cs, mask)
-
-    cr = css.saturate(cr, 1.1)
-    cr = css.contrast(cr, 1.5)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["lofi"], im, intensity=intensity)
@@ -14,27 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def maven(im: Image.Image) -> Image.Image:
+def maven(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Maven filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.fill(cb.size, (3, 230, 26, 0.2))
-    cr = css.blending.hue(cb, cs)
-
-    cr = css.sepia(cr, 0.25)
-    cr = css.brightness(cr, 0.95)
-    cr = css.contrast(cr, 0.95)
-    cr = css.saturate(cr, 1.5)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["maven"], im, intensity=intensity)
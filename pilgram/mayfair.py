@@ -14,40 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def mayfair(im: Image.Image) -> Image.Image:
+def mayfair(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Mayfair filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-    size = cb.size
-    pos = (0.4, 0.4)
-
-    cs1 = util.fill(size, (255, 255, 255, 0.8))
-    cm1 = css.blending.overlay(cb, cs1)
-
-    cs2 = util.fill(size, (255, 200, 200, 0.6))
-    cm2 = css.blending.overlay(cb, cs2)
 
-    cs3 = util.fill(size, (17, 17, 17))
-    cm3 = css.blending.overlay(cb, cs3)
-
-    mask1 = util.radial_gradient_mask(size, scale=0.3, center=pos)
-    cs = Image.composite(cm1, cm2, mask1)
-
-    mask2 = util.radial_gradient_mask(size, length=0.3, scale=0.6, center=pos)
-    cs = Image.composite(cs, cm3, mask2)
-    cr = Image.blend(cb, cs, 0.4)  # opacity
-
-    cr = css.contrast(cr, 1.1)
-    cr = css.saturate(cr, 1.1)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["mayfair"], im, intensity=intensity)
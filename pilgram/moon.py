@@ -14,29 +14,39 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def moon(im: Image.Image) -> Image.Image:
+def moon(im: Image.Image, intensity: float = 1, *, mode: str = "RGB") -> Image.Image:
     """Applies Moon filter.
 
+    The output is grayscale, so it can also be returned as an L image.
+
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input in RGB mode
+            (see `graph.execute`). Defaults to 1.
+        mode: An optional string. The output mode (RGB or L).
+            Defaults to RGB.
 
     Returns:
         The output image.
-    """
 
-    cb = util.or_convert(im, "RGB")
-
-    cs1 = util.fill(cb.size, (160, 160, 160))
-    cs = css.blending.soft_light(cb, cs1)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+        ValueError: if `mode` is not RGB or L,
+            or `mode` is L and `intensity` is not 1.
+    """
 
-    cs2 = util.fill(cb.size, (56, 56, 56))
-    cr = css.blending.lighten(cs, cs2)
+    if mode not in ("RGB", "L"):
+        raise ValueError(f"Unsupported mode: {mode!r}")
+    elif mode == "L" and intensity != 1:
+        raise ValueError("Intensity is only supported in RGB mode")
 
-    cr = css.grayscale(cr)
-    cr = css.contrast(cr, 1.1)
-    cr = css.brightness(cr, 1.1)
+    # NOTE: the grayscale output is computed as a single band
+    if mode == "L":
+        return execute(SPECS["moon"], im, mode="L")
 
-    return cr
+    return execute(SPECS["moon"], im, intensity=intensity)
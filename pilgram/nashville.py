@@ -14,30 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def nashville(im: Image.Image) -> Image.Image:
+def nashville(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Nashville filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-
-    cs1 = util.fill(cb.size, (247, 176, 153, 0.56))
-    cm1 = css.blending.darken(cb, cs1)
 
-    cs2 = util.fill(cb.size, (0, 70, 150, 0.4))
-    cr = css.blending.lighten(cm1, cs2)
-
-    cr = css.sepia(cr, 0.2)
-    cr = css.contrast(cr, 1.2)
-    cr = css.brightness(cr, 1.05)
-    cr = css.saturate(cr, 1.2)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["nashville"], im, intensity=intensity)
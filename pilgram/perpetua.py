@@ -14,23 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def perpetua(im: Image.Image) -> Image.Image:
+def perpetua(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Perpetua filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, which scales the opacity of the blended gradient.
+            Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.linear_gradient(cb.size, (0, 91, 154), (230, 193, 61), False)
-    cs = css.blending.soft_light(cb, cs)
-    cr = Image.blend(cb, cs, 0.5)  # opacity
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["perpetua"], im, intensity=intensity)
@@ -14,28 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def reyes(im: Image.Image) -> Image.Image:
+def reyes(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Reyes filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.fill(cb.size, (239, 205, 173))
-    cs = css.blending.soft_light(cb, cs)
-    cr = Image.blend(cb, cs, 0.5)  # opacity
-
-    cr = css.sepia(cr, 0.22)
-    cr = css.brightness(cr, 1.1)
-    cr = css.contrast(cr, 0.85)
-    cr = css.saturate(cr, 0.75)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["reyes"], im, intensity=intensity)
@@ -14,40 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def rise(im: Image.Image) -> Image.Image:
+def rise(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Rise filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-
-    cs1 = util.fill(cb.size, (236, 205, 169, 0.15))
-    cm1 = css.blending.multiply(cb, cs1)
-
-    cs2 = util.fill(cb.size, (50, 30, 7, 0.4))
-    cm2 = css.blending.multiply(cb, cs2)
 
-    gradient_mask1 = util.radial_gradient_mask(cb.size, length=0.55)
-    cm = Image.composite(cm1, cm2, gradient_mask1)
-
-    cs3 = util.fill(cb.size, (232, 197, 152, 0.8))
-    cm3 = css.blending.overlay(cm, cs3)
-
-    gradient_mask2 = util.radial_gradient_mask(cb.size, scale=0.9)
-    cm_ = Image.composite(cm3, cm, gradient_mask2)
-    cr = Image.blend(cm, cm_, 0.6)  # opacity
-
-    cr = css.brightness(cr, 1.05)
-    cr = css.sepia(cr, 0.2)
-    cr = css.contrast(cr, 0.9)
-    cr = css.saturate(cr, 0.9)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["rise"], im, intensity=intensity)
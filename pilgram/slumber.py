@@ -14,28 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def slumber(im: Image.Image) -> Image.Image:
+def slumber(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Slumber filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-
-    cs1 = util.fill(cb.size, (69, 41, 12, 0.4))
-    cm = css.blending.lighten(cb, cs1)
 
-    cs2 = util.fill(cb.size, (125, 105, 24, 0.5))
-    cr = css.blending.soft_light(cm, cs2)
-
-    cr = css.saturate(cr, 0.66)
-    cr = css.brightness(cr, 1.05)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["slumber"], im, intensity=intensity)
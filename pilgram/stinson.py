@@ -14,26 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def stinson(im: Image.Image) -> Image.Image:
+def stinson(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Stinson filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.fill(cb.size, (240, 149, 128, 0.2))
-    cr = css.blending.soft_light(cb, cs)
-
-    cr = css.contrast(cr, 0.75)
-    cr = css.saturate(cr, 0.85)
-    cr = css.brightness(cr, 1.15)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["stinson"], im, intensity=intensity)
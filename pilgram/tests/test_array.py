@@ -0,0 +1,205 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from PIL import Image
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import pilgram
+from pilgram import array, css
+
+
+@pytest.fixture
+def arr() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (16, 24, 3), dtype=np.uint8)
+
+
+FILTERS = [n for n in array.__all__ if n not in ("apply", "to_array", "to_image")]
+
+
+@pytest.fixture
+def batch() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (3, 16, 24, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def test_array(arr: np.ndarray, name: str) -> None:
+    expected = np.asarray(getattr(pilgram, name)(Image.fromarray(arr)))
+
+    actual = getattr(array, name)(arr)
+    assert isinstance(actual, np.ndarray)
+    assert np.array_equal(actual, expected)
+
+
+def test_array_wraps_filter() -> None:
+    assert array.clarendon.__name__ == "clarendon"
+    assert array.clarendon.__doc__ == pilgram.clarendon.__doc__
+
+
+def test_array_arguments(arr: np.ndarray) -> None:
+    im = Image.fromarray(arr)
+
+    actual = array.clarendon(arr, intensity=0.4)
+    assert np.array_equal(actual, np.asarray(pilgram.clarendon(im, intensity=0.4)))
+
+    actual = array.inkwell(arr, mode="L")
+    assert actual.shape == (16, 24)
+
+
+@pytest.mark.parametrize(
+    "view",
+    [
+        lambda a: a[2:14, 3:20],  # crop
+        lambda a: a[::2, ::3],  # strided pixels
+        lambda a: a[::-1],  # flipped rows
+        lambda a: a[..., ::-1],  # reversed channels
+        lambda a: a.transpose(1, 0, 2),  # transposed
+        lambda a: np.asfortranarray(a),
+    ],
+)
+def test_to_image_views(
+    arr: np.ndarray, view: Callable[[np.ndarray], np.ndarray]
+) -> None:
+    a = view(arr)
+
+    assert np.array_equal(np.asarray(array.to_image(a)), a)
+
+
+@pytest.mark.parametrize(
+    "a",
+    [
+        np.zeros((4, 4), dtype=np.uint8),
+        np.zeros((4, 4, 4), dtype=np.uint8),
+        np.zeros((4, 4, 3), dtype=np.float32),
+    ],
+)
+def test_to_image_unsupported_array(a: np.ndarray) -> None:
+    with pytest.raises(ValueError):
+        array.to_image(a)
+
+
+def test_to_array(arr: np.ndarray) -> None:
+    actual = array.to_array(Image.fromarray(arr))
+
+    assert np.array_equal(actual, arr)
+    assert actual.flags.writeable
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def test_array_batch(batch: np.ndarray, name: str) -> None:
+    fn = getattr(array, name)
+    expected = np.stack([fn(arr) for arr in batch])
+
+    actual = fn(batch)
+    assert actual.shape == batch.shape
+    assert actual.flags.writeable
+    assert np.array_equal(actual, expected)
+
+
+@pytest.mark.parametrize("name", ["clarendon", "hudson"])
+def test_array_batch_intensities(batch: np.ndarray, name: str) -> None:
+    fn = getattr(array, name)
+    intensities = [0, 0.4, 1]
+    expected = np.stack(
+        [fn(arr, intensity=t) for arr, t in zip(batch, intensities, strict=True)]
+    )
+
+    actual = fn(batch, intensity=intensities)
+    assert np.array_equal(actual, expected)
+
+
+def test_array_batch_mode_l(batch: np.ndarray) -> None:
+    actual = array.inkwell(batch, mode="L")
+
+    assert actual.shape == batch.shape[:3]
+    assert np.array_equal(actual[1], array.inkwell(batch[1], mode="L"))
+
+
+def test_apply_batch_parameters(batch: np.ndarray) -> None:
+    degrees = [0, 30, 30]
+    expected = np.stack(
+        [
+            array.apply(css.hue_rotate, arr, deg=deg)
+            for arr, deg in zip(batch, degrees, strict=True)
+        ]
+    )
+
+    actual = array.apply(css.hue_rotate, batch, True, deg=np.array(degrees))
+    assert np.array_equal(actual, expected)
+
+
+def test_apply_batch_strided(batch: np.ndarray) -> None:
+    view = batch[::2, 2:14, ::-1]
+    expected = np.stack([array.clarendon(arr) for arr in view])
+
+    assert np.array_equal(array.clarendon(view), expected)
+
+
+def test_array_out(arr: np.ndarray) -> None:
+    out = np.zeros_like(arr)
+    actual = array.clarendon(arr, out=out)
+
+    assert actual is out
+    assert np.array_equal(out, array.clarendon(arr))
+
+
+@pytest.mark.parametrize("intensity", [1, [0, 0.4, 1]])
+def test_array_batch_out(batch: np.ndarray, intensity: float | list[float]) -> None:
+    out = np.zeros((5, *batch.shape[1:]), dtype=np.uint8)
+    actual = array.hudson(batch, intensity=intensity, out=out[1:4])
+
+    assert actual.base is out
+    assert np.array_equal(out[1:4], array.hudson(batch, intensity=intensity))
+    assert not out[0].any() and not out[4].any()
+
+
+def test_array_batch_out_mode_l(batch: np.ndarray) -> None:
+    out = np.empty(batch.shape[:3], dtype=np.uint8)
+    array.inkwell(batch, mode="L", out=out)
+
+    assert np.array_equal(out, array.inkwell(batch, mode="L"))
+
+
+def test_array_out_unsupported(arr: np.ndarray, batch: np.ndarray) -> None:
+    with pytest.raises(ValueError):
+        array.clarendon(arr, out=np.empty((16, 24), dtype=np.uint8))
+
+    with pytest.raises(ValueError):
+        array.clarendon(batch, out=np.empty(batch.shape, dtype=np.float32))
+
+
+def test_apply_batch_invalid_parameters(batch: np.ndarray) -> None:
+    with pytest.raises(ValueError):
+        array.clarendon(batch, intensity=[0.5, 0.5])
+
+    with pytest.raises(ValueError):
+        array.inkwell(batch, mode="L", intensity=[0.5, 0.5, 0.5])
+
+
+def test_array_clarendon_benchmark(benchmark: BenchmarkFixture) -> None:
+    with Image.open("examples/mtjimba.jpg") as im:
+        arr = np.array(im)
+    benchmark(array.clarendon, arr)
+
+
+def test_array_clarendon_batch_benchmark(benchmark: BenchmarkFixture) -> None:
+    with Image.open("examples/mtjimba.jpg") as im:
+        batch = np.stack([np.asarray(im)] * 8)
+    benchmark(array.clarendon, batch, intensity=np.linspace(0, 1, 8))
@@ -0,0 +1,172 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import pilgram
+from pilgram import compiled
+
+# NOTE: the largest error of the 3D LUTs over every 24-bit color
+MAX_ERROR = 5
+
+# NOTE: the filters which are not compiled to 3D LUTs (see `compiled`)
+EXACT = [
+    "aden",
+    "brooklyn",
+    "earlybird",
+    "hudson",
+    "lofi",
+    "mayfair",
+    "perpetua",
+    "rise",
+    "toaster",
+    "willow",
+    "xpro2",
+]
+
+
+def _assert_output(name: str, actual: Image.Image, expected: Image.Image) -> None:
+    """Asserts that the output of a compiled filter is within its error"""
+
+    a = np.asarray(actual, dtype=np.int16)
+    b = np.asarray(expected, dtype=np.int16)
+    if name in EXACT:
+        assert np.array_equal(a, b)
+    else:
+        assert np.abs(a - b).max() <= MAX_ERROR
+
+
+@pytest.mark.parametrize("name", compiled.__all__)
+def test_compiled(name: str) -> None:
+    im = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (16, 16, 3), dtype=np.uint8)
+    )
+    _assert_output(name, getattr(compiled, name)(im), getattr(pilgram, name)(im))
+
+
+@pytest.mark.parametrize("name", compiled.__all__)
+def test_compiled_gradient(name: str) -> None:
+    # NOTE: smooth gradients show the interpolation error better than noise
+    r, g = np.meshgrid(np.arange(256), np.arange(256))
+    data = np.stack((r, g, 255 - r), axis=-1).astype(np.uint8)
+    im = Image.fromarray(data)
+    _assert_output(name, getattr(compiled, name)(im), getattr(pilgram, name)(im))
+
+
+@pytest.mark.parametrize("name", compiled.__all__)
+def test_compiled_intensity(name: str) -> None:
+    im = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (16, 16, 3), dtype=np.uint8)
+    )
+    actual = getattr(compiled, name)(im, 0.4)
+    if name in EXACT:
+        expected = getattr(pilgram, name)(im, 0.4)
+    else:
+        expected = Image.blend(im, getattr(pilgram, name)(im), 0.4)
+
+    _assert_output(name, actual, expected)
+
+
+@pytest.mark.parametrize("name", ["clarendon", "gingham", "inkwell"])
+def test_compiled_palette(name: str) -> None:
+    im = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (16, 16, 3), dtype=np.uint8)
+    ).quantize(64)
+    actual = getattr(compiled, name)(im)
+    expected = getattr(pilgram, name)(im)
+
+    assert actual.mode == "P"
+    assert actual.convert("RGB").tobytes() == expected.tobytes()
+
+
+@pytest.mark.parametrize("name", ["clarendon", "gingham", "inkwell"])
+def test_compiled_ycbcr(name: str) -> None:
+    im = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (16, 16, 3), dtype=np.uint8)
+    ).convert("YCbCr")
+    actual = getattr(compiled, name)(im)
+    expected = getattr(pilgram, name)(im).convert("YCbCr")
+
+    assert actual.mode == "YCbCr"
+    assert np.abs(np.asarray(actual, np.int16) - np.asarray(expected)).max() <= 6
+
+
+def test_compiled_wraps_filter() -> None:
+    assert compiled.clarendon.__name__ == "clarendon"
+    assert compiled.clarendon.__doc__ == pilgram.clarendon.__doc__
+
+
+@pytest.mark.parametrize("name", ["inkwell", "moon"])
+def test_compiled_mode_l(name: str) -> None:
+    im = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (16, 16, 3), dtype=np.uint8)
+    )
+    fn = getattr(compiled, name)
+    actual = fn(im, mode="L")
+    expected = np.asarray(getattr(pilgram, name)(im, mode="L"), dtype=np.int16)
+
+    assert actual.mode == "L"
+    assert actual == fn(im).getchannel("R")
+    assert np.abs(np.asarray(actual, dtype=np.int16) - expected).max() <= MAX_ERROR
+
+
+@pytest.mark.parametrize("name", ["inkwell", "moon"])
+def test_compiled_mode_unsupported(name: str) -> None:
+    im = Image.new("RGB", (4, 4))
+    fn = getattr(compiled, name)
+
+    with pytest.raises(ValueError, match="'RGBA'"):
+        fn(im, mode="RGBA")
+    with pytest.raises(ValueError):
+        fn(im, 0.4, mode="L")
+
+
+@pytest.mark.parametrize("name", ["inkwell", "moon"])
+def test_compiled_grayscale_signature(name: str) -> None:
+    fn = getattr(compiled, name)
+
+    assert fn.__name__ == name
+    assert not hasattr(fn, "__wrapped__")
+    assert "mode" in fn.__doc__
+
+
+def test_compiled_clarendon_benchmark(benchmark: BenchmarkFixture) -> None:
+    with Image.open("examples/mtjimba.jpg") as im:
+        benchmark(compiled.clarendon, im)
+
+
+def _filter_jpeg(data: bytes, draft: bool) -> bytes:
+    """Decodes, filters and encodes a JPEG image"""
+
+    with Image.open(io.BytesIO(data)) as im:
+        if draft:
+            im.draft("YCbCr", im.size)
+        out = io.BytesIO()
+        compiled.clarendon(im).save(out, "JPEG")
+        return out.getvalue()
+
+
+@pytest.mark.parametrize("draft", [False, True], ids=["rgb", "ycbcr"])
+def test_compiled_clarendon_jpeg_benchmark(
+    benchmark: BenchmarkFixture, draft: bool
+) -> None:
+    with open("examples/mtjimba.jpg", "rb") as f:
+        data = f.read()
+    benchmark(_filter_jpeg, data, draft)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+import pytest
 from PIL import Image
 from pytest_benchmark.fixture import BenchmarkFixture
 
@@ -23,6 +25,21 @@ def test_inkwell() -> None:
     inkwell(im)
 
 
+def test_inkwell_mode_l() -> None:
+    rng = np.random.default_rng(0)
+    im = Image.fromarray(rng.integers(0, 256, (16, 16, 3), dtype=np.uint8))
+    actual = inkwell(im, mode="L")
+
+    assert actual.mode == "L"
+    assert actual == inkwell(im).getchannel("R")
+    assert inkwell(im).getchannel("R") == inkwell(im).getchannel("B")
+
+
+def test_inkwell_unsupported_mode() -> None:
+    with pytest.raises(ValueError, match="'RGBA'"):
+        inkwell(util.fill((4, 4), (255,) * 3), mode="RGBA")
+
+
 def test_inkwell_benchmark(benchmark: BenchmarkFixture) -> None:
     with Image.open("examples/mtjimba.jpg") as im:
         benchmark(inkwell, im)
@@ -0,0 +1,79 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import pilgram
+
+FILTERS = [name for name in pilgram.__all__ if name != "__version__"]
+
+
+@pytest.fixture
+def im() -> Image.Image:
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (16, 16, 3), dtype=np.uint8))
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def test_intensity(im: Image.Image, name: str) -> None:
+    fn = getattr(pilgram, name)
+    expected = np.asarray(Image.blend(im, fn(im), 0.4), dtype=np.int16)
+
+    actual = np.asarray(fn(im, intensity=0.4), dtype=np.int16)
+    assert np.abs(actual - expected).max() <= 1
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def test_intensity_zero(im: Image.Image, name: str) -> None:
+    fn = getattr(pilgram, name)
+    assert fn(im, intensity=0).tobytes() == im.tobytes()
+
+
+@pytest.mark.parametrize("name", ["brooklyn", "kelvin", "lark", "perpetua", "toaster"])
+def test_intensity_folded(
+    im: Image.Image, name: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # NOTE: the mix is folded into the final table lookup of the filter,
+    #       so no extra pass over the image is needed
+    sizes = []
+    blend = Image.blend
+
+    def spy(im1: Image.Image, im2: Image.Image, alpha: float) -> Image.Image:
+        sizes.append(im1.size)
+        return blend(im1, im2, alpha)
+
+    monkeypatch.setattr(Image, "blend", spy)
+    getattr(pilgram, name)(im, intensity=0.3)
+
+    assert im.size not in sizes
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def test_intensity_positional(im: Image.Image, name: str) -> None:
+    fn = getattr(pilgram, name)
+    assert fn(im, 0.4) == fn(im, intensity=0.4)
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def test_invalid_intensity(im: Image.Image, name: str) -> None:
+    with pytest.raises(AssertionError):
+        getattr(pilgram, name)(im, intensity=1.5)
+
+
+def test_intensity_mode_l(im: Image.Image) -> None:
+    with pytest.raises(ValueError):
+        pilgram.inkwell(im, mode="L", intensity=0.4)
@@ -0,0 +1,103 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import math
+from collections.abc import Iterator
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import pilgram
+from pilgram import util
+from pilgram.types import Size
+
+# NOTE: `pilgram.util.radial_gradient` is shadowed by the function
+radial_gradient_module = importlib.import_module("pilgram.util.radial_gradient")
+
+# NOTE: the filters whose output depends on radial gradient masks
+FILTERS = [
+    "brooklyn",
+    "earlybird",
+    "hudson",
+    "lofi",
+    "mayfair",
+    "rise",
+    "toaster",
+    "willow",
+    "xpro2",
+]
+
+
+def _reference_radial_gradient_mask(
+    size: Size,
+    length: float = 0,
+    scale: float = 1,
+    center: tuple[float, float] = (0.5, 0.5),
+) -> Image.Image:
+    """Returns a radial gradient mask computed in float64"""
+
+    if length >= 1:
+        return Image.new("L", size, 255)
+
+    if scale <= 0:
+        return Image.new("L", size, 0)
+
+    w, h = size
+    cx, cy = center
+
+    if length == 0 and scale >= 1 and w == h and center == (0.5, 0.5):
+        prepared = radial_gradient_module._prepared_radial_gradient_mask
+        im: Image.Image = prepared(size, scale)
+        return im
+
+    x = np.linspace(-w * cx, w * (1 - cx), w)
+    y = np.linspace(-h * cy, h * (1 - cy), h)[:, None]
+
+    r = math.sqrt(max(cx, 1 - cx) ** 2 * w**2 + max(cy, 1 - cy) ** 2 * h**2)
+    base = max(scale - length, 0.001)
+
+    mask = 1 - (np.sqrt(x**2 + y**2) / r - length) / base
+    return Image.fromarray((mask * 255).clip(0, 255).round().astype(np.uint8))
+
+
+@pytest.fixture
+def im() -> Iterator[Image.Image]:
+    rng = np.random.default_rng(0)
+    util.gradient_cache.clear()
+    # NOTE: float32 rounding ties show up at larger, non-square sizes
+    yield Image.fromarray(rng.integers(0, 256, (853, 1280, 3), dtype=np.uint8))
+    util.gradient_cache.clear()
+
+
+@pytest.mark.parametrize("name", FILTERS)
+def test_radial_gradient_filters(
+    im: Image.Image, name: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    actual = np.asarray(getattr(pilgram, name)(im), dtype=np.int16)
+
+    util.gradient_cache.clear()
+    with monkeypatch.context() as m:
+        m.setattr(util, "radial_gradient_mask", _reference_radial_gradient_mask)
+        m.setattr(
+            radial_gradient_module,
+            "radial_gradient_mask",
+            _reference_radial_gradient_mask,
+        )
+        expected = np.asarray(getattr(pilgram, name)(im), dtype=np.int16)
+
+    # NOTE: float32 masks move a few pixels at rounding ties by one level,
+    #       which the filters amplify to at most 2 levels
+    assert np.abs(actual - expected).max() <= 2
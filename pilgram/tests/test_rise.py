@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 from PIL import Image
 from pytest_benchmark.fixture import BenchmarkFixture
 
-from pilgram import rise, util
+from pilgram import css, rise, util
 
 
 def test_rise() -> None:
@@ -23,6 +24,26 @@ def test_rise() -> None:
     rise(im)
 
 
+def test_rise_opacity() -> None:
+    rng = np.random.default_rng(0)
+    cb = Image.fromarray(rng.integers(0, 256, (480, 640, 3), dtype=np.uint8))
+
+    # NOTE: the opacity was applied as a separate pass after the mask
+    cm1 = css.blending.multiply(cb, (236, 205, 169, 0.15))
+    cm2 = css.blending.multiply(cb, (50, 30, 7, 0.4))
+    cm = Image.composite(cm1, cm2, util.radial_gradient_mask(cb.size, length=0.55))
+    mask = util.radial_gradient_mask(cb.size, scale=0.9)
+    cm_ = css.blending.overlay(cm, (232, 197, 152, 0.8), mask=mask)
+    cr = Image.blend(cm, cm_, 0.6)
+    cr = css.brightness(cr, 1.05)
+    cr = css.sepia(cr, 0.2)
+    cr = css.contrast(cr, 0.9)
+    expected = np.asarray(css.saturate(cr, 0.9), dtype=np.int16)
+
+    actual = np.asarray(rise(cb), dtype=np.int16)
+    assert np.abs(actual - expected).max() <= 3
+
+
 def test_rise_benchmark(benchmark: BenchmarkFixture) -> None:
     with Image.open("examples/mtjimba.jpg") as im:
         benchmark(rise, im)
@@ -14,25 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def toaster(im: Image.Image) -> Image.Image:
+def toaster(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Toaster filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.radial_gradient(cb.size, [(128, 78, 15), (59, 0, 59)])
-    cr = css.blending.screen(cb, cs)
-
-    cr = css.contrast(cr, 1.5)
-    cr = css.brightness(cr, 0.9)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["toaster"], im, intensity=intensity)
@@ -16,6 +16,7 @@
 
 from collections.abc import Callable, Sequence
 
+import numpy as np
 from PIL import Image
 from PIL.ImageMath import _Operand
 
@@ -29,8 +30,26 @@ Size = tuple[int, int]
 # Blending function type
 BlendingFunction = Callable[[Image.Image, Image.Image], Image.Image]
 
+# Blending function type of a solid color source
+ColorBlendingFunction = Callable[[Image.Image, RGBColor], Image.Image]
+
+# Layer type
+Layer = Image.Image | RGBColor | RGBAColor  # An image or solid color
+
+# Blending source type
+BlendingSource = Layer  # A source image or solid color
+
+# Output type
+Output = Image.Image | np.ndarray  # A destination image or array
+
+# Filter function type
+FilterFunction = Callable[[Image.Image], Image.Image]
+
 # ImageMath operand types
 RGBOperands = tuple[_Operand, _Operand, _Operand]  # RGB color as ImageMath operands
 
 # LUT types
 LUT256 = Sequence[int]  # Look-up table with exactly 256 elements
+
+# Color matrix types
+ColorMatrix = tuple[float, ...]  # 3x4 matrix in row-major order as `Image.convert`
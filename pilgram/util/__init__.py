@@ -13,25 +13,62 @@
 # limitations under the License.
 
 from pilgram.util.add import add
+from pilgram.util.apply_color_matrix import apply_color_matrix
+from pilgram.util.apply_intensity import apply_intensity
 from pilgram.util.apply_lut import apply_lut
+from pilgram.util.arena import ArenaInfo, ScratchArena, scratch_arena
+from pilgram.util.blend import blend
+from pilgram.util.cache import CacheInfo, ImageCache, gradient_cache
 from pilgram.util.clip import clip
-from pilgram.util.fill import fill
+from pilgram.util.color_lut import apply_color_lut, compile_color_lut, identity_lattice
+from pilgram.util.color_ramp import apply_color_ramp, color_ramp
+from pilgram.util.compose_color_matrices import compose_color_matrices
+from pilgram.util.compose_luts import compose_luts
+from pilgram.util.composite import composite
+from pilgram.util.fill import fill, fill_color
 from pilgram.util.invert import invert
 from pilgram.util.linear_gradient import linear_gradient, linear_gradient_mask
 from pilgram.util.or_convert import or_convert
+from pilgram.util.palette import apply_frames, apply_palette, apply_unique_colors
+from pilgram.util.planes import from_planes, to_planes
 from pilgram.util.radial_gradient import radial_gradient, radial_gradient_mask
 from pilgram.util.subtract import subtract
+from pilgram.util.write_output import write_output
 
 __all__ = [
     "add",
+    "apply_color_matrix",
+    "apply_frames",
+    "apply_intensity",
+    "apply_color_ramp",
+    "apply_color_lut",
     "apply_lut",
+    "apply_palette",
+    "apply_unique_colors",
+    "ArenaInfo",
+    "blend",
+    "CacheInfo",
+    "ImageCache",
+    "gradient_cache",
     "clip",
+    "color_ramp",
+    "compile_color_lut",
+    "compose_color_matrices",
+    "compose_luts",
+    "composite",
     "fill",
+    "fill_color",
+    "from_planes",
+    "identity_lattice",
     "invert",
     "linear_gradient",
     "linear_gradient_mask",
     "or_convert",
     "radial_gradient",
     "radial_gradient_mask",
+    "ScratchArena",
+    "scratch_arena",
     "subtract",
+    "to_planes",
+    "write_output",
 ]
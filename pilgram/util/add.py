@@ -15,6 +15,8 @@
 import numpy as np
 from PIL import Image
 
+from pilgram.util.arena import scratch_arena
+
 
 def add(im1: Image.Image, im2: Image.Image) -> Image.Image:
     """Adds two images.
@@ -28,9 +30,11 @@ def add(im1: Image.Image, im2: Image.Image) -> Image.Image:
     """
 
     # NOTE: When using Vanilla Pillow, `ImageChops.add` is slower than numpy
-    im1_array = np.asarray(im1, dtype=np.int16)  # avoid overflow
+    im1_array = np.asarray(im1)
     im2_array = np.asarray(im2)
-    im_array = im1_array + im2_array
-    im_array = im_array.clip(0, 255).astype(np.uint8)
+    with scratch_arena:
+        im_array = scratch_arena.empty(im1_array.shape, np.int16)  # avoid overflow
+        np.add(im1_array, im2_array, out=im_array, dtype=np.int16)
+        np.clip(im_array, 0, 255, out=im_array)
 
-    return Image.fromarray(im_array)
+        return Image.fromarray(im_array.astype(np.uint8))
@@ -0,0 +1,88 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from PIL import Image
+
+from pilgram.types import ColorMatrix
+from pilgram.util.compose_color_matrices import compose_color_matrices
+from pilgram.util.or_convert import or_convert
+
+
+def _may_clip(matrix: ColorMatrix) -> bool:
+    """Returns True if the matrix can map an RGB color out of the range"""
+
+    for i in range(3):
+        a = matrix[i * 4 : i * 4 + 3]
+        offset = matrix[i * 4 + 3]
+        low = offset + sum(min(x, 0) for x in a) * 255
+        high = offset + sum(max(x, 0) for x in a) * 255
+
+        # NOTE: values within the rounding error are not affected by clipping
+        if low < -0.5 or high > 255.5:
+            return True
+
+    return False
+
+
+def apply_color_matrix(
+    im: Image.Image,
+    matrix: ColorMatrix,
+    *matrices: ColorMatrix,
+    mode: str | None = None,
+) -> Image.Image:
+    """Applies color matrices to an image.
+
+    Successive matrices are multiplied and applied in a single pass
+    as long as the skipped intermediate result can not be clipped.
+    Otherwise the chain is split there, so the output stays within
+    a rounding error of applying each matrix one after another.
+
+    If the last matrix outputs the same value to every band (e.g. the
+    grayscale matrix), the output can be an L image. It is the same as
+    any band of the RGB output and is computed in a third of the time.
+
+    Arguments:
+        im: An input image.
+        matrix: A 3x4 color matrix.
+            The layout is the same as the `matrix` argument of `Image.convert`.
+        *matrices: Optional color matrices applied after `matrix`.
+        mode: An optional string. The output mode (RGB or L).
+            Defaults to the mode of `im`.
+
+    Returns:
+        The output image.
+
+    Raises:
+        ValueError: if any matrix has invalid size, or if `mode` is L
+            and the last matrix does not output the same value to every band.
+    """
+
+    cr = or_convert(im, "RGB")
+
+    stage = compose_color_matrices(matrix)
+    for next_matrix in matrices:
+        if _may_clip(stage):
+            cr = cr.convert("RGB", stage)
+            stage = compose_color_matrices(next_matrix)
+        else:
+            stage = compose_color_matrices(stage, next_matrix)
+
+    if mode == "L":
+        if not stage[0:4] == stage[4:8] == stage[8:12]:
+            raise ValueError("The bands of the last matrix must be the same")
+        return cr.convert("L", stage[0:4])
+
+    cr = cr.convert("RGB", stage)
+    return or_convert(cr, mode or im.mode)
@@ -0,0 +1,46 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from PIL import Image
+
+
+def apply_intensity(
+    im: Image.Image, filtered: Image.Image, intensity: float
+) -> Image.Image:
+    """Applies a filter partially by mixing its output with its input.
+
+    The output is `Image.blend(im, filtered, intensity)`, which costs one
+    extra pass over the image. A full intensity returns `filtered` as is,
+    without an extra pass.
+
+    Arguments:
+        im: An input image of a filter.
+        filtered: The output image of the filter.
+            The mode and size must be the same as `im`.
+        intensity: A float between 0 and 1. The strength of the filter.
+
+    Returns:
+        The output image.
+
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
+
+    assert 0 <= intensity <= 1
+
+    if intensity == 1:
+        return filtered
+
+    return Image.blend(im, filtered, intensity)
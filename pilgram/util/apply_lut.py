@@ -15,14 +15,19 @@
 from PIL import Image
 
 from pilgram.types import LUT256
+from pilgram.util.compose_luts import compose_luts
 
 
-def apply_lut(im: Image.Image, lut: LUT256) -> Image.Image:
+def apply_lut(im: Image.Image, lut: LUT256, *luts: LUT256) -> Image.Image:
     """Apply LUT to an image.
 
+    Successive LUTs are composed into one, so the image is processed
+    in a single pass.
+
     Arguments:
         im: An image.
         lut: A LUT (LookUp Table). The size must be 256.
+        *luts: Optional LUTs applied after `lut`. The size of each must be 256.
 
     Returns:
         The output image.
@@ -31,7 +36,9 @@ def apply_lut(im: Image.Image, lut: LUT256) -> Image.Image:
         ValueError: if `lut` has invalid size.
     """
 
-    if len(lut) != 256:
+    if luts:
+        lut = compose_luts(lut, *luts)
+    elif len(lut) != 256:
         raise ValueError(f"A size of LUT must be 256: {len(lut)}")
 
     return im.point(list(lut) * len(im.getbands()))
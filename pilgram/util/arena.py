@@ -0,0 +1,131 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+
+class ArenaInfo(NamedTuple):
+    """Statistics of a `ScratchArena` on the current thread."""
+
+    hits: int
+    misses: int
+    buffers: int
+    nbytes: int
+
+
+class _ArenaState(threading.local):
+    """The scopes and pooled buffers of an arena on a thread."""
+
+    def __init__(self) -> None:
+        self.scopes: list[list[np.ndarray]] = []
+        self.free: dict[tuple[tuple[int, ...], np.dtype], list[np.ndarray]] = {}
+        self.hits = 0
+        self.misses = 0
+
+
+class ScratchArena:
+    """A per-thread pool of scratch arrays keyed by shape and dtype.
+
+    Scratch arrays are pooled within a scope (`with arena:`). Arrays taken
+    in a scope are returned to the pool when the scope exits and reused
+    by later requests of the same shape and dtype, and the pool is released
+    when the outermost scope exits. Outside any scope, scratch arrays are
+    allocated as usual.
+
+    Internal NumPy paths open their own scopes, so a scope around a batch
+    of same-sized images reuses their scratch arrays across the images.
+
+    Scratch arrays must not outlive their scope, e.g. as the pixels of
+    an image returned by `Image.fromarray` without a copy.
+    """
+
+    def __init__(self) -> None:
+        self._state = _ArenaState()
+
+    def __enter__(self) -> None:
+        self._state.scopes.append([])
+
+    def __exit__(self, *exc_info: object) -> None:
+        state = self._state
+        for arr in state.scopes.pop():
+            state.free.setdefault((arr.shape, arr.dtype), []).append(arr)
+
+        if not state.scopes:
+            state.free.clear()
+
+    def empty(self, shape: tuple[int, ...], dtype: DTypeLike) -> np.ndarray:
+        """Returns an uninitialized scratch array.
+
+        Arguments:
+            shape: A tuple of integers. The shape of the array.
+            dtype: The data type of the array.
+
+        Returns:
+            The array, valid until the current scope exits.
+        """
+
+        state = self._state
+        if not state.scopes:
+            return np.empty(shape, dtype)
+
+        free = state.free.get((tuple(shape), np.dtype(dtype)))
+        if free:
+            arr = free.pop()
+            state.hits += 1
+        else:
+            arr = np.empty(shape, dtype)
+            state.misses += 1
+
+        state.scopes[-1].append(arr)
+        return arr
+
+    def zeros(self, shape: tuple[int, ...], dtype: DTypeLike) -> np.ndarray:
+        """Returns a scratch array filled with zeros, see `empty`."""
+
+        arr = self.empty(shape, dtype)
+        arr.fill(0)
+        return arr
+
+    def info(self) -> ArenaInfo:
+        """Returns the statistics of the arena on the current thread.
+
+        Hits are scratch arrays reused from the pool, misses are
+        scratch arrays allocated in a scope. Buffers and bytes are
+        the pooled arrays which are not in use.
+        """
+
+        state = self._state
+        buffers = [arr for free in state.free.values() for arr in free]
+        return ArenaInfo(
+            state.hits,
+            state.misses,
+            len(buffers),
+            sum(arr.nbytes for arr in buffers),
+        )
+
+    def clear(self) -> None:
+        """Releases the pooled arrays and resets the statistics."""
+
+        state = self._state
+        state.free.clear()
+        state.hits = 0
+        state.misses = 0
+
+
+scratch_arena = ScratchArena()
+"""The arena of scratch arrays used by `pilgram`."""
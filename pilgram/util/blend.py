@@ -0,0 +1,65 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from functools import lru_cache
+
+from PIL import Image
+
+from pilgram.types import Layer
+from pilgram.util.fill import fill_color
+
+
+@lru_cache(maxsize=256)
+def _blend_lut(color: tuple[int, ...], alpha: float, reverse: bool) -> list[int]:
+    """Returns a per-band LUT blending an image with a solid color"""
+
+    mode = "RGBA" if len(color) == 4 else "RGB"
+    ramp = Image.merge(
+        mode, [Image.frombytes("L", (256, 1), bytes(range(256)))] * len(color)
+    )
+    solid = Image.new(mode, ramp.size, color)
+
+    if reverse:
+        im = Image.blend(solid, ramp, alpha)
+    else:
+        im = Image.blend(ramp, solid, alpha)
+
+    return list(b"".join(band.tobytes() for band in im.split()))
+
+
+def blend(im1: Layer, im2: Layer, alpha: float) -> Image.Image:
+    """Blends two layers as `Image.blend`, without filling solid colors.
+
+    A solid color is applied to the image as a per-band LUT.
+
+    Arguments:
+        im1: An image or color (see `fill`).
+        im2: An image or color (see `fill`).
+        alpha: A float. The interpolation alpha factor.
+
+    Returns:
+        The output image.
+
+    Raises:
+        AssertionError: if both `im1` and `im2` are colors.
+    """
+
+    if isinstance(im2, tuple):
+        assert isinstance(im1, Image.Image)
+        return im1.point(_blend_lut(fill_color(im2), alpha, False))
+    elif isinstance(im1, tuple):
+        return im2.point(_blend_lut(fill_color(im1), alpha, True))
+    else:
+        return Image.blend(im1, im2, alpha)
@@ -0,0 +1,188 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import NamedTuple, ParamSpec
+
+from PIL import Image
+
+P = ParamSpec("P")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an `ImageCache`."""
+
+    hits: int
+    misses: int
+    maxbytes: int
+    currbytes: int
+    entries: int
+
+
+def _nbytes(im: Image.Image) -> int:
+    """Returns the number of bytes of the pixel data of the image.
+
+    Pillow stores the pixels of multi-band and 32-bit images in 4 bytes.
+    """
+
+    pixel_size = 1 if im.mode in ("1", "L", "P") else 4
+    return im.width * im.height * pixel_size
+
+
+def _freeze(value: object) -> Hashable:
+    """Converts lists and dicts in an argument into hashable tuples."""
+
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+
+    assert isinstance(value, Hashable)
+    return value
+
+
+def _readonly(im: Image.Image) -> Image.Image:
+    """Returns a copy-on-write view of the image.
+
+    The view shares its pixels with `im` until it is modified in place
+    (e.g. by `paste` or `putpixel`), at which point Pillow copies them.
+    """
+
+    view = im._new(im.im)
+    view.readonly = 1
+    return view
+
+
+class ImageCache:
+    """A thread-safe LRU cache of images bounded by their size in bytes.
+
+    Cached images are returned as copy-on-write views, so callers
+    cannot modify the cached entries.
+
+    Arguments:
+        maxbytes: An integer. The maximum total size of the cached pixels.
+            Zero disables the cache.
+    """
+
+    def __init__(self, maxbytes: int) -> None:
+        assert maxbytes >= 0
+
+        self._entries: OrderedDict[Hashable, Image.Image] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxbytes = maxbytes
+        self._currbytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxbytes(self) -> int:
+        """The maximum total size of the cached pixels in bytes."""
+        return self._maxbytes
+
+    @maxbytes.setter
+    def maxbytes(self, maxbytes: int) -> None:
+        assert maxbytes >= 0
+
+        with self._lock:
+            self._maxbytes = maxbytes
+            self._evict()
+
+    def info(self) -> CacheInfo:
+        """Returns the statistics of the cache."""
+
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._maxbytes,
+                self._currbytes,
+                len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+
+        with self._lock:
+            self._entries.clear()
+            self._currbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def get(self, key: Hashable) -> Image.Image | None:
+        """Returns a view of the cached image for the key, or None."""
+
+        with self._lock:
+            im = self._entries.get(key)
+            if im is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+
+        return _readonly(im)
+
+    def put(self, key: Hashable, im: Image.Image) -> Image.Image:
+        """Caches the image for the key and returns a view of it.
+
+        Images larger than `maxbytes` are not cached.
+        """
+
+        nbytes = _nbytes(im)
+
+        with self._lock:
+            if nbytes <= self._maxbytes:
+                old = self._entries.pop(key, None)
+                if old is not None:
+                    self._currbytes -= _nbytes(old)
+
+                self._entries[key] = im
+                self._currbytes += nbytes
+                self._evict()
+
+        return _readonly(im)
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries until within budget."""
+
+        while self._currbytes > self._maxbytes:
+            _, im = self._entries.popitem(last=False)
+            self._currbytes -= _nbytes(im)
+
+    def __call__(self, func: Callable[P, Image.Image]) -> Callable[P, Image.Image]:
+        """Caches the images returned by `func` by its arguments."""
+
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Image.Image:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__qualname__, _freeze(bound.arguments))
+
+            im = self.get(key)
+            if im is None:
+                im = self.put(key, func(*args, **kwargs))
+            return im
+
+        return wrapper
+
+
+gradient_cache = ImageCache(maxbytes=128 * 1024 * 1024)
+"""The cache of gradient images and masks created by `pilgram.util`."""
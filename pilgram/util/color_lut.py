@@ -0,0 +1,142 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+from pilgram.types import FilterFunction
+from pilgram.util.or_convert import or_convert
+
+# NOTE: `size - 1` divides 255, so every lattice node is an exact 8-bit value.
+#       The largest size Pillow allows (65) does not lower the largest error
+#       of the compiled filters (5 levels), so the exact nodes are kept.
+LUT_SIZE = 52
+
+
+def identity_lattice(size: int = LUT_SIZE) -> Image.Image:
+    """Creates an image which contains every node of a 3D LUT lattice.
+
+    The pixels are ordered as Color3DLUT expects its table:
+    red changes first, then green, then blue.
+
+    Arguments:
+        size: An optional integer. The number of nodes per channel.
+            Defaults to 52.
+
+    Returns:
+        The lattice image. The size is `(size, size * size)`.
+
+    Raises:
+        AssertionError: if `size` is out of range.
+    """
+
+    assert 2 <= size <= 65
+
+    nodes = np.linspace(0, 255, size).round().astype(np.uint8)
+    b, g, r = np.meshgrid(nodes, nodes, nodes, indexing="ij")
+    lattice = np.stack((r, g, b), axis=-1)
+
+    return Image.fromarray(lattice.reshape(size * size, size, 3))
+
+
+@lru_cache(maxsize=64)
+def _compile_color_lut(
+    fn: FilterFunction, size: int, mode: str, intensity: float
+) -> ImageFilter.Color3DLUT:
+    """Compiles a color-only filter into a 3D LUT, see `compile_color_lut`"""
+
+    lattice = identity_lattice(size)
+    if intensity != 1:
+        table = _compile_color_lut(fn, size, mode, 1).table
+        identity = np.asarray(lattice, dtype=np.float32).reshape(-1) / 255
+        table = identity + (table - identity) * np.float32(intensity)
+
+        return ImageFilter.Color3DLUT(size, table, _copy_table=False)
+
+    if mode == "YCbCr":
+        lattice = Image.frombytes(mode, lattice.size, lattice.tobytes())
+        lattice = or_convert(fn(lattice.convert("RGB")), "RGB").convert(mode)
+    elif mode == "RGB":
+        lattice = or_convert(fn(lattice), "RGB")
+    else:
+        raise ValueError(f"Unsupported mode: {mode!r}")
+
+    table = np.asarray(lattice, dtype=np.float32) / 255
+
+    return ImageFilter.Color3DLUT(size, table.reshape(-1, 3), _copy_table=False)
+
+
+def compile_color_lut(
+    fn: FilterFunction,
+    size: int = LUT_SIZE,
+    mode: str = "RGB",
+    intensity: float = 1,
+) -> ImageFilter.Color3DLUT:
+    """Compiles a color-only filter into a 3D LUT.
+
+    The filter is applied once to an identity lattice and the result is cached.
+    It is only valid for filters whose output pixel depends on nothing but
+    the input pixel color (i.e. no gradients, masks or neighbours).
+
+    In YCbCr mode, the lattice nodes are YCbCr colors, which are converted
+    to RGB for the filter and back to YCbCr afterwards, as Pillow converts
+    images. The LUT then maps YCbCr to YCbCr, so e.g. JPEG images can be
+    filtered as decoded and encoded without converting them to RGB.
+
+    A partial intensity mixes the table of the full filter with the
+    identity, which is the same as mixing the output with the input
+    (see `util.apply_intensity`) at no extra cost per pixel.
+
+    Arguments:
+        fn: A filter function which takes and returns an RGB image.
+        size: An optional integer. The number of nodes per channel.
+            Defaults to 52.
+        mode: An optional string. The mode of the images the LUT is
+            applied to (RGB or YCbCr). Defaults to RGB.
+        intensity: An optional float between 0 and 1.
+            The strength of the filter. Defaults to 1.
+
+    Returns:
+        The 3D LUT.
+
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+        ValueError: if `mode` is not RGB or YCbCr.
+    """
+
+    assert 0 <= intensity <= 1
+
+    return _compile_color_lut(fn, size, mode, intensity)
+
+
+def apply_color_lut(
+    im: Image.Image, lut: ImageFilter.Color3DLUT, mode: str = "RGB"
+) -> Image.Image:
+    """Applies 3D LUT to an image.
+
+    Arguments:
+        im: An input image.
+        lut: A 3D LUT.
+        mode: An optional string. The mode the LUT is compiled for
+            (RGB or YCbCr), which the image is converted to if necessary.
+            Defaults to RGB.
+
+    Returns:
+        The output image.
+    """
+
+    return or_convert(im, mode).filter(lut)
@@ -0,0 +1,90 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+from pilgram.types import RGBColor
+from pilgram.util.fill import fill
+
+
+@lru_cache(maxsize=64)
+def _color_ramp(
+    colors: tuple[RGBColor, ...], positions: tuple[float, ...]
+) -> list[int]:
+    """Returns cached color ramp."""
+
+    # NOTE: the value m of the mask from the first to the last stop
+    start, end = positions[0], positions[-1]
+    t = start + (end - start) * (1 - np.arange(256) / 255)
+
+    size = (256, 1)
+    ramp = fill(size, colors[0])
+    for i in range(1, len(colors)):
+        a, b = positions[i - 1], positions[i]
+        # the mask of radial_gradient_mask(length=a, scale=b) at t
+        base = max(b - a, 0.001)
+        mask = (1 - (t - a) / base) * 255
+        mask = mask.clip(0, 255).round().astype(np.uint8)
+        ramp = Image.composite(ramp, fill(size, colors[i]), Image.fromarray(mask[None]))
+
+    lut: list[int] = np.asarray(ramp)[0].T.ravel().tolist()
+    return lut
+
+
+def color_ramp(colors: Sequence[RGBColor], positions: Sequence[float]) -> list[int]:
+    """Creates a color ramp of a gradient as a lookup table.
+
+    The lookup table maps the values of a gradient mask from the first
+    color stop (255) to the last color stop (0) onto colors.
+    It is applied to the mask with `apply_color_ramp`.
+
+    Arguments:
+        colors: A sequence of RGB colors.
+        positions: A sequence of floats. The positions of color stops.
+
+    Returns:
+        The lookup table of 768 integers.
+
+    Raises:
+        AssertionError: if `colors` and/or `positions` have invalid size.
+    """
+
+    assert len(colors) >= 2
+    assert len(colors) == len(positions)
+    for color in colors:
+        assert len(color) == 3
+
+    return _color_ramp(
+        tuple(tuple(color) for color in colors),
+        tuple(positions),
+    )
+
+
+def apply_color_ramp(mask: Image.Image, lut: Sequence[int]) -> Image.Image:
+    """Maps a gradient mask onto colors.
+
+    Arguments:
+        mask: A gradient mask (L only).
+        lut: A color ramp (see `color_ramp`).
+
+    Returns:
+        The output image (RGB).
+    """
+
+    return Image.merge("RGB", [mask.point(lut[i : i + 256]) for i in (0, 256, 512)])
@@ -0,0 +1,57 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from pilgram.types import ColorMatrix
+
+IDENTITY_MATRIX: ColorMatrix = (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0)
+
+
+def _multiply(m2: ColorMatrix, m1: ColorMatrix) -> ColorMatrix:
+    """Returns the matrix which applies `m1` and then `m2`"""
+
+    composed: list[float] = []
+    for i in range(3):
+        row = m2[i * 4 : i * 4 + 4]
+        for j in range(4):
+            composed.append(sum(row[k] * m1[k * 4 + j] for k in range(3)))
+        composed[-1] += row[3]
+
+    return tuple(composed)
+
+
+def compose_color_matrices(*matrices: ColorMatrix) -> ColorMatrix:
+    """Composes color matrices into a single matrix.
+
+    The intermediate results are neither rounded nor clipped.
+
+    Arguments:
+        *matrices: 3x4 color matrices in the order of application.
+            The layout is the same as the `matrix` argument of `Image.convert`.
+
+    Returns:
+        The composed matrix.
+
+    Raises:
+        ValueError: if any matrix has invalid size.
+    """
+
+    composed = IDENTITY_MATRIX
+    for matrix in matrices:
+        if len(matrix) != 12:
+            raise ValueError(f"A size of color matrix must be 12: {len(matrix)}")
+
+        composed = _multiply(matrix, composed)
+
+    return composed
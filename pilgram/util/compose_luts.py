@@ -0,0 +1,55 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from functools import lru_cache
+
+from pilgram.types import LUT256
+from pilgram.util.clip import clip
+
+
+@lru_cache(maxsize=256)
+def _compose_luts(luts: tuple[tuple[int, ...], ...]) -> tuple[int, ...]:
+    """Returns composed LUT of hashable LUTs"""
+
+    composed = list(range(256))
+    for lut in luts:
+        # NOTE: `Image.point` clips each stage, so the index never overflows
+        composed = [lut[int(clip(x))] for x in composed]
+
+    return tuple(int(clip(x)) for x in composed)
+
+
+def compose_luts(*luts: LUT256) -> LUT256:
+    """Composes LUTs into a single LUT.
+
+    Applying the composed LUT once is bit-identical to applying
+    the LUTs one after another with `Image.point`.
+
+    Arguments:
+        *luts: LUTs (LookUp Tables) in the order of application.
+            The size of each LUT must be 256.
+
+    Returns:
+        The composed LUT.
+
+    Raises:
+        ValueError: if any LUT has invalid size.
+    """
+
+    for lut in luts:
+        if len(lut) != 256:
+            raise ValueError(f"A size of LUT must be 256: {len(lut)}")
+
+    return _compose_luts(tuple(tuple(lut) for lut in luts))
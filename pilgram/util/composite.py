@@ -0,0 +1,48 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from PIL import Image
+
+from pilgram.types import Layer
+from pilgram.util.fill import fill, fill_color
+
+
+def composite(im1: Layer, im2: Layer, mask: Image.Image) -> Image.Image:
+    """Composites two layers as `Image.composite`, without filling solid colors.
+
+    A solid color `im2` is filled as the output image, which `im1` is
+    pasted on. A solid color `im1` is pasted as a color through the mask,
+    without being filled.
+
+    Arguments:
+        im1: An image or color (see `fill`). Selected where the mask is white.
+        im2: An image or color (see `fill`). Selected where the mask is black.
+        mask: A mask image (L only).
+
+    Returns:
+        The output image.
+    """
+
+    if isinstance(im2, tuple):
+        out = fill(mask.size, im2)
+    else:
+        out = im2.copy()
+
+    if isinstance(im1, tuple):
+        out.paste(fill_color(im1), None, mask)
+    else:
+        out.paste(im1, None, mask)
+
+    return out
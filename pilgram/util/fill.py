@@ -18,6 +18,29 @@ from PIL import Image
 from pilgram.types import RGBAColor, RGBColor, Size
 
 
+def fill_color(color: RGBColor | RGBAColor) -> tuple[int, ...]:
+    """Returns the 8-bit band values of a fill color.
+
+    Arguments:
+        color: A tuple of 3 or 4 integers. The fill color.
+            The alpha is a float from 0 to 1.
+
+    Returns:
+        A tuple of 3 or 4 integers.
+
+    Raises:
+        AssertionError: if `color` has invalid size.
+    """
+
+    assert len(color) in [3, 4]
+
+    if len(color) == 4:
+        r, g, b, a = color
+        return (r, g, b, int(round(a * 255)))
+    else:
+        return tuple(color)
+
+
 def fill(size: Size, color: RGBColor | RGBAColor) -> Image.Image:
     """Fills new image with the color.
 
@@ -33,19 +56,8 @@ def fill(size: Size, color: RGBColor | RGBAColor) -> Image.Image:
     """
 
     assert len(size) == 2
-    assert len(color) in [3, 4]
 
-    if len(color) == 4:
-        r, g, b, a = color
-        alpha_int = int(round(a * 255))
-        color = (r, g, b, alpha_int)
-
-    uniqued = list(set(color))
-    cmap = {c: Image.new("L", size, c) for c in uniqued}
+    color_ = fill_color(color)
+    mode = "RGBA" if len(color_) == 4 else "RGB"
 
-    if len(color) == 3:
-        r, g, b = color
-        return Image.merge("RGB", (cmap[r], cmap[g], cmap[b]))
-    else:
-        r, g, b, a = color
-        return Image.merge("RGBA", (cmap[r], cmap[g], cmap[b], cmap[a]))
+    return Image.new(mode, size, color_)
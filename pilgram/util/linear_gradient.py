@@ -17,7 +17,8 @@ import numpy as np
 from PIL import Image
 
 from pilgram.types import RGBColor, Size
-from pilgram.util.fill import fill
+from pilgram.util.cache import gradient_cache
+from pilgram.util.color_ramp import apply_color_ramp, color_ramp
 from pilgram.util.invert import invert
 
 
@@ -41,6 +42,7 @@ def _prepared_linear_gradient_mask(
         return resized_mask
 
 
+@gradient_cache
 def linear_gradient_mask(
     size: Size,
     start: float = 0,
@@ -49,6 +51,8 @@ def linear_gradient_mask(
 ) -> Image.Image:
     """Creates mask image for linear gradient image.
 
+    The result is cached in `gradient_cache` and returned read-only.
+
     Arguments:
         size: A tuple of 2 integers. The size of output image.
         start: An optional number. The starting point start.
@@ -86,6 +90,7 @@ def linear_gradient_mask(
     return Image.fromarray(mask)
 
 
+@gradient_cache
 def linear_gradient(
     size: Size,
     start: RGBColor,
@@ -94,6 +99,9 @@ def linear_gradient(
 ) -> Image.Image:
     """Creates linear gradient image.
 
+    The gradient is evaluated as a color ramp indexed by the mask.
+    The result is cached in `gradient_cache` and returned read-only.
+
     Arguments:
         size: A tuple of 2 integers. The size of output image.
         start: A tuple of 3 integers. The starting point color.
@@ -115,8 +123,6 @@ def linear_gradient(
     assert len(start) == 3
     assert len(end) == 3
 
-    im_start = fill(size, start)
-    im_end = fill(size, end)
     mask = linear_gradient_mask(size, is_horizontal=is_horizontal)
 
-    return Image.composite(im_start, im_end, mask)
+    return apply_color_ramp(mask, color_ramp([start, end], [0, 1]))
@@ -0,0 +1,188 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageSequence
+
+from pilgram.types import FilterFunction
+from pilgram.util.apply_intensity import apply_intensity
+from pilgram.util.or_convert import or_convert
+
+
+@lru_cache(maxsize=64)
+def _transform_palette(
+    fn: FilterFunction, mode: str, palette: bytes, intensity: float = 1
+) -> bytes:
+    """Applies a color-only filter to the colors of a palette.
+
+    The palette (RGB or RGBA) is filtered as a single row of pixels.
+    The alpha of an RGBA palette is kept as is.
+    """
+
+    n = len(palette) // len(mode)
+    colors = Image.frombytes(mode, (n, 1), palette)
+    rgb = or_convert(colors, "RGB")
+    out = apply_intensity(rgb, or_convert(fn(rgb), "RGB"), intensity)
+    if mode == "RGBA":
+        out.putalpha(colors.getchannel("A"))
+
+    return out.tobytes()
+
+
+def apply_palette(
+    im: Image.Image, fn: FilterFunction, intensity: float = 1
+) -> Image.Image:
+    """Applies a color-only filter to the palette of a palette image.
+
+    Only the palette entries are filtered, so the cost does not depend on
+    the image size and the output is the same as filtering every pixel.
+    The transformed palettes are cached, so images (e.g. GIF frames)
+    sharing a palette filter it only once.
+
+    It is only valid for filters whose output pixel depends on nothing but
+    the input pixel color (i.e. no gradients, masks or neighbours).
+
+    Arguments:
+        im: An input image (P only).
+        fn: A color-only filter function.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter (see `util.apply_intensity`). Defaults to 1.
+
+    Returns:
+        The output image (P). The pixels and info (e.g. transparency)
+        are the same as the input.
+
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+        ValueError: if the mode of `im` is not P.
+    """
+
+    if im.mode != "P":
+        raise ValueError(f"Unsupported mode: {im.mode!r}")
+
+    mode = "RGBA" if im.palette is not None and im.palette.mode == "RGBA" else "RGB"
+    palette = im.getpalette(mode)
+    assert palette is not None
+
+    out = im.copy()
+    out.putpalette(_transform_palette(fn, mode, bytes(palette), intensity), mode)
+    return out
+
+
+def _keys(im: Image.Image) -> np.ndarray:
+    """Returns the 24-bit value of each pixel of an RGB image"""
+
+    words = np.asarray(im.convert("RGBX")).view(np.uint32)[..., 0]
+    return words & 0xFFFFFF
+
+
+def apply_unique_colors(
+    im: Image.Image,
+    fn: FilterFunction,
+    max_colors: int = 256,
+    intensity: float = 1,
+) -> Image.Image:
+    """Applies a color-only filter to the unique colors of an image.
+
+    If the image has at most `max_colors` colors (e.g. screenshots,
+    graphics or GIF frames decoded as RGB), only those colors are filtered
+    and each pixel is mapped to its filtered color. Otherwise the filter
+    is applied to the whole image. The output is the same either way.
+
+    Mapping the pixels costs a few passes over the image, so this pays
+    off for filters slower than that (e.g. `maven` or `nashville`).
+
+    Arguments:
+        im: An input image (RGB or RGBA). The alpha is kept as is.
+        fn: A color-only filter function.
+        max_colors: An optional integer between 1 and 256.
+            The maximum number of unique colors. Defaults to 256.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter (see `util.apply_intensity`). Defaults to 1.
+
+    Returns:
+        The output image (RGB or RGBA).
+
+    Raises:
+        AssertionError: if `max_colors` or `intensity` is out of range.
+        ValueError: if the mode of `im` is not RGB or RGBA.
+    """
+
+    assert 1 <= max_colors <= 256
+
+    if im.mode == "RGBA":
+        out = apply_unique_colors(im.convert("RGB"), fn, max_colors, intensity)
+        out.putalpha(im.getchannel("A"))
+        return out
+    elif im.mode != "RGB":
+        raise ValueError(f"Unsupported mode: {im.mode!r}")
+
+    counts = im.getcolors(max_colors)
+    if counts is None:
+        return apply_intensity(im, or_convert(fn(im), "RGB"), intensity)
+
+    data = np.array([color for _, color in counts], dtype=np.uint8).tobytes()
+    colors = Image.frombytes("RGB", (len(counts), 1), data)
+
+    # NOTE: the colors are sorted by their 24-bit values, so each pixel is
+    #       mapped to the index of its color by a binary search
+    keys = _keys(colors)[0]
+    order = np.argsort(keys)
+    colors = Image.frombytes("RGB", colors.size, np.asarray(colors)[0, order].tobytes())
+    indices = np.searchsorted(keys[order], _keys(im)).astype(np.uint8)
+
+    out = Image.frombytes("P", im.size, indices.tobytes())
+    palette = _transform_palette(fn, "RGB", colors.tobytes(), intensity)
+    out.putpalette(palette, "RGB")
+    return out.convert("RGB")
+
+
+def apply_frames(
+    im: Image.Image, fn: FilterFunction, intensity: float = 1
+) -> list[Image.Image]:
+    """Applies a color-only filter to each frame of an animated image.
+
+    P frames are filtered by their palettes (see `apply_palette`),
+    so frames sharing a palette filter it only once. The other frames
+    are filtered by their unique colors (see `apply_unique_colors`).
+
+    Pillow decodes GIF frames after the first one as RGB by default.
+    Set `GifImagePlugin.LOADING_STRATEGY` to
+    `LoadingStrategy.RGB_AFTER_DIFFERENT_PALETTE_ONLY` to keep the frames
+    using the global palette as P.
+
+    Arguments:
+        im: An input image, possibly of multiple frames.
+        fn: A color-only filter function.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter (see `util.apply_intensity`). Defaults to 1.
+
+    Returns:
+        The list of the output frames.
+    """
+
+    frames = []
+    for frame in ImageSequence.Iterator(im):
+        if frame.mode == "P":
+            frames.append(apply_palette(frame, fn, intensity))
+        elif frame.mode in ("RGB", "RGBA"):
+            frames.append(apply_unique_colors(frame, fn, intensity=intensity))
+        else:
+            rgb = frame.convert("RGB")
+            frames.append(apply_unique_colors(rgb, fn, intensity=intensity))
+
+    return frames
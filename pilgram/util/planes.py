@@ -0,0 +1,69 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from numpy.typing import DTypeLike
+from PIL import Image
+
+from pilgram.util.arena import scratch_arena
+
+
+def to_planes(im: Image.Image, dtype: DTypeLike = np.uint8) -> np.ndarray:
+    """Converts an image to an array of planes, one per band.
+
+    Planes are the form of the few stages computed with NumPy (the float
+    colors of non-separable blend modes and the RGBA compositing), where
+    per-pixel operations across bands are elementwise operations between
+    planes. They are converted from and to images within each such stage:
+    filters keep Pillow images between their stages, and there is no
+    array buffer across a whole filter. The array is drawn from
+    `scratch_arena`.
+
+    Arguments:
+        im: An image.
+        dtype: An optional data type of the planes. Defaults to uint8.
+
+    Returns:
+        The array of shape (bands, height, width).
+    """
+
+    planes = scratch_arena.empty((len(im.getbands()), im.height, im.width), dtype)
+    for plane, band in zip(planes, im.split(), strict=True):
+        np.copyto(plane, np.asarray(band))
+
+    return planes
+
+
+def from_planes(planes: np.ndarray, mode: str = "RGB") -> Image.Image:
+    """Converts uint8 planes to an image with a single copy.
+
+    Each plane is wrapped as an L image without a copy, and the bands are
+    merged into the output. Merging planes is faster than converting an
+    (H, W, C) array, which is transposed and packed first, and the planes
+    can be scratch arrays.
+
+    Arguments:
+        planes: A uint8 array of shape (bands, height, width).
+        mode: An optional string. The mode of the output image.
+            Defaults to RGB.
+
+    Returns:
+        The output image.
+    """
+
+    bands = [Image.fromarray(plane) for plane in planes]
+    if len(bands) == 1:
+        return bands[0].copy()
+
+    return Image.merge(mode, bands)
@@ -14,14 +14,15 @@
 
 import math
 from collections.abc import Sequence
-from functools import reduce
 from typing import Any
 
 import numpy as np
 from PIL import Image
 
 from pilgram.types import RGBColor, Size
-from pilgram.util.fill import fill
+from pilgram.util.arena import scratch_arena
+from pilgram.util.cache import gradient_cache
+from pilgram.util.color_ramp import apply_color_ramp, color_ramp
 from pilgram.util.invert import invert
 
 
@@ -38,14 +39,45 @@ def _prepared_radial_gradient_mask(size: Size, scale: float = 1) -> Image.Image:
     return mask.resize(size, box=box)
 
 
+def _axis(n: int, lo: float, hi: float, downsample: int) -> np.ndarray:
+    """Returns float32 coordinates of pixels along an axis.
+
+    With `downsample`, the coordinates of the centers of
+    `downsample`-pixel blocks are returned instead.
+    """
+
+    if downsample == 1:
+        return np.linspace(-lo, hi, n, dtype=np.float32)
+
+    step = (lo + hi) / max(n - 1, 1)
+    index = (np.arange(math.ceil(n / downsample)) + 0.5) * downsample - 0.5
+    return (index * step - lo).astype(np.float32)
+
+
+def _unmirror(mask: np.ndarray, nx: int, ny: int) -> np.ndarray:
+    """Appends the mirror images of the mask"""
+
+    if nx > 0:
+        mask = np.concatenate([mask, mask[:, nx - 1 :: -1]], axis=1)
+    if ny > 0:
+        mask = np.concatenate([mask, mask[ny - 1 :: -1]], axis=0)
+    return mask
+
+
+@gradient_cache
 def radial_gradient_mask(
     size: Size,
     length: float = 0,
     scale: float = 1,
     center: tuple[float, float] = (0.5, 0.5),
+    downsample: int = 1,
 ) -> Image.Image:
     """Creates mask image for radial gradient image.
 
+    The mask is computed in float32. If the mask is symmetric about
+    the center, only one quadrant is computed and mirrored.
+    The result is cached in `gradient_cache` and returned read-only.
+
     Arguments:
         size: A tuple of 2 integers. The size of mask image.
         length: An optional number. The percentage of inner color stop.
@@ -55,11 +87,22 @@ def radial_gradient_mask(
         center: An optional tuple of two floats.
             The percentage of center position for the circle.
             Defaults to the center (0.5, 0.5).
+        downsample: An optional integer. Computes the mask once for each
+            block of `downsample` x `downsample` pixels, at its center.
+            Each pixel is then off by at most
+            `1 + 255 * downsample / (r * (scale - length))` levels,
+            where `r` is the distance in pixels from the center to
+            the farthest corner. Defaults to 1, the exact mask.
 
     Returns:
         The mask image.
+
+    Raises:
+        AssertionError: if `downsample` is less than 1.
     """
 
+    assert downsample >= 1
+
     if length >= 1:
         return Image.new("L", size, 255)
 
@@ -78,22 +121,40 @@ def radial_gradient_mask(
     rh_top = h * cy
     rh_bottom = h * (1 - cy)
 
-    x = np.linspace(-rw_left, rw_right, w)
-    y = np.linspace(-rh_top, rh_bottom, h)[:, None]
+    x = _axis(w, rw_left, rw_right, downsample)
+    y = _axis(h, rh_top, rh_bottom, downsample)
+
+    # NOTE: the number of elements mirrored along each axis
+    nx = len(x) // 2 if cx == 0.5 and w % downsample == 0 else 0
+    ny = len(y) // 2 if cy == 0.5 and h % downsample == 0 else 0
+    x = x[: len(x) - nx]
+    y = y[: len(y) - ny]
 
     # r is a radius to the farthest-corner
     r = math.sqrt(max(rw_left, rw_right) ** 2 + max(rh_top, rh_bottom) ** 2)
     base = max(scale - length, 0.001)  # avoid a division by zero
 
-    mask = np.sqrt(x**2 + y**2) / r  # distance from center
-    mask = (mask - length) / base  # adjust ending shape
-    mask = 1 - mask  # invert: distance to center
-    mask *= 255
-    mask = mask.clip(0, 255)
+    # 255 x (1 - (d / r - length) / base), where d is the distance from center
+    a = np.float32(-255 / (r * base))
+    b = np.float32(255 * (1 + length / base) + 0.5)  # round by truncation
 
-    return Image.fromarray(mask.round().astype(np.uint8))
+    with scratch_arena:
+        d = scratch_arena.empty((len(y), len(x)), np.float32)
+        np.add(np.square(y)[:, None], np.square(x), out=d)
+        np.sqrt(d, out=d)
+        d *= a
+        d += b
+        np.clip(d, 0, 255, out=d)
+        mask = _unmirror(d.astype(np.uint8), nx, ny)
 
+    if downsample == 1:
+        return Image.fromarray(mask)
 
+    box = (0, 0, w / downsample, h / downsample)
+    return Image.fromarray(mask).resize(size, Image.Resampling.NEAREST, box=box)
+
+
+@gradient_cache
 def radial_gradient(
     size: Size,
     colors: Sequence[RGBColor],
@@ -102,6 +163,10 @@ def radial_gradient(
 ) -> Image.Image:
     """Creates radial gradient image.
 
+    The gradient is evaluated as a color ramp indexed by a single mask
+    from the first to the last color stop.
+    The result is cached in `gradient_cache` and returned read-only.
+
     Arguments:
         size: A tuple of 2 integers. The size of output image.
         colors: A sequence of RGB colors.
@@ -127,15 +192,8 @@ def radial_gradient(
         assert len(positions) >= 2
         assert len(colors) == len(positions)
 
-    color_images = [fill(size, color) for color in colors]
-
-    def compose(
-        x: tuple[Image.Image, float], y: tuple[Image.Image, float]
-    ) -> tuple[Image.Image, float]:
-        kwargs_ = kwargs.copy()
-        kwargs_["length"] = x[1]
-        kwargs_["scale"] = y[1]
-        mask = radial_gradient_mask(size, **kwargs_)
-        return (Image.composite(x[0], y[0], mask), y[1])
+    kwargs["length"] = positions[0]
+    kwargs["scale"] = positions[-1]
+    mask = radial_gradient_mask(size, **kwargs)
 
-    return reduce(compose, zip(color_images, positions, strict=False))[0]
+    return apply_color_ramp(mask, color_ramp(colors, positions))
@@ -0,0 +1,84 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+import pytest
+from PIL import Image
+from pytest_mock import MockerFixture
+
+from pilgram import css, util
+
+
+def _random_image() -> Image.Image:
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (8, 8, 3), dtype=np.uint8))
+
+
+def test_apply_color_matrix() -> None:
+    im = _random_image()
+    matrix = css.sepia_matrix(0.5)
+
+    assert util.apply_color_matrix(im, matrix) == im.convert("RGB", matrix)
+
+
+def test_apply_color_matrix_fused(mocker: MockerFixture) -> None:
+    im = _random_image()
+    matrices = (css.saturate_matrix(0.5), css.grayscale_matrix(0.5))
+    expected = css.grayscale(css.saturate(im, 0.5), 0.5)
+
+    spy = mocker.spy(Image.Image, "convert")
+    actual = util.apply_color_matrix(im, *matrices)
+
+    assert spy.call_count == 1
+    diff = np.asarray(actual, dtype=np.int16) - np.asarray(expected)
+    assert np.abs(diff).max() <= 1  # rounding error
+
+
+def test_apply_color_matrix_split_on_clipping(mocker: MockerFixture) -> None:
+    im = _random_image()
+    matrices = (css.hue_rotate_matrix(-10), css.sepia_matrix(0.3))
+    expected = css.sepia(css.hue_rotate(im, -10), 0.3)
+
+    spy = mocker.spy(Image.Image, "convert")
+    actual = util.apply_color_matrix(im, *matrices)
+
+    assert spy.call_count == 2
+    assert actual == expected
+
+
+def test_apply_color_matrix_hsv() -> None:
+    im = _random_image().convert("HSV")
+    actual = util.apply_color_matrix(im, css.saturate_matrix(0.5))
+
+    expected = im.convert("RGB").convert("RGB", css.saturate_matrix(0.5))
+
+    assert actual.mode == "HSV"
+    assert actual == expected.convert("HSV")
+
+
+def test_apply_color_matrix_grayscale_l() -> None:
+    im = _random_image()
+    matrices = (css.sepia_matrix(0.3), css.grayscale_matrix())
+    expected = util.apply_color_matrix(im, *matrices).getchannel("R")
+
+    actual = util.apply_color_matrix(im, *matrices, mode="L")
+
+    assert actual.mode == "L"
+    assert actual == expected
+
+
+def test_apply_color_matrix_l_invalid_matrix() -> None:
+    with pytest.raises(ValueError):
+        util.apply_color_matrix(_random_image(), css.sepia_matrix(), mode="L")
@@ -0,0 +1,43 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pilgram import util
+
+
+def _random_image(seed: int) -> Image.Image:
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, (8, 8, 3), dtype=np.uint8))
+
+
+def test_apply_intensity() -> None:
+    im, filtered = _random_image(0), _random_image(1)
+
+    actual = util.apply_intensity(im, filtered, 0.4)
+    assert actual == Image.blend(im, filtered, 0.4)
+
+
+def test_apply_intensity_full() -> None:
+    im, filtered = _random_image(0), _random_image(1)
+    assert util.apply_intensity(im, filtered, 1) is filtered
+
+
+def test_apply_intensity_invalid_intensity() -> None:
+    im, filtered = _random_image(0), _random_image(1)
+    with pytest.raises(AssertionError):
+        util.apply_intensity(im, filtered, 1.5)
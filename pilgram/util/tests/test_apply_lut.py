@@ -35,3 +35,19 @@ def test_apply_lut_value_error() -> None:
     lut = [255 - i for i in range(255)]
     with pytest.raises(ValueError):
         util.apply_lut(im, lut)
+
+
+def test_apply_lut_multiple() -> None:
+    im = util.fill((2, 2), (0, 127, 255))
+    lut_double = [2 * i for i in range(256)]
+    lut_invert = [255 - i for i in range(256)]
+
+    expected = util.apply_lut(util.apply_lut(im, lut_double), lut_invert)
+    assert util.apply_lut(im, lut_double, lut_invert) == expected
+
+
+def test_apply_lut_multiple_value_error() -> None:
+    im = util.fill((2, 2), (0, 127, 255))
+    lut = [255 - i for i in range(255)]
+    with pytest.raises(ValueError):
+        util.apply_lut(im, list(range(256)), lut)
@@ -0,0 +1,107 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import numpy as np
+from PIL import Image
+
+from pilgram import css, util
+
+
+def test_scratch_arena() -> None:
+    arena = util.ScratchArena()
+
+    with arena:
+        a = arena.empty((4, 4), np.uint16)
+        assert a.shape == (4, 4)
+        assert a.dtype == np.uint16
+
+        with arena:
+            b = arena.zeros((4, 4), np.uint16)
+            assert b is not a
+            assert not b.any()
+
+        # NOTE: `b` is returned to the pool
+        assert arena.empty((4, 4), np.uint16) is b
+        assert arena.empty((4, 4), np.uint8) is not b
+
+    assert arena.info() == util.ArenaInfo(hits=1, misses=3, buffers=0, nbytes=0)
+
+
+def test_scratch_arena_info() -> None:
+    arena = util.ScratchArena()
+
+    with arena:
+        with arena:
+            arena.empty((2, 3), np.float32)
+        assert arena.info() == util.ArenaInfo(hits=0, misses=1, buffers=1, nbytes=24)
+
+    # NOTE: the pool is released by the outermost scope
+    assert arena.info().buffers == 0
+
+
+def test_scratch_arena_outside_scope() -> None:
+    arena = util.ScratchArena()
+
+    a = arena.empty((4, 4), np.uint8)
+    assert arena.empty((4, 4), np.uint8) is not a
+    assert arena.info() == util.ArenaInfo(hits=0, misses=0, buffers=0, nbytes=0)
+
+
+def test_scratch_arena_clear() -> None:
+    arena = util.ScratchArena()
+
+    with arena:
+        with arena:
+            arena.empty((4, 4), np.uint8)
+        arena.clear()
+        assert arena.info() == util.ArenaInfo(hits=0, misses=0, buffers=0, nbytes=0)
+
+
+def test_scratch_arena_per_thread() -> None:
+    arena = util.ScratchArena()
+    infos = []
+
+    def run() -> None:
+        with arena:
+            arena.empty((4, 4), np.uint8)
+        infos.append(arena.info())
+
+    with arena:
+        arena.empty((4, 4), np.uint8)
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+    assert infos == [util.ArenaInfo(hits=0, misses=1, buffers=0, nbytes=0)]
+    assert arena.info().misses == 1
+
+
+def test_scratch_arena_batch() -> None:
+    rng = np.random.default_rng(0)
+    ims = [
+        Image.fromarray(rng.integers(0, 256, (8, 8, 3), dtype=np.uint8))
+        for _ in range(3)
+    ]
+    expected = [css.blending.hard_light(im, ims[0]) for im in ims]
+
+    util.scratch_arena.clear()
+    with util.scratch_arena:
+        actual = [css.blending.hard_light(im, ims[0]) for im in ims]
+
+    assert [im.tobytes() for im in actual] == [im.tobytes() for im in expected]
+    info = util.scratch_arena.info()
+    assert info.misses == 2
+    assert info.hits == 4
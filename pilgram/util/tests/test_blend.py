@@ -0,0 +1,54 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pilgram import util
+
+
+@pytest.fixture
+def im() -> Image.Image:
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (16, 16, 3), dtype=np.uint8))
+
+
+@pytest.mark.parametrize("alpha", [0, 0.3, 0.6, 1, 1.5])
+def test_blend_color(im: Image.Image, alpha: float) -> None:
+    color = (43, 42, 161)
+    solid = util.fill(im.size, color)
+
+    assert util.blend(im, color, alpha) == Image.blend(im, solid, alpha)
+    assert util.blend(color, im, alpha) == Image.blend(solid, im, alpha)
+
+
+def test_blend_color_alpha() -> None:
+    rng = np.random.default_rng(0)
+    im = Image.fromarray(rng.integers(0, 256, (16, 16, 4), dtype=np.uint8))
+    color = (43, 42, 161, 0.5)
+
+    expected = Image.blend(im, util.fill(im.size, color), 0.4)
+    assert util.blend(im, color, 0.4) == expected
+
+
+def test_blend_images(im: Image.Image) -> None:
+    im2 = util.fill(im.size, (43, 42, 161))
+    assert util.blend(im, im2, 0.6) == Image.blend(im, im2, 0.6)
+
+
+def test_blend_colors() -> None:
+    with pytest.raises(AssertionError):
+        util.blend((0, 0, 0), (255, 255, 255), 0.5)
@@ -0,0 +1,145 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageChops
+
+from pilgram import util
+
+
+def test_image_cache_hit_and_miss() -> None:
+    cache = util.ImageCache(maxbytes=1024)
+    calls = []
+
+    @cache
+    def create(size: tuple[int, int], color: int = 0) -> Image.Image:
+        calls.append(size)
+        return Image.new("L", size, color)
+
+    im1 = create((4, 4))
+    im2 = create((4, 4), color=0)  # same arguments as above
+    im3 = create((4, 4), 255)
+
+    assert calls == [(4, 4), (4, 4)]
+    assert list(im1.get_flattened_data()) == list(im2.get_flattened_data())
+    assert list(im3.get_flattened_data()) == [255] * 16
+    assert cache.info() == util.CacheInfo(1, 2, 1024, 32, 2)
+
+
+def test_image_cache_freezes_arguments() -> None:
+    cache = util.ImageCache(maxbytes=1024)
+
+    @cache
+    def create(size: list[int]) -> Image.Image:
+        return Image.new("L", (size[0], size[1]))
+
+    create([4, 4])
+    create([4, 4])
+
+    assert cache.info().hits == 1
+
+
+def test_image_cache_evicts_least_recently_used() -> None:
+    cache = util.ImageCache(maxbytes=48)  # 3 L images of 4x4
+
+    for key in "abc":
+        cache.put(key, Image.new("L", (4, 4)))
+    cache.get("a")
+    cache.put("d", Image.new("L", (4, 4)))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.get("d") is not None
+    assert cache.info().currbytes == 48
+
+
+def test_image_cache_counts_rgb_as_4_bytes() -> None:
+    cache = util.ImageCache(maxbytes=1024)
+    cache.put("rgb", Image.new("RGB", (4, 4)))
+
+    assert cache.info().currbytes == 64
+
+
+def test_image_cache_skips_large_images() -> None:
+    cache = util.ImageCache(maxbytes=15)
+    im = cache.put("a", Image.new("L", (4, 4), 1))
+
+    assert list(im.get_flattened_data()) == [1] * 16
+    assert cache.get("a") is None
+    assert cache.info().entries == 0
+
+
+def test_image_cache_maxbytes() -> None:
+    cache = util.ImageCache(maxbytes=1024)
+    cache.put("a", Image.new("L", (4, 4)))
+    cache.put("b", Image.new("L", (4, 4)))
+    cache.maxbytes = 16
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.info().maxbytes == 16
+
+
+def test_image_cache_clear() -> None:
+    cache = util.ImageCache(maxbytes=1024)
+    cache.put("a", Image.new("L", (4, 4)))
+    cache.get("a")
+    cache.clear()
+
+    assert cache.info() == util.CacheInfo(0, 0, 1024, 0, 0)
+
+
+def test_image_cache_copy_on_write() -> None:
+    cache = util.ImageCache(maxbytes=1024)
+    im = cache.put("a", Image.new("RGB", (4, 4)))
+    im.paste((255, 0, 0), (0, 0, 2, 2))
+    im.putpixel((3, 3), (0, 255, 0))
+
+    cached = cache.get("a")
+    assert cached is not None
+    assert cached.readonly
+    assert cached.getbbox() is None
+    assert im.getpixel((0, 0)) == (255, 0, 0)
+
+
+def test_image_cache_threads() -> None:
+    cache = util.ImageCache(maxbytes=16 * 8)
+
+    @cache
+    def create(color: int) -> Image.Image:
+        return Image.new("L", (4, 4), color)
+
+    def run(i: int) -> bool:
+        return create(i % 16).getpixel((0, 0)) == i % 16
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(run, range(1000)))
+
+    info = cache.info()
+    assert info.hits + info.misses == 1000
+    assert info.currbytes <= info.maxbytes
+
+
+def test_gradient_cache() -> None:
+    util.gradient_cache.clear()
+    size = (6, 4)
+    mask1 = util.radial_gradient_mask(size, length=0.3)
+    mask2 = util.radial_gradient_mask(size, length=0.3, scale=1)
+
+    assert util.gradient_cache.info().hits == 1
+    assert ImageChops.difference(mask1, mask2).getbbox() is None
+    assert mask2.readonly
@@ -0,0 +1,109 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pilgram import css, util
+
+
+def test_identity_lattice() -> None:
+    lattice = util.identity_lattice(3)
+    pixels = list(lattice.get_flattened_data())
+
+    assert lattice.size == (3, 9)
+    assert lattice.mode == "RGB"
+    assert pixels[:4] == [(0, 0, 0), (128, 0, 0), (255, 0, 0), (0, 128, 0)]
+    assert pixels[-1] == (255, 255, 255)
+
+
+def test_identity_lattice_nodes_are_exact() -> None:
+    lattice = np.asarray(util.identity_lattice())
+    assert sorted(set(lattice[..., 0].ravel())) == list(range(0, 256, 5))
+
+
+def test_identity_lattice_invalid_size() -> None:
+    with pytest.raises(AssertionError):
+        util.identity_lattice(66)
+
+
+def test_compile_color_lut_cached() -> None:
+    lut1 = util.compile_color_lut(css.sepia)
+    lut2 = util.compile_color_lut(css.sepia)
+    assert lut1 is lut2
+
+
+def test_apply_color_lut_identity() -> None:
+    im = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (8, 8, 3), dtype=np.uint8)
+    )
+    lut = util.compile_color_lut(lambda im: im)
+
+    assert util.apply_color_lut(im, lut) == im
+
+
+def test_apply_color_lut_matches_filter() -> None:
+    im = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (8, 8, 3), dtype=np.uint8)
+    )
+    lut = util.compile_color_lut(css.sepia)
+
+    actual = np.asarray(util.apply_color_lut(im, lut), dtype=np.int16)
+    expected = np.asarray(css.sepia(im), dtype=np.int16)
+    assert np.abs(actual - expected).max() <= 1
+
+
+def test_apply_color_lut_rgba() -> None:
+    im = util.fill((2, 2), (0, 128, 255, 0.5))
+    lut = util.compile_color_lut(lambda im: im)
+    actual = util.apply_color_lut(im, lut)
+
+    assert actual.mode == "RGB"
+    assert list(actual.get_flattened_data()) == [(0, 128, 255)] * 4
+
+
+def test_apply_color_lut_ycbcr() -> None:
+    im = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (8, 8, 3), dtype=np.uint8)
+    ).convert("YCbCr")
+    lut = util.compile_color_lut(css.sepia, mode="YCbCr")
+    actual = util.apply_color_lut(im, lut, "YCbCr")
+
+    expected = css.sepia(im.convert("RGB")).convert("YCbCr")
+    assert actual.mode == "YCbCr"
+    assert np.abs(np.asarray(actual, np.int16) - np.asarray(expected)).max() <= 1
+
+
+def test_compile_color_lut_unsupported_mode() -> None:
+    with pytest.raises(ValueError):
+        util.compile_color_lut(css.sepia, mode="LAB")
+
+
+def test_compile_color_lut_intensity() -> None:
+    im = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (8, 8, 3), dtype=np.uint8)
+    )
+    lut = util.compile_color_lut(css.sepia, intensity=0.4)
+
+    actual = np.asarray(util.apply_color_lut(im, lut), dtype=np.int16)
+    expected = np.asarray(Image.blend(im, css.sepia(im), 0.4), dtype=np.int16)
+    assert np.abs(actual - expected).max() <= 1
+
+
+def test_compile_color_lut_intensity_cached() -> None:
+    lut1 = util.compile_color_lut(css.sepia, intensity=0.4)
+    lut2 = util.compile_color_lut(css.sepia, util.color_lut.LUT_SIZE, "RGB", 0.4)
+    assert lut1 is lut2
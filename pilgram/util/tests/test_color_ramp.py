@@ -0,0 +1,51 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+from PIL import Image
+
+from pilgram import util
+
+
+def test_color_ramp_2_stops() -> None:
+    start, end = (0, 91, 154), (230, 193, 61)
+    lut = util.color_ramp([start, end], [0, 1])
+
+    mask = Image.linear_gradient("L").resize((256, 1))
+    expected = Image.composite(
+        util.fill(mask.size, start), util.fill(mask.size, end), mask
+    )
+    actual = mask.convert("RGB").point(lut)
+
+    assert len(lut) == 768
+    assert list(actual.get_flattened_data()) == list(expected.get_flattened_data())
+
+
+def test_color_ramp_3_stops() -> None:
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    lut = util.color_ramp(colors, [0, 0.6, 1])
+
+    # from the last color stop (0) to the first color stop (255)
+    assert (lut[0], lut[256], lut[512]) == (0, 0, 255)
+    assert (lut[102], lut[256 + 102], lut[512 + 102]) == (0, 255, 0)
+    assert (lut[255], lut[256 + 255], lut[512 + 255]) == (255, 0, 0)
+
+
+def test_color_ramp_invalid_size() -> None:
+    with pytest.raises(AssertionError):
+        util.color_ramp([(0, 0, 0)], [0])
+
+    with pytest.raises(AssertionError):
+        util.color_ramp([(0, 0, 0), (255, 255, 255)], [0, 0.5, 1])
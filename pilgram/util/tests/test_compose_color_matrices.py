@@ -0,0 +1,53 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from pilgram import util
+
+DOUBLE = (2, 0, 0, 0, 0, 2, 0, 0, 0, 0, 2, 0)
+SHIFT = (1, 0, 0, 10, 0, 1, 0, 20, 0, 0, 1, 30)
+SWAP = (0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 0)
+
+
+def test_compose_color_matrices_empty() -> None:
+    assert util.compose_color_matrices() == (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0)
+
+
+def test_compose_color_matrices_single() -> None:
+    assert util.compose_color_matrices(SHIFT) == SHIFT
+
+
+def test_compose_color_matrices_order() -> None:
+    # shift and then double
+    assert util.compose_color_matrices(SHIFT, DOUBLE) == (
+        2, 0, 0, 20, 0, 2, 0, 40, 0, 0, 2, 60,
+    )  # fmt: skip
+
+    # double and then shift
+    assert util.compose_color_matrices(DOUBLE, SHIFT) == (
+        2, 0, 0, 10, 0, 2, 0, 20, 0, 0, 2, 30,
+    )  # fmt: skip
+
+
+def test_compose_color_matrices_swap() -> None:
+    assert util.compose_color_matrices(SHIFT, SWAP) == (
+        0, 0, 1, 30, 0, 1, 0, 20, 1, 0, 0, 10,
+    )  # fmt: skip
+
+
+def test_compose_color_matrices_value_error() -> None:
+    with pytest.raises(ValueError):
+        util.compose_color_matrices(SHIFT, (1, 0, 0))
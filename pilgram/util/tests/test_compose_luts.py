@@ -0,0 +1,45 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from pilgram import util
+
+
+def test_compose_luts() -> None:
+    lut_add = [i + 10 for i in range(256)]
+    lut_invert = [255 - i for i in range(256)]
+    composed = util.compose_luts(lut_add, lut_invert)
+
+    assert len(composed) == 256
+    assert composed[0] == 245
+    assert composed[250] == 0  # clipped to 255 before inverting
+
+
+def test_compose_luts_clip() -> None:
+    lut_sub = [i - 10 for i in range(256)]
+    lut_identity = list(range(256))
+
+    assert util.compose_luts(lut_sub, lut_identity)[:11] == (0,) * 11
+    assert util.compose_luts(lut_sub)[:11] == (0,) * 11
+
+
+def test_compose_luts_empty() -> None:
+    assert util.compose_luts() == tuple(range(256))
+
+
+def test_compose_luts_value_error() -> None:
+    with pytest.raises(ValueError):
+        util.compose_luts(list(range(256)), list(range(255)))
@@ -0,0 +1,72 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from importlib import import_module
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pilgram import util
+from pilgram.types import Layer
+
+
+@pytest.fixture
+def im() -> Image.Image:
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (16, 16, 3), dtype=np.uint8))
+
+
+@pytest.mark.parametrize("im1", ["image", (230, 231, 224)])
+@pytest.mark.parametrize("im2", ["image", (43, 42, 161)])
+def test_composite(im: Image.Image, im1: Layer | str, im2: Layer | str) -> None:
+    mask = util.radial_gradient_mask(im.size, length=0.4, scale=1.1)
+    layer1 = im if isinstance(im1, str) else im1
+    layer2 = im.rotate(90) if isinstance(im2, str) else im2
+
+    expected = Image.composite(
+        layer1 if isinstance(layer1, Image.Image) else util.fill(im.size, layer1),
+        layer2 if isinstance(layer2, Image.Image) else util.fill(im.size, layer2),
+        mask,
+    )
+    assert util.composite(layer1, layer2, mask) == expected
+
+
+def test_composite_alpha() -> None:
+    mask = util.radial_gradient_mask((16, 16))
+    color1, color2 = (230, 231, 224, 0.2), (43, 42, 161, 0.9)
+
+    expected = Image.composite(
+        util.fill(mask.size, color1), util.fill(mask.size, color2), mask
+    )
+    assert util.composite(color1, color2, mask) == expected
+
+
+def test_composite_does_not_modify_inputs(im: Image.Image) -> None:
+    copy = im.copy()
+    util.composite((0, 0, 0), im, util.radial_gradient_mask(im.size))
+
+    assert im == copy
+
+
+def test_composite_color_not_filled(
+    im: Image.Image, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mask = util.radial_gradient_mask(im.size)
+    expected = Image.composite(util.fill(im.size, (0, 0, 0)), im, mask)
+
+    # NOTE: the color is pasted through the mask as is
+    monkeypatch.setattr(import_module("pilgram.util.composite"), "fill", None)
+    assert util.composite((0, 0, 0), im, mask) == expected
@@ -31,3 +31,8 @@ def test_fill_alpha() -> None:
     assert list(im.get_flattened_data()) == [(0, 127, 255, 128)] * (w * h)
     assert im.size == (w, h)
     assert im.mode == "RGBA"
+
+
+def test_fill_color() -> None:
+    assert util.fill_color((0, 127, 255)) == (0, 127, 255)
+    assert util.fill_color((0, 127, 255, 0.5)) == (0, 127, 255, 128)
@@ -0,0 +1,141 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import pilgram
+from pilgram import util
+from pilgram.util.palette import _transform_palette
+
+
+def _random_image(size: tuple[int, int], colors: int) -> Image.Image:
+    rng = np.random.default_rng(0)
+    im = Image.fromarray(rng.integers(0, 256, (*size[::-1], 3), dtype=np.uint8))
+    return im.quantize(colors)
+
+
+def test_apply_palette() -> None:
+    im = _random_image((16, 8), 32)
+    im.info["transparency"] = 3
+    actual = util.apply_palette(im, pilgram.clarendon)
+
+    assert actual.mode == "P"
+    assert actual.tobytes() == im.tobytes()
+    assert actual.info["transparency"] == 3
+    assert actual.convert("RGB").tobytes() == pilgram.clarendon(im).tobytes()
+
+
+def test_apply_palette_rgba() -> None:
+    im = _random_image((16, 8), 32)
+    palette = np.array(im.getpalette("RGB"), dtype=np.uint8).reshape(-1, 3)
+    alpha = np.arange(len(palette), dtype=np.uint8).reshape(-1, 1)
+    im.putpalette(np.hstack((palette, alpha)).tobytes(), "RGBA")
+
+    actual = util.apply_palette(im, pilgram.gingham)
+    expected = pilgram.gingham(im.convert("RGB"))
+
+    assert actual.convert("RGB").tobytes() == expected.tobytes()
+    assert actual.convert("RGBA").getchannel("A") == im.convert("RGBA").getchannel("A")
+
+
+def test_apply_palette_cached() -> None:
+    im = _random_image((16, 8), 32)
+    util.apply_palette(im, pilgram.inkwell)
+    hits = _transform_palette.cache_info().hits
+    util.apply_palette(im.transpose(Image.Transpose.ROTATE_90), pilgram.inkwell)
+
+    assert _transform_palette.cache_info().hits == hits + 1
+
+
+def test_apply_palette_unsupported_mode() -> None:
+    with pytest.raises(ValueError):
+        util.apply_palette(Image.new("RGB", (4, 4)), pilgram.clarendon)
+
+
+@pytest.mark.parametrize("colors", [1, 32, 256])
+def test_apply_unique_colors(colors: int) -> None:
+    im = _random_image((16, 32), colors).convert("RGB")
+    actual = util.apply_unique_colors(im, pilgram.maven)
+
+    assert actual.mode == "RGB"
+    assert actual.tobytes() == pilgram.maven(im).tobytes()
+
+
+def test_apply_unique_colors_extreme_colors() -> None:
+    colors = [(0, 0, 0), (255, 255, 255), (255, 0, 0), (0, 0, 255), (1, 0, 0)]
+    data = np.array(colors * 4, dtype=np.uint8)[::-1].tobytes()
+    im = Image.frombytes("RGB", (4, 5), data)
+    actual = util.apply_unique_colors(im, pilgram.maven)
+
+    assert actual.tobytes() == pilgram.maven(im).tobytes()
+
+
+def test_apply_unique_colors_too_many_colors() -> None:
+    im = _random_image((16, 32), 32).convert("RGB")
+    actual = util.apply_unique_colors(im, pilgram.maven, max_colors=16)
+
+    assert actual.tobytes() == pilgram.maven(im).tobytes()
+
+
+def test_apply_unique_colors_rgba() -> None:
+    im = _random_image((16, 32), 32).convert("RGBA")
+    im.putalpha(128)
+    actual = util.apply_unique_colors(im, pilgram.maven)
+
+    assert actual.mode == "RGBA"
+    assert actual.getchannel("A") == im.getchannel("A")
+    assert actual.convert("RGB").tobytes() == pilgram.maven(im).tobytes()
+
+
+def test_apply_unique_colors_invalid_max_colors() -> None:
+    im = _random_image((4, 4), 4).convert("RGB")
+    with pytest.raises(AssertionError):
+        util.apply_unique_colors(im, pilgram.maven, max_colors=257)
+
+
+def test_apply_frames(tmp_path: Path) -> None:
+    frames = [_random_image((16, 8), 32).rotate(90 * i) for i in range(3)]
+    path = tmp_path / "frames.gif"
+    frames[0].save(path, save_all=True, append_images=frames[1:])
+
+    with Image.open(path) as im:
+        actual = util.apply_frames(im, pilgram.clarendon)
+        assert len(actual) == 3
+        assert actual[0].mode == "P"
+        for i, frame in enumerate(actual):
+            im.seek(i)
+            expected = pilgram.clarendon(im.convert("RGB"))
+            assert frame.convert("RGB").tobytes() == expected.tobytes()
+
+
+def test_apply_palette_intensity() -> None:
+    im = _random_image((16, 8), 32)
+    actual = util.apply_palette(im, pilgram.clarendon, 0.4)
+
+    rgb = im.convert("RGB")
+    expected = Image.blend(rgb, pilgram.clarendon(rgb), 0.4)
+    assert actual.convert("RGB").tobytes() == expected.tobytes()
+
+
+def test_apply_unique_colors_intensity() -> None:
+    im = _random_image((16, 32), 32).convert("RGB")
+    actual = util.apply_unique_colors(im, pilgram.maven, intensity=0.4)
+
+    expected = Image.blend(im, pilgram.maven(im), 0.4)
+    assert actual.tobytes() == expected.tobytes()
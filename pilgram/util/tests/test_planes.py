@@ -0,0 +1,58 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pilgram import util
+
+
+def _random_image(mode: str) -> Image.Image:
+    rng = np.random.default_rng(0)
+    im = Image.fromarray(rng.integers(0, 256, (6, 8, 3), dtype=np.uint8))
+    return im.convert(mode)
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA", "L"])
+def test_to_planes(mode: str) -> None:
+    im = _random_image(mode)
+
+    planes = util.to_planes(im)
+    assert planes.shape == (len(mode), 6, 8)
+    assert planes.dtype == np.uint8
+    for plane, band in zip(planes, im.split(), strict=True):
+        assert np.array_equal(plane, np.asarray(band))
+
+
+def test_to_planes_dtype() -> None:
+    im = _random_image("RGB")
+
+    planes = util.to_planes(im, np.float32)
+    assert planes.dtype == np.float32
+    assert np.array_equal(planes, np.asarray(im).transpose(2, 0, 1))
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA", "L"])
+def test_from_planes(mode: str) -> None:
+    im = _random_image(mode)
+    planes = util.to_planes(im)
+
+    actual = util.from_planes(planes, mode)
+    assert actual.mode == mode
+    assert actual.tobytes() == im.tobytes()
+
+    # NOTE: the output does not share the planes
+    planes[...] = 0
+    assert actual.tobytes() == im.tobytes()
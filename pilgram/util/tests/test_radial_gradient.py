@@ -13,6 +13,13 @@
 # limitations under the License.
 
 
+import math
+from typing import Any
+
+import numpy as np
+import pytest
+from PIL import Image, ImageChops
+
 from pilgram import util
 
 
@@ -220,8 +227,63 @@ def test_radial_gradient_mask_scale_le_0() -> None:
     assert mask.mode == "L"
 
 
+@pytest.mark.parametrize("size", [(6, 4), (7, 5), (301, 203)])
+def test_radial_gradient_mask_symmetric(size: tuple[int, int]) -> None:
+    mask = np.asarray(util.radial_gradient_mask(size, length=0.3))
+
+    assert mask.shape == (size[1], size[0])
+    assert np.array_equal(mask, mask[::-1])
+    assert np.array_equal(mask, mask[:, ::-1])
+
+
+@pytest.mark.parametrize("downsample", [2, 3, 8])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"length": 0.7},
+        {"length": 0.3, "scale": 0.6, "center": (0.4, 0.4)},
+        {"center": (0, 0)},
+    ],
+)
+def test_radial_gradient_mask_downsample(
+    downsample: int, kwargs: dict[str, Any]
+) -> None:
+    w, h = size = (301, 203)
+    expected = util.radial_gradient_mask(size, **kwargs)
+    actual = util.radial_gradient_mask(size, downsample=downsample, **kwargs)
+
+    cx, cy = kwargs.get("center", (0.5, 0.5))
+    r = math.hypot(max(w * cx, w * (1 - cx)), max(h * cy, h * (1 - cy)))
+    base = kwargs.get("scale", 1) - kwargs.get("length", 0)
+    error = np.abs(np.asarray(actual, dtype=int) - np.asarray(expected))
+
+    assert actual.size == size
+    assert error.max() <= 1 + 255 * downsample / (r * base)
+
+
+def test_radial_gradient_mask_invalid_downsample() -> None:
+    with pytest.raises(AssertionError):
+        util.radial_gradient_mask((4, 4), downsample=0)
+
+
 def test_radial_gradient() -> None:
-    pass  # TODO
+    size = (31, 23)
+    colors = [(208, 186, 142), (54, 3, 9), (29, 2, 16)]
+    positions = [0.2, 0.85, 1]
+    gradient = util.radial_gradient(size, colors, positions)
+
+    # compose colors for each pair of adjacent color stops
+    expected = util.fill(size, colors[0])
+    for i in range(1, len(colors)):
+        mask = util.radial_gradient_mask(
+            size, length=positions[i - 1], scale=positions[i]
+        )
+        expected = Image.composite(expected, util.fill(size, colors[i]), mask)
+
+    error = np.asarray(ImageChops.difference(gradient, expected))
+    assert error.max() <= 2
+    assert gradient.size == size
+    assert gradient.mode == "RGB"
 
 
 def test_radial_gradient_255_to_0() -> None:
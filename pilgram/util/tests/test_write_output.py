@@ -0,0 +1,86 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pilgram import util
+
+
+def _random_image(seed: int, mode: str = "RGB") -> Image.Image:
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, (8, 8, 3), dtype=np.uint8)).convert(
+        mode
+    )
+
+
+def test_write_output() -> None:
+    im, cr = _random_image(0), _random_image(1)
+    assert util.write_output(im, cr) is cr
+
+
+def test_write_output_image() -> None:
+    im, cr = _random_image(0), _random_image(1)
+    out = Image.new("RGB", im.size)
+
+    assert util.write_output(im, cr, out) is out
+    assert out.tobytes() == cr.tobytes()
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L"])
+def test_write_output_array(mode: str) -> None:
+    im, cr = _random_image(0), _random_image(1, mode)
+    out = np.zeros_like(np.asarray(cr))
+
+    assert util.write_output(im, cr, out) is cr
+    assert np.array_equal(out, np.asarray(cr))
+
+
+def test_write_output_inplace() -> None:
+    im, cr = _random_image(0), _random_image(1)
+
+    assert util.write_output(im, cr, inplace=True) is im
+    assert im.tobytes() == cr.tobytes()
+
+
+def test_write_output_palette() -> None:
+    im = _random_image(0, "P")
+    cr = im.copy()
+    cr.putpalette(bytes(255 - i % 256 for i in range(768)))
+    out = Image.new("P", im.size)
+
+    util.write_output(im, cr, out)
+    assert out.convert("RGB").tobytes() == cr.convert("RGB").tobytes()
+
+
+@pytest.mark.parametrize(
+    "out",
+    [
+        Image.new("L", (8, 8)),
+        Image.new("RGB", (4, 8)),
+        np.zeros((8, 8), dtype=np.uint8),
+        np.zeros((8, 8, 3), dtype=np.float32),
+    ],
+)
+def test_write_output_unsupported_output(out: Image.Image | np.ndarray) -> None:
+    im, cr = _random_image(0), _random_image(1)
+    with pytest.raises(ValueError):
+        util.write_output(im, cr, out)
+
+
+def test_write_output_out_and_inplace() -> None:
+    im, cr = _random_image(0), _random_image(1)
+    with pytest.raises(AssertionError):
+        util.write_output(im, cr, Image.new("RGB", im.size), inplace=True)
@@ -0,0 +1,74 @@
+# Copyright 2019 Akiomi Kamakura
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from PIL import Image
+
+from pilgram.types import Output
+
+
+def write_output(
+    im: Image.Image,
+    cr: Image.Image,
+    out: Output | None = None,
+    inplace: bool = False,
+) -> Image.Image:
+    """Writes the output image of a filter to a destination.
+
+    Pillow operations return new images, so the output is copied into
+    the destination, an image or a uint8 array of the same size and mode.
+    With `inplace`, the destination is the input image. Outputs already
+    written to the destination are returned as is.
+
+    Arguments:
+        im: An input image of a filter.
+        cr: The output image of the filter.
+        out: An optional destination image, or an (H, W, C) uint8 array
+            ((H, W) for single band outputs). Defaults to None.
+        inplace: An optional boolean. True to overwrite `im`.
+            Defaults to False.
+
+    Returns:
+        The destination image, or `cr` if the destination is an array
+        or there is no destination.
+
+    Raises:
+        AssertionError: if both `out` and `inplace` are given.
+        ValueError: if the destination does not match the output.
+    """
+
+    assert out is None or not inplace
+
+    if inplace:
+        out = im
+    if out is None or out is cr:
+        return cr
+
+    if isinstance(out, np.ndarray):
+        bands = len(cr.getbands())
+        shape = (cr.height, cr.width, bands) if bands > 1 else (cr.height, cr.width)
+        if out.dtype != np.uint8 or out.shape != shape:
+            raise ValueError(f"Unsupported output: {out.dtype} {out.shape}")
+
+        np.copyto(out, np.asarray(cr))
+        return cr
+
+    if out.mode != cr.mode or out.size != cr.size:
+        raise ValueError(f"Unsupported output: {out.mode} {out.size}")
+
+    out.paste(cr)
+    if cr.mode == "P" and cr.palette is not None:
+        out.putpalette(cr.palette.palette, cr.palette.mode)
+
+    return out
@@ -14,27 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def valencia(im: Image.Image) -> Image.Image:
+def valencia(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Valencia filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.fill(cb.size, (58, 3, 57))
-    cs = css.blending.exclusion(cb, cs)
-    cr = Image.blend(cb, cs, 0.5)  # opacity
-
-    cr = css.contrast(cr, 1.08)
-    cr = css.brightness(cr, 1.08)
-    cr = css.sepia(cr, 0.08)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["valencia"], im, intensity=intensity)
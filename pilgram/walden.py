@@ -14,28 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def walden(im: Image.Image) -> Image.Image:
+def walden(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Walden filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
 
-    cs = util.fill(cb.size, (0, 68, 204))
-    cs = css.blending.screen(cb, cs)
-    cr = Image.blend(cb, cs, 0.3)  # opacity
-
-    cr = css.brightness(cr, 1.1)
-    cr = css.hue_rotate(cr, -10)
-    cr = css.sepia(cr, 0.3)
-    cr = css.saturate(cr, 1.6)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["walden"], im, intensity=intensity)
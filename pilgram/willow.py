@@ -14,29 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def willow(im: Image.Image) -> Image.Image:
+def willow(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies Willow filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-
-    cs1 = util.radial_gradient(cb.size, [(212, 169, 175), (0, 0, 0)], [0.55, 1.5])
-    cm1 = css.blending.overlay(cb, cs1)
 
-    cs2 = util.fill(cb.size, (216, 205, 203))
-    cr = css.blending.color(cm1, cs2)
-
-    cr = css.grayscale(cr, 0.5)
-    cr = css.contrast(cr, 0.95)
-    cr = css.brightness(cr, 0.9)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["willow"], im, intensity=intensity)
@@ -14,34 +14,24 @@
 
 from PIL import Image
 
-from pilgram import css, util
+from pilgram.graph.execute import execute
+from pilgram.graph.specs import SPECS
 
 
-def xpro2(im: Image.Image) -> Image.Image:
+def xpro2(im: Image.Image, intensity: float = 1) -> Image.Image:
     """Applies X-pro II filter.
 
     Arguments:
         im: An input image.
+        intensity: An optional float between 0 and 1. The strength of
+            the filter, mixing the output with the input
+            (see `graph.execute`). Defaults to 1.
 
     Returns:
         The output image.
-    """
-
-    cb = util.or_convert(im, "RGB")
-
-    cs1 = util.fill(cb.size, (230, 231, 224))
-    cs2 = util.fill(cb.size, (43, 42, 161))
-    cs2 = Image.blend(cb, cs2, 0.6)
 
-    gradient_mask = util.radial_gradient_mask(cb.size, length=0.4, scale=1.1)
-    cs = Image.composite(cs1, cs2, gradient_mask)
-
-    # TODO: improve alpha blending
-    cm1 = css.blending.color_burn(cb, cs)
-    cm2 = cm1.copy()
-    cm2 = Image.blend(cb, cm2, 0.6)
-    cr = Image.composite(cm1, cm2, gradient_mask)
-
-    cr = css.sepia(cr, 0.3)
+    Raises:
+        AssertionError: if `intensity` is not between 0 and 1.
+    """
 
-    return cr
+    return execute(SPECS["xpro2"], im, intensity=intensity)